@@ -0,0 +1,33 @@
+"""
+Build Formation Cache
+Pre-generate all scene formations once and save them for later runs.
+"""
+
+import argparse
+
+from core.scene_controller import SceneController
+from core.formation_cache import FORMATION_CACHE_PATH, save_formation_cache
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Pre-generate drone show formations'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        default=FORMATION_CACHE_PATH,
+        help=f'Output .npz path (default: {FORMATION_CACHE_PATH})'
+    )
+    args = parser.parse_args()
+
+    # Formations do not depend on mode; skip any existing cache
+    scene_controller = SceneController(formation_cache_path=None)
+    save_formation_cache(scene_controller.scenes, args.output)
+
+    print(f"✓ Saved {len(scene_controller.scenes)} formations to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -3,8 +3,6 @@ Drone Show Configuration
 Contains all constants and parameters for the drone show simulation.
 """
 
-import numpy as np
-
 # ============================================================================
 # PERFORMANCE SPACE
 # ============================================================================
@@ -147,6 +145,9 @@ def rgb_to_normalized(rgb):
 def interpolate_color(color1, color2, t):
     """Linear interpolation between two RGB colors.
     
+    For many colors at once use core.drone_system.interpolate_colors,
+    which works on whole (N, 3) arrays.
+    
     Args:
         color1: RGB tuple (0-255)
         color2: RGB tuple (0-255)
@@ -155,5 +156,9 @@ def interpolate_color(color1, color2, t):
     Returns:
         Interpolated RGB tuple (0-255)
     """
-    return tuple(int(c1 + (c2 - c1) * t) for c1, c2 in zip(color1, color2))
+    r1, g1, b1 = color1
+    r2, g2, b2 = color2
+    return (int(r1 + (r2 - r1) * t),
+            int(g1 + (g2 - g1) * t),
+            int(b1 + (b2 - b1) * t))
 
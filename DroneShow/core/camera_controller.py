@@ -3,6 +3,9 @@ Camera Controller
 Manages orbiting camera position and view throughout the show.
 """
 
+import math
+from functools import lru_cache
+
 import numpy as np
 from config.drone_config import (
     CAMERA_FIXED, CAMERA_POSITION, CAMERA_TARGET,
@@ -39,30 +42,43 @@ class CameraController:
         self.initial_angle = initial_angle if initial_angle else CAMERA_INITIAL_ANGLE
         
         self.current_time = 0.0
-    
-    def get_position(self, time):
-        """
-        Get camera position at given time.
         
-        Args:
-            time: Current time in seconds
+        # Last computed results, reused when asked again for the same time
+        self._position_time = None
+        self._position = None
+        self._angles_time = None
+        self._angles = None
+        self._applied_view = None
         
-        Returns:
-            position: (x, y, z) tuple
-        """
-        # Check if camera is fixed or orbiting
+        # CAMERA_FIXED cannot change during a run, so get_position and
+        # get_view_angles are bound to the fixed or orbiting implementation
+        # once here instead of branching on every call. Both take the
+        # current time in seconds; get_position returns an (x, y, z) tuple
+        # and get_view_angles returns (elevation, azimuth) in degrees.
         if CAMERA_FIXED:
-            # Fixed camera position (2D audience view)
-            return CAMERA_POSITION
+            self._fixed_angles = self._view_angles_from(CAMERA_POSITION)
+            self.get_position = self._get_position_fixed
+            self.get_view_angles = self._get_view_angles_fixed
+        else:
+            self.get_position = self._get_position_orbit
+            self.get_view_angles = self._get_view_angles_orbit
+    
+    def _get_position_fixed(self, time):
+        """Fixed camera position (2D audience view)."""
+        return CAMERA_POSITION
+    
+    def _get_position_orbit(self, time):
+        """Orbiting camera position (legacy 3D mode)."""
+        if time == self._position_time:
+            return self._position
         
-        # Orbiting camera (legacy 3D mode)
         # Calculate angle based on time (continuous orbit)
         angle_deg = self.initial_angle + (time / self.orbit_period) * 360.0
-        angle_rad = np.deg2rad(angle_deg)
+        angle_rad = math.radians(angle_deg)
         
         # Calculate position on circular orbit
-        x = self.target[0] + self.radius * np.cos(angle_rad)
-        y = self.target[1] + self.radius * np.sin(angle_rad)
+        x = self.target[0] + self.radius * math.cos(angle_rad)
+        y = self.target[1] + self.radius * math.sin(angle_rad)
         
         # Vary height smoothly (could add more complex patterns)
         # Simple: average of min and max
@@ -72,32 +88,44 @@ class CameraController:
         # z = self.height_min + (self.height_max - self.height_min) * \
         #     (0.5 + 0.5 * np.sin(angle_rad))
         
-        return (x, y, z)
+        self._position_time = time
+        self._position = (x, y, z)
+        return self._position
+    
+    def _get_view_angles_fixed(self, time):
+        """View angles for the fixed camera (time-invariant)."""
+        return self._fixed_angles
+    
+    def _get_view_angles_orbit(self, time):
+        """View angles for the orbiting camera."""
+        if time == self._angles_time:
+            return self._angles
+        
+        self._angles_time = time
+        self._angles = self._view_angles_from(self._get_position_orbit(time))
+        return self._angles
     
-    def get_view_angles(self, time):
+    def _view_angles_from(self, position):
         """
-        Get camera elevation and azimuth angles at given time.
+        Calculate elevation and azimuth looking from position to the target.
         
         Args:
-            time: Current time in seconds
+            position: Camera (x, y, z) position
         
         Returns:
-            elevation: Elevation angle in degrees
-            azimuth: Azimuth angle in degrees
+            (elevation, azimuth) in degrees
         """
-        position = self.get_position(time)
-        
         # Calculate direction from camera to target
-        direction = self.target - np.array(position)
+        dx = self.target[0] - position[0]
+        dy = self.target[1] - position[1]
+        dz = self.target[2] - position[2]
         
         # Calculate azimuth (horizontal angle)
-        azimuth_rad = np.arctan2(direction[1], direction[0])
-        azimuth_deg = np.rad2deg(azimuth_rad)
+        azimuth_deg = math.degrees(math.atan2(dy, dx))
         
         # Calculate elevation (vertical angle)
-        horizontal_distance = np.sqrt(direction[0]**2 + direction[1]**2)
-        elevation_rad = np.arctan2(direction[2], horizontal_distance)
-        elevation_deg = np.rad2deg(elevation_rad)
+        horizontal_distance = math.sqrt(dx * dx + dy * dy)
+        elevation_deg = math.degrees(math.atan2(dz, horizontal_distance))
         
         return elevation_deg, azimuth_deg
     
@@ -105,20 +133,23 @@ class CameraController:
         """
         Apply camera position and viewing angles to matplotlib 3D axes.
         
+        Convenience wrapper for one-off use; render loops should call
+        setup_axes once and update_axes per frame.
+        
         Args:
             ax: matplotlib 3D axes
             time: Current time in seconds
         """
-        position = self.get_position(time)
-        elevation, azimuth = self.get_view_angles(time)
-        
-        # Set view
-        ax.view_init(elev=elevation, azim=azimuth)
-        
-        # Calculate distance for consistent framing
-        # Distance from camera to target
-        distance = self.radius
+        self.setup_axes(ax)
+        self.update_axes(ax, time)
+    
+    def setup_axes(self, ax):
+        """
+        Apply the time-invariant axis limits. Call once before rendering.
         
+        Args:
+            ax: matplotlib 3D axes
+        """
         # Set limits centered on target
         # The actual limits depend on the field of view and distance
         # For simplicity, we'll use fixed limits that show the performance space
@@ -126,6 +157,26 @@ class CameraController:
         ax.set_ylim(self.target[1] - 60, self.target[1] + 60)
         ax.set_zlim(0, 30)
     
+    def update_axes(self, ax, time):
+        """
+        Apply the viewing angles for the given time.
+        
+        Skips view_init when the angles have not changed since the last
+        call on the same axes (always the case for the fixed camera).
+        
+        Args:
+            ax: matplotlib 3D axes
+            time: Current time in seconds
+        """
+        elevation, azimuth = self.get_view_angles(time)
+        view = (ax, elevation, azimuth)
+        if view == self._applied_view:
+            return
+        
+        # Set view
+        ax.view_init(elev=elevation, azim=azimuth)
+        self._applied_view = view
+    
     def get_camera_info(self, time):
         """
         Get detailed camera information at given time.
@@ -166,6 +217,7 @@ class CameraController:
         }
 
 
+@lru_cache(maxsize=128)
 def calculate_optimal_camera_distance(formation_size, fov=60):
     """
     Calculate optimal camera distance to frame a formation.
@@ -177,9 +229,9 @@ def calculate_optimal_camera_distance(formation_size, fov=60):
     Returns:
         distance: Optimal distance in meters
     """
-    # Simple calculation based on FOV
-    fov_rad = np.deg2rad(fov)
-    distance = (formation_size / 2.0) / np.tan(fov_rad / 2.0)
+    # Simple calculation based on FOV (results cached per size/FOV pair)
+    fov_rad = math.radians(fov)
+    distance = (formation_size / 2.0) / math.tan(fov_rad / 2.0)
     
     # Add margin
     return distance * 1.5
@@ -3,18 +3,99 @@ Drone System Management
 Handles individual drone physics, state tracking, and movement simulation.
 """
 
+import math
 import numpy as np
+from scipy.spatial import cKDTree
 from config.drone_config import (
     TOTAL_DRONES, MAX_SPEED, ACCELERATION, DECELERATION,
     MIN_SEPARATION, POSITION_DRIFT
 )
 
+_INV_255 = np.float32(1.0 / 255.0)
+_MIN_SEP_SQ = MIN_SEPARATION ** 2
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _update_kernel(positions, velocities, targets, settled, drift, dt,
+                       max_speed, acceleration):
+        """
+        Fused physics step for all drones (same rules as Drone.update_physics).
+        
+        Updates positions and velocities in place, one drone per loop
+        iteration, without allocating any temporary arrays. Settled drones
+        are skipped; drones that reach their target are marked settled.
+        """
+        max_velocity_change = acceleration * dt
+        for i in prange(positions.shape[0]):
+            if settled[i]:
+                continue
+            
+            dx = targets[i, 0] - positions[i, 0]
+            dy = targets[i, 1] - positions[i, 1]
+            dz = targets[i, 2] - positions[i, 2]
+            distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+            
+            if distance < 0.01:  # Already at target
+                velocities[i, 0] = 0.0
+                velocities[i, 1] = 0.0
+                velocities[i, 2] = 0.0
+                settled[i] = True
+                continue
+            
+            # Desired velocity towards target
+            scale = min(max_speed, distance / dt) / distance
+            cx = dx * scale - velocities[i, 0]
+            cy = dy * scale - velocities[i, 1]
+            cz = dz * scale - velocities[i, 2]
+            
+            # Clamp velocity change (acceleration)
+            change = math.sqrt(cx * cx + cy * cy + cz * cz)
+            if change > max_velocity_change:
+                factor = max_velocity_change / change
+                cx *= factor
+                cy *= factor
+                cz *= factor
+            
+            vx = velocities[i, 0] + cx
+            vy = velocities[i, 1] + cy
+            vz = velocities[i, 2] + cz
+            
+            # Limit to max speed
+            speed = math.sqrt(vx * vx + vy * vy + vz * vz)
+            if speed > max_speed:
+                factor = max_speed / speed
+                vx *= factor
+                vy *= factor
+                vz *= factor
+            
+            velocities[i, 0] = vx
+            velocities[i, 1] = vy
+            velocities[i, 2] = vz
+            positions[i, 0] += vx * dt + drift[i, 0]
+            positions[i, 1] += vy * dt + drift[i, 1]
+            positions[i, 2] += vz * dt + drift[i, 2]
+else:
+    _update_kernel = None
+
 
 class Drone:
     """
     Represents a single drone with physics simulation.
     """
     
+    __slots__ = ('id', 'position', 'velocity', 'target_position', 'color', 'light_on')
+    
     def __init__(self, drone_id, initial_position=(0, 0, 0)):
         """
         Initialize a drone.
@@ -24,10 +105,10 @@ class Drone:
             initial_position: Starting (x, y, z) position
         """
         self.id = drone_id
-        self.position = np.array(initial_position, dtype=float)
-        self.velocity = np.zeros(3, dtype=float)
-        self.target_position = np.array(initial_position, dtype=float)
-        self.color = np.array([0, 0, 0], dtype=int)  # RGB 0-255
+        self.position = np.array(initial_position, dtype=np.float32)
+        self.velocity = np.zeros(3, dtype=np.float32)
+        self.target_position = np.array(initial_position, dtype=np.float32)
+        self.color = np.array([0, 0, 0], dtype=np.uint8)  # RGB 0-255
         self.light_on = False
         
     def set_target(self, target_position, target_color, light_on=True):
@@ -39,8 +120,8 @@ class Drone:
             target_color: RGB tuple (0-255)
             light_on: Whether light should be on
         """
-        self.target_position = np.array(target_position, dtype=float)
-        self.color = np.array(target_color, dtype=int)
+        self.target_position = np.array(target_position, dtype=np.float32)
+        self.color = np.array(target_color, dtype=np.uint8)
         self.light_on = light_on
     
     def update_physics(self, dt):
@@ -52,10 +133,11 @@ class Drone:
         """
         # Calculate direction to target
         direction = self.target_position - self.position
-        distance = np.linalg.norm(direction)
+        dx, dy, dz = direction
+        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
         
         if distance < 0.01:  # Already at target
-            self.velocity = np.zeros(3)
+            self.velocity = np.zeros(3, dtype=np.float32)
             return
         
         # Normalize direction
@@ -69,14 +151,17 @@ class Drone:
         velocity_change = desired_velocity - self.velocity
         max_velocity_change = ACCELERATION * dt
         
-        if np.linalg.norm(velocity_change) > max_velocity_change:
-            velocity_change = velocity_change / np.linalg.norm(velocity_change) * max_velocity_change
+        cx, cy, cz = velocity_change
+        change_norm = math.sqrt(cx * cx + cy * cy + cz * cz)
+        if change_norm > max_velocity_change:
+            velocity_change = velocity_change / change_norm * max_velocity_change
         
         # Update velocity
         self.velocity += velocity_change
         
         # Limit to max speed
-        speed = np.linalg.norm(self.velocity)
+        vx, vy, vz = self.velocity
+        speed = math.sqrt(vx * vx + vy * vy + vz * vz)
         if speed > MAX_SPEED:
             self.velocity = self.velocity / speed * MAX_SPEED
         
@@ -104,22 +189,152 @@ class Drone:
         }
 
 
+class DroneView:
+    """
+    Lightweight view of a single drone stored inside a DroneSystem.
+    
+    Attribute reads and writes go straight to the system's per-drone arrays,
+    so code written against the old list of Drone objects keeps working.
+    """
+    
+    __slots__ = ('_system', 'id')
+    
+    def __init__(self, system, index):
+        """
+        Initialize a drone view.
+        
+        Args:
+            system: DroneSystem that owns the drone state
+            index: Row of this drone in the system arrays
+        """
+        self._system = system
+        self.id = index
+    
+    @property
+    def position(self):
+        return self._system.positions[self.id]
+    
+    @position.setter
+    def position(self, value):
+        self._system.positions[self.id] = value
+        self._system.wake(self.id)
+    
+    @property
+    def velocity(self):
+        return self._system.velocities[self.id]
+    
+    @velocity.setter
+    def velocity(self, value):
+        self._system.velocities[self.id] = value
+        self._system.wake(self.id)
+    
+    @property
+    def target_position(self):
+        return self._system.targets[self.id]
+    
+    @target_position.setter
+    def target_position(self, value):
+        self._system.targets[self.id] = value
+        self._system.wake(self.id)
+    
+    @property
+    def color(self):
+        return self._system.colors[self.id]
+    
+    @color.setter
+    def color(self, value):
+        self._system.colors[self.id] = value
+    
+    @property
+    def light_on(self):
+        return bool(self._system.lights_on[self.id])
+    
+    @light_on.setter
+    def light_on(self, value):
+        self._system.lights_on[self.id] = value
+    
+    def set_target(self, target_position, target_color, light_on=True):
+        """
+        Set new target position and appearance.
+        
+        Args:
+            target_position: Desired (x, y, z) position
+            target_color: RGB tuple (0-255)
+            light_on: Whether light should be on
+        """
+        self.target_position = target_position
+        self.color = target_color
+        self.light_on = light_on
+    
+    def get_state(self):
+        """
+        Get current drone state.
+        
+        Returns:
+            dict with position, velocity, color, light_on
+        """
+        return {
+            'id': self.id,
+            'position': self.position.copy(),
+            'velocity': self.velocity.copy(),
+            'color': self.color.copy(),
+            'light_on': self.light_on
+        }
+
+
 class DroneSystem:
     """
     Manages the entire swarm of drones.
+    
+    Drone state is stored as one array per attribute (positions, velocities,
+    targets, colors, lights_on) so the physics step runs as a few whole-array
+    operations instead of a Python loop over drones. Positions and
+    velocities are float32 (ample for a 100 m space) and colors are uint8.
     """
     
-    def __init__(self, num_drones=TOTAL_DRONES):
+    def __init__(self, num_drones=TOTAL_DRONES, seed=None):
         """
         Initialize the drone system.
         
         Args:
             num_drones: Total number of drones to manage
+            seed: Seed for the position drift random generator
         """
         self.num_drones = num_drones
-        self.drones = [Drone(i, (0, 0, 0)) for i in range(num_drones)]
+        self.positions = np.zeros((num_drones, 3), dtype=np.float32)
+        self.velocities = np.zeros((num_drones, 3), dtype=np.float32)
+        self.targets = np.zeros((num_drones, 3), dtype=np.float32)
+        self.colors = np.zeros((num_drones, 3), dtype=np.uint8)  # RGB 0-255
+        self.lights_on = np.zeros(num_drones, dtype=bool)
+        self._colors_normalized = np.zeros((num_drones, 3), dtype=np.float32)
+        
+        # Incoming targets, converted to float32 before comparing with the
+        # current ones (see set_formation)
+        self._new_targets = np.empty((num_drones, 3), dtype=np.float32)
+        
+        # Scratch buffers reused by every physics step
+        self._direction = np.empty((num_drones, 3), dtype=np.float32)
+        self._change = np.empty((num_drones, 3), dtype=np.float32)
+        self._drift = np.zeros((num_drones, 3), dtype=np.float32)
+        self._distance = np.empty(num_drones, dtype=np.float32)
+        self._scale = np.empty(num_drones, dtype=np.float32)
+        self._moving = np.empty(num_drones, dtype=bool)
+        self._rng = np.random.default_rng(seed)
+        
+        # Drones parked at their target with zero velocity; the physics step
+        # skips them until their target changes
+        self._settled = np.zeros(num_drones, dtype=bool)
+        self._active = None  # Cached indices of unsettled drones
+        self.drones = [DroneView(self, i) for i in range(num_drones)]
         self.current_time = 0.0
     
+    def __getitem__(self, index):
+        """Return a view of the drone at the given index."""
+        return self.drones[index]
+    
+    def __len__(self):
+        return self.num_drones
+    
     def set_formation(self, positions, colors, lights_on=None):
         """
         Set target formation for all drones.
@@ -136,39 +351,206 @@ class DroneSystem:
             # Default: lights on if color is not black
             lights_on = np.any(colors > 0, axis=1)
         
+        # Drones whose target moved need simulating again
+        new_targets = self._new_targets[:num_active]
+        np.copyto(new_targets, positions[:num_active])
+        changed = np.any(self.targets[:num_active] != new_targets, axis=1)
+        if changed.any():
+            self._settled[:num_active] &= ~changed
+            self._active = None
+        
         # Set targets for active drones
-        for i in range(num_active):
-            self.drones[i].set_target(
-                positions[i],
-                colors[i],
-                lights_on[i] if i < len(lights_on) else True
-            )
+        self.targets[:num_active] = new_targets
+        self.colors[:num_active] = colors[:num_active]
+        num_given = min(len(lights_on), num_active)
+        self.lights_on[:num_given] = lights_on[:num_given]
+        self.lights_on[num_given:num_active] = True
         
         # Remaining drones turn off lights and stay in place
-        for i in range(num_active, self.num_drones):
-            self.drones[i].light_on = False
-            self.drones[i].color = np.array([0, 0, 0])
+        self.lights_on[num_active:] = False
+        self.colors[num_active:] = 0
+    
+    def set_state_bulk(self, positions, colors, lights_on=None):
+        """
+        Overwrite the current position and color of the leading drones.
+        
+        Unlike set_formation, this moves the drones directly instead of
+        setting targets (e.g. when replaying recorded frames).
+        
+        Args:
+            positions: numpy array of shape (N, 3) with current positions
+            colors: numpy array of shape (N, 3) with RGB colors (0-255)
+            lights_on: numpy array of shape (N,) with boolean light states
+                       If None, lights on for non-zero colors
+        """
+        n = min(len(positions), self.num_drones)
+        colors = np.asarray(colors)[:n]
+        
+        if lights_on is None:
+            lights_on = np.any(colors > 0, axis=1)
+        
+        self.positions[:n] = positions[:n]
+        self.colors[:n] = colors
+        self.lights_on[:n] = lights_on[:n]
+        self.wake(slice(0, n))
+    
+    def wake(self, index=None):
+        """
+        Mark drones as needing simulation after their state was edited directly.
+        
+        Args:
+            index: Drone index (or index array); None wakes every drone
+        """
+        if index is None:
+            self._settled[:] = False
+        else:
+            self._settled[index] = False
+        self._active = None
     
     def update(self, dt):
         """
         Update all drones' physics.
         
+        Uses the compiled numba kernel when numba is installed, otherwise
+        falls back to the vectorized NumPy implementation. Drones that are
+        settled at their target are skipped, and the whole step is a no-op
+        when every drone is settled (e.g. parked during blackouts).
+        
         Args:
             dt: Time delta in seconds
         """
-        for drone in self.drones:
-            drone.update_physics(dt)
-        
         self.current_time += dt
+        
+        if _update_kernel is not None:
+            if self._settled.all():
+                return
+            if POSITION_DRIFT > 0:
+                self._draw_drift(self.num_drones)
+            _update_kernel(self.positions, self.velocities, self.targets,
+                           self._settled, self._drift, dt,
+                           MAX_SPEED, ACCELERATION)
+            self._active = None
+        else:
+            if self._active is None:
+                self._active = np.flatnonzero(~self._settled)
+            if len(self._active) > 0:
+                self._update_numpy(dt)
+    
+    def _update_numpy(self, dt):
+        """
+        Vectorized NumPy physics step used when numba is unavailable.
+        
+        Intermediates are written into the scratch buffers allocated in
+        __init__. When some drones are settled, only the active rows are
+        gathered, simulated and scattered back.
+        
+        Args:
+            dt: Time delta in seconds
+        """
+        active = self._active
+        n = len(active)
+        subset = n < self.num_drones
+        if subset:
+            positions = self.positions[active]
+            velocities = self.velocities[active]
+            targets = self.targets[active]
+        else:
+            positions = self.positions
+            velocities = self.velocities
+            targets = self.targets
+        
+        direction = self._direction[:n]
+        distance = self._distance[:n]
+        scale = self._scale[:n]
+        change = self._change[:n]
+        moving = self._moving[:n]
+        
+        # Calculate direction to target
+        np.subtract(targets, positions, out=direction)
+        np.einsum('ij,ij->i', direction, direction, out=distance)
+        np.sqrt(distance, out=distance)
+        
+        # Drones already at target stop (velocity is zeroed below)
+        np.greater_equal(distance, 0.01, out=moving)
+        
+        # Calculate desired velocity: direction * min(MAX_SPEED, d/dt) / d
+        np.divide(distance, dt, out=scale)
+        np.minimum(scale, MAX_SPEED, out=scale)
+        np.maximum(distance, 1e-12, out=distance)
+        np.divide(scale, distance, out=scale)
+        np.multiply(direction, scale[:, None], out=change)
+        
+        # Calculate velocity change (acceleration), clamped per drone
+        np.subtract(change, velocities, out=change)
+        max_velocity_change = ACCELERATION * dt
+        self._clamp_rows(change, max_velocity_change)
+        
+        # Update velocity and limit to max speed
+        np.add(velocities, change, out=velocities)
+        self._clamp_rows(velocities, MAX_SPEED)
+        np.multiply(velocities, moving[:, None], out=velocities)
+        
+        # Update position (stopped drones have zero velocity)
+        np.multiply(velocities, dt, out=change)
+        np.add(positions, change, out=positions)
+        
+        # Add position drift for realism
+        if POSITION_DRIFT > 0:
+            drift = self._draw_drift(n)
+            np.multiply(drift, moving[:, None], out=drift)
+            np.add(positions, drift, out=positions)
+        
+        if subset:
+            self.positions[active] = positions
+            self.velocities[active] = velocities
+        
+        # Drones that reached their target stay put until it changes
+        if not moving.all():
+            self._settled[active[~moving]] = True
+            self._active = None
+    
+    def _draw_drift(self, n):
+        """
+        Fill the first n rows of the drift buffer with uniform noise.
+        
+        Args:
+            n: Number of rows to fill
+        
+        Returns:
+            The filled (n, 3) slice, values in [-POSITION_DRIFT, POSITION_DRIFT)
+        """
+        drift = self._drift[:n]
+        self._rng.random(out=drift, dtype=np.float32)
+        drift *= 2.0 * POSITION_DRIFT
+        drift -= POSITION_DRIFT
+        return drift
+    
+    def _clamp_rows(self, vectors, max_norm):
+        """
+        Scale rows of an (n, 3) array in place so no row exceeds max_norm.
+        
+        Args:
+            vectors: numpy array of shape (n, 3), modified in place
+            max_norm: Maximum allowed row length
+        """
+        norm = self._scale[:len(vectors)]
+        np.einsum('ij,ij->i', vectors, vectors, out=norm)
+        np.sqrt(norm, out=norm)
+        np.maximum(norm, max_norm, out=norm)
+        np.divide(max_norm, norm, out=norm)
+        np.multiply(vectors, norm[:, None], out=vectors)
     
     def get_positions(self):
         """
         Get current positions of all drones.
         
         Returns:
-            numpy array of shape (num_drones, 3)
+            Read-only view of shape (num_drones, 3) that tracks the live state;
+            copy it if a snapshot is needed
         """
-        return np.array([drone.position for drone in self.drones])
+        positions = self.positions.view()
+        positions.flags.writeable = False
+        return positions
     
     def get_colors(self):
         """
@@ -177,18 +559,20 @@ class DroneSystem:
         Returns:
             numpy array of shape (num_drones, 3) with RGB values (0-255)
         """
-        return np.array([drone.color if drone.light_on else [0, 0, 0] 
-                        for drone in self.drones])
+        return np.where(self.lights_on[:, None], self.colors, 0)
     
     def get_colors_normalized(self):
         """
         Get current colors normalized to 0-1 range.
         
         Returns:
-            numpy array of shape (num_drones, 3) with RGB values (0-1)
+            numpy array of shape (num_drones, 3) with RGB values (0-1).
+            The buffer is reused on the next call.
         """
-        colors = self.get_colors()
-        return colors / 255.0
+        np.multiply(self.colors, self.lights_on[:, None],
+                    out=self._colors_normalized)
+        self._colors_normalized *= _INV_255
+        return self._colors_normalized
     
     def get_all_states(self):
         """
@@ -206,16 +590,24 @@ class DroneSystem:
         Returns:
             list of tuples (drone_id1, drone_id2, distance) for colliding pairs
         """
-        collisions = []
         positions = self.get_positions()
         
-        for i in range(self.num_drones):
-            for j in range(i + 1, self.num_drones):
-                distance = np.linalg.norm(positions[i] - positions[j])
-                if distance < MIN_SEPARATION:
-                    collisions.append((i, j, distance))
+        # KD-tree finds only the close pairs instead of testing all N² pairs
+        pairs = cKDTree(positions).query_pairs(MIN_SEPARATION, output_type='ndarray')
+        if len(pairs) == 0:
+            return []
         
-        return collisions
+        # Keep the original (i, j) ordering and strict < MIN_SEPARATION test
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        diff = positions[pairs[:, 0]] - positions[pairs[:, 1]]
+        dist_sq = np.einsum('ij,ij->i', diff, diff)
+        close = dist_sq < _MIN_SEP_SQ
+        
+        # Square roots only for the pairs that are reported
+        return [
+            (int(i), int(j), float(d))
+            for i, j, d in zip(pairs[close, 0], pairs[close, 1], np.sqrt(dist_sq[close]))
+        ]
     
     def apply_ease_curve(self, t, curve_type='ease_in_out'):
         """
@@ -259,15 +651,34 @@ def ease_in_out(t):
         return 1 - 2 * (1 - t) ** 2
 
 
-def interpolate_positions(start_positions, end_positions, t, ease=True):
+def ease_in_out_array(t):
+    """
+    Vectorized ease_in_out for an array of time parameters.
+    
+    Args:
+        t: numpy array of time parameters (0-1)
+    
+    Returns:
+        numpy array of smoothed values (0-1)
+    """
+    t = np.asarray(t)
+    return np.where(t < 0.5, 2 * t * t, 1 - 2 * (1 - t) ** 2)
+
+
+def interpolate_positions(start_positions, end_positions, t, ease=True, out=None):
     """
     Interpolate between two sets of positions.
     
+    The lerp is fused into a single pass with numexpr when it is installed;
+    otherwise it is computed in place in the output array. Either way t is
+    taken at the precision of the inputs, so float32 positions stay float32.
+    
     Args:
         start_positions: numpy array of shape (N, 3)
         end_positions: numpy array of shape (N, 3)
         t: Interpolation factor (0-1)
         ease: Whether to apply easing curve
+        out: Optional preallocated array of shape (N, 3) for the result
     
     Returns:
         Interpolated positions array
@@ -275,7 +686,21 @@ def interpolate_positions(start_positions, end_positions, t, ease=True):
     if ease:
         t = ease_in_out(t)
     
-    return start_positions + t * (end_positions - start_positions)
+    # A Python float t would promote float32 inputs to float64
+    dtype = np.result_type(start_positions, end_positions, np.float32)
+    t = dtype.type(t)
+    
+    if numexpr is not None:
+        return numexpr.evaluate(
+            's + t * (e - s)',
+            local_dict={'s': start_positions, 'e': end_positions, 't': t},
+            out=out
+        )
+    
+    result = np.subtract(end_positions, start_positions, out=out, dtype=dtype)
+    result *= t
+    result += start_positions
+    return result
 
 
 def interpolate_colors(start_colors, end_colors, t, ease=True):
@@ -294,6 +719,9 @@ def interpolate_colors(start_colors, end_colors, t, ease=True):
     if ease:
         t = ease_in_out(t)
     
+    # Subtract in float: uint8 colors would wrap around
+    start_colors = np.asarray(start_colors, dtype=np.float32)
+    end_colors = np.asarray(end_colors, dtype=np.float32)
     interpolated = start_colors + t * (end_colors - start_colors)
-    return np.round(interpolated).astype(int)
+    return np.clip(np.round(interpolated), 0, 255).astype(int)
 
@@ -0,0 +1,83 @@
+"""
+Formation Cache
+Pre-bakes scene formations to disk so they are not regenerated on every run.
+"""
+
+import hashlib
+import os
+import numpy as np
+
+DRONESHOW_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORMATION_CACHE_PATH = os.path.join(DRONESHOW_DIR, 'outputs', 'formations_cache.npz')
+
+# Formations depend only on these files (scene_controller.py holds the
+# per-scene generator arguments); any edit invalidates the cache
+SOURCE_FILES = (
+    os.path.join(DRONESHOW_DIR, 'config', 'drone_config.py'),
+    os.path.join(DRONESHOW_DIR, 'core', 'scene_controller.py'),
+    os.path.join(DRONESHOW_DIR, 'core', 'shape_generators.py'),
+)
+
+
+def compute_source_hash():
+    """
+    Hash the source files that formations are generated from.
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    for path in SOURCE_FILES:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def save_formation_cache(scenes, path=FORMATION_CACHE_PATH):
+    """
+    Generate every scene formation and write them to an .npz file.
+
+    Args:
+        scenes: Iterable of Scene objects
+        path: Output .npz path
+    """
+    arrays = {'source_hash': np.array(compute_source_hash())}
+    for scene in scenes:
+        positions, colors = scene.generate_formation()
+        arrays[f'{scene.name}_positions'] = positions
+        arrays[f'{scene.name}_colors'] = colors
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.savez(path, **arrays)
+
+
+def load_formation_cache(path=FORMATION_CACHE_PATH):
+    """
+    Load pre-baked formations if the cache exists and is up to date.
+
+    Args:
+        path: Path to the .npz file written by save_formation_cache
+
+    Returns:
+        dict mapping scene name -> (positions, colors) read-only arrays;
+        empty if the cache is missing or stale
+    """
+    if path is None or not os.path.exists(path):
+        return {}
+
+    with np.load(path) as data:
+        if str(data['source_hash']) != compute_source_hash():
+            return {}
+
+        formations = {}
+        for key in data.files:
+            if not key.endswith('_positions'):
+                continue
+            name = key[:-len('_positions')]
+            positions = data[key]
+            colors = data[f'{name}_colors']
+            positions.flags.writeable = False
+            colors.flags.writeable = False
+            formations[name] = (positions, colors)
+
+    return formations
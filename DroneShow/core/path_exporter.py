@@ -7,8 +7,49 @@ import json
 import csv
 import numpy as np
 from datetime import datetime
+from scipy.spatial import cKDTree
 from config.drone_config import EXPORT_TIME_INTERVAL, MIN_SEPARATION
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+_MIN_SEP_SQ = MIN_SEPARATION ** 2
+
+# Collisions kept in detail for validation errors; the rest are only counted
+MAX_REPORTED_COLLISIONS = 100
+
+# One exported CSV row (one drone at one sampled frame), packed to 28 bytes
+FRAME_DTYPE = np.dtype([
+    ('drone_id', '<i4'), ('timestamp', '<f8'),
+    ('x', '<f4'), ('y', '<f4'), ('z', '<f4'),
+    ('r', 'u1'), ('g', 'u1'), ('b', 'u1'), ('light_on', 'u1')
+])
+
+
+def _dumps(obj):
+    """
+    Serialize an object to indented JSON bytes.
+    
+    Uses orjson, which formats numbers in C, when it is installed.
+    
+    Args:
+        obj: JSON-serializable object
+        
+    Returns:
+        UTF-8 encoded JSON with 2-space indentation
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
 
 class PathExporter:
     """
@@ -25,8 +66,81 @@ class PathExporter:
         """
         self.drone_system = drone_system
         self.fps = fps
-        self.recorded_states = []
         
+        # Recorded frames, one array per attribute; the first num_frames
+        # entries are valid and capacity grows by doubling
+        num_drones = drone_system.num_drones
+        self.num_frames = 0
+        self.timestamps = np.empty(0, dtype=float)
+        self.positions = np.empty((0, num_drones, 3), dtype=np.float32)
+        self.colors = np.empty((0, num_drones, 3), dtype=np.uint8)
+        self.lights_on = np.empty((0, num_drones), dtype=bool)
+        self.collision_counts = np.empty(0, dtype=np.int64)
+        
+        # Separation checks run as frames are recorded, so validation never
+        # rescans the history. Every frame's collision count is kept, but
+        # only the first MAX_REPORTED_COLLISIONS pairs, as (frame, pairs,
+        # distances) arrays: drones starting together collide by the million
+        self._min_sep_sq = float('inf')
+        self._collision_sample = []
+        self._num_sampled = 0
+        self._validation = None
+    
+    def _grow(self):
+        """Double the frame capacity of the recording buffers."""
+        capacity = max(64, 2 * len(self.timestamps))
+        
+        def grown(array):
+            new = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+            new[:self.num_frames] = array[:self.num_frames]
+            return new
+        
+        self.timestamps = grown(self.timestamps)
+        self.positions = grown(self.positions)
+        self.colors = grown(self.colors)
+        self.lights_on = grown(self.lights_on)
+        self.collision_counts = grown(self.collision_counts)
+    
+    def _sampled_frames(self):
+        """
+        Recorded frames at the export interval, as zero-copy strided views.
+        
+        Returns:
+            timestamps, positions, colors, lights (lights viewed as uint8
+            so they serialize as 0/1)
+        """
+        step = max(1, int(EXPORT_TIME_INTERVAL * self.fps))
+        frames = slice(0, self.num_frames, step)
+        return (
+            self.timestamps[frames],
+            self.positions[frames],
+            self.colors[frames],
+            self.lights_on[frames].view(np.uint8)
+        )
+    
+    def _sampled_records(self):
+        """
+        Sampled frames flattened into one FRAME_DTYPE row per (frame, drone).
+        
+        Each field is filled with a single vectorized assignment, so the
+        table can be handed to a writer without per-value Python work.
+        
+        Returns:
+            Structured array of shape (num_samples * num_drones,)
+        """
+        timestamps, positions, colors, lights = self._sampled_frames()
+        num_drones = self.drone_system.num_drones
+        
+        records = np.empty((len(timestamps), num_drones), dtype=FRAME_DTYPE)
+        records['drone_id'] = np.arange(num_drones)
+        records['timestamp'] = timestamps[:, None]
+        for axis, name in enumerate('xyz'):
+            records[name] = positions[..., axis]
+        for channel, name in enumerate('rgb'):
+            records[name] = colors[..., channel]
+        records['light_on'] = lights
+        return records.ravel()
+    
     def record_frame(self, timestamp):
         """
         Record current state of all drones at given timestamp.
@@ -34,27 +148,53 @@ class PathExporter:
         Args:
             timestamp: Current time in seconds
         """
-        states = self.drone_system.get_all_states()
+        if self.num_frames == len(self.timestamps):
+            self._grow()
         
-        frame_data = {
-            'timestamp': timestamp,
-            'drones': []
-        }
+        frame = self.num_frames
+        self.timestamps[frame] = timestamp
+        self.positions[frame] = self.drone_system.get_positions()
+        self.colors[frame] = self.drone_system.colors
+        self.lights_on[frame] = self.drone_system.lights_on
+        self.collision_counts[frame] = 0
+        self.num_frames += 1
         
-        for state in states:
-            drone_data = {
-                'id': state['id'],
-                'x': float(state['position'][0]),
-                'y': float(state['position'][1]),
-                'z': float(state['position'][2]),
-                'r': int(state['color'][0]),
-                'g': int(state['color'][1]),
-                'b': int(state['color'][2]),
-                'light_on': bool(state['light_on'])
-            }
-            frame_data['drones'].append(drone_data)
+        self._check_separation(frame)
+    
+    def _check_separation(self, frame_idx):
+        """
+        Update the running minimum separation and collision counts with one frame.
+        
+        Args:
+            frame_idx: Index of a recorded frame
+        """
+        positions = self.positions[frame_idx].astype(float)
+        if len(positions) < 2:
+            return
+        
+        # KD-tree finds only the close pairs instead of testing all N² pairs;
+        # the nearest neighbour other than itself gives each drone's clearance
+        tree = cKDTree(positions)
+        nearest, _ = tree.query(positions, k=2)
+        self._min_sep_sq = min(self._min_sep_sq, float(nearest[:, 1].min()) ** 2)
+        self._validation = None
+        
+        pairs = tree.query_pairs(MIN_SEPARATION, output_type='ndarray')
+        if len(pairs) == 0:
+            return
         
-        self.recorded_states.append(frame_data)
+        # Keep the (i, j) ordering and strict < MIN_SEPARATION test
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        diff = positions[pairs[:, 0]] - positions[pairs[:, 1]]
+        dist_sq = np.einsum('ij,ij->i', diff, diff)
+        close = dist_sq < _MIN_SEP_SQ
+        self.collision_counts[frame_idx] = np.count_nonzero(close)
+        
+        room = MAX_REPORTED_COLLISIONS - self._num_sampled
+        if room > 0 and self.collision_counts[frame_idx]:
+            kept = np.flatnonzero(close)[:room]
+            self._collision_sample.append((frame_idx, pairs[kept], np.sqrt(dist_sq[kept])))
+            self._num_sampled += len(kept)
     
     def validate_paths(self):
         """
@@ -63,41 +203,35 @@ class PathExporter:
         Returns:
             dict with validation results
         """
+        # Results only change when frames are recorded
+        if self._validation is not None:
+            return self._validation
+        
+        collision_count = int(self.collision_counts[:self.num_frames].sum())
+        errors = [
+            f"Frame {frame_idx} (t={self.timestamps[frame_idx]:.2f}s): "
+            f"Drones {i} and {j} too close ({distance:.2f}m)"
+            for frame_idx, pairs, distances in self._collision_sample
+            for (i, j), distance in zip(pairs.tolist(), distances.tolist())
+        ]
+        if collision_count > len(errors):
+            errors.append(f"... and {collision_count - len(errors)} more")
+        
         validation = {
             'valid': True,
-            'errors': [],
+            'errors': errors,
             'warnings': [],
-            'collision_count': 0,
-            'min_separation': float('inf')
+            'collision_count': collision_count,
+            'min_separation': float(np.sqrt(self._min_sep_sq))
         }
         
-        # Check each frame for collisions
-        for frame_idx, frame in enumerate(self.recorded_states):
-            positions = np.array([[d['x'], d['y'], d['z']] 
-                                 for d in frame['drones']])
-            
-            # Check all pairs
-            num_drones = len(positions)
-            for i in range(num_drones):
-                for j in range(i + 1, num_drones):
-                    distance = np.linalg.norm(positions[i] - positions[j])
-                    validation['min_separation'] = min(
-                        validation['min_separation'], distance
-                    )
-                    
-                    if distance < MIN_SEPARATION:
-                        validation['collision_count'] += 1
-                        validation['errors'].append(
-                            f"Frame {frame_idx} (t={frame['timestamp']:.2f}s): "
-                            f"Drones {i} and {j} too close ({distance:.2f}m)"
-                        )
-        
         if validation['collision_count'] > 0:
             validation['valid'] = False
         
         # Check speed limits
         # (simplified check - would need more detailed implementation)
         
+        self._validation = validation
         return validation
     
     def export_json(self, output_path, include_metadata=True):
@@ -109,22 +243,22 @@ class PathExporter:
             include_metadata: Whether to include metadata
         """
         # Sample at specified interval
-        interval_frames = int(EXPORT_TIME_INTERVAL * self.fps)
-        sampled_states = self.recorded_states[::interval_frames]
+        timestamps, positions, colors, lights = self._sampled_frames()
+        timestamps = timestamps.tolist()
+        num_samples = len(timestamps)
         
-        # Build export data structure
-        export_data = {}
+        metadata = {}
         
         if include_metadata:
             validation = self.validate_paths()
             
-            export_data['metadata'] = {
+            metadata = {
                 'generated_at': datetime.now().isoformat(),
                 'total_drones': self.drone_system.num_drones,
-                'duration': self.recorded_states[-1]['timestamp'] if self.recorded_states else 0.0,
+                'duration': float(self.timestamps[self.num_frames - 1]) if self.num_frames else 0.0,
                 'fps': self.fps,
                 'export_interval': EXPORT_TIME_INTERVAL,
-                'num_frames': len(sampled_states),
+                'num_frames': num_samples,
                 'validation': {
                     'valid': validation['valid'],
                     'min_separation': validation['min_separation'],
@@ -132,38 +266,39 @@ class PathExporter:
                 }
             }
         
-        # Organize by drone
-        drones_data = {}
-        for frame in sampled_states:
-            for drone in frame['drones']:
-                drone_id = drone['id']
-                if drone_id not in drones_data:
-                    drones_data[drone_id] = []
-                
-                drones_data[drone_id].append({
-                    't': frame['timestamp'],
-                    'x': drone['x'],
-                    'y': drone['y'],
-                    'z': drone['z'],
-                    'r': drone['r'],
-                    'g': drone['g'],
-                    'b': drone['b'],
-                    'light': 1 if drone['light_on'] else 0
-                })
-        
-        export_data['drones'] = [
-            {'id': drone_id, 'path': path}
-            for drone_id, path in sorted(drones_data.items())
-        ]
+        # Stream the document one drone at a time so only a single drone's
+        # path is ever held as Python objects; nested blocks are re-indented
+        # to match the layout of a single indent=2 dump
+        num_drones = self.drone_system.num_drones if num_samples else 0
         
-        # Write to file
-        with open(output_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(b'{')
+            if include_metadata:
+                f.write(b'\n  "metadata": ' + _dumps(metadata).replace(b'\n', b'\n  ') + b',')
+            f.write(b'\n  "drones": [')
+            
+            for drone_id in range(num_drones):
+                drone = {
+                    'id': drone_id,
+                    'path': [
+                        {'t': t, 'x': x, 'y': y, 'z': z, 'r': r, 'g': g, 'b': b, 'light': light}
+                        for t, (x, y, z), (r, g, b), light in zip(
+                            timestamps,
+                            positions[:, drone_id].tolist(),
+                            colors[:, drone_id].tolist(),
+                            lights[:, drone_id].tolist()
+                        )
+                    ]
+                }
+                f.write(b'\n    ' if drone_id == 0 else b',\n    ')
+                f.write(_dumps(drone).replace(b'\n', b'\n    '))
+            
+            f.write(b'\n  ]\n}' if num_drones else b']\n}')
         
         print(f"Exported JSON to {output_path}")
         print(f"  Total drones: {self.drone_system.num_drones}")
-        print(f"  Total frames: {len(sampled_states)}")
-        print(f"  Duration: {export_data.get('metadata', {}).get('duration', 0):.1f}s")
+        print(f"  Total frames: {num_samples}")
+        print(f"  Duration: {metadata.get('duration', 0):.1f}s")
     
     def export_csv(self, output_path):
         """
@@ -173,36 +308,40 @@ class PathExporter:
             output_path: Path to output CSV file
         """
         # Sample at specified interval
-        interval_frames = int(EXPORT_TIME_INTERVAL * self.fps)
-        sampled_states = self.recorded_states[::interval_frames]
+        num_drones = self.drone_system.num_drones
+        records = self._sampled_records()
+        num_rows = len(records)
         
-        # Write CSV
-        with open(output_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Header
-            writer.writerow([
-                'drone_id', 'timestamp', 'x', 'y', 'z',
-                'r', 'g', 'b', 'light_on'
-            ])
-            
-            # Data rows
-            for frame in sampled_states:
-                for drone in frame['drones']:
-                    writer.writerow([
-                        drone['id'],
-                        f"{frame['timestamp']:.2f}",
-                        f"{drone['x']:.3f}",
-                        f"{drone['y']:.3f}",
-                        f"{drone['z']:.3f}",
-                        drone['r'],
-                        drone['g'],
-                        drone['b'],
-                        1 if drone['light_on'] else 0
-                    ])
+        if pd is not None:
+            # Columnar write: one row per (frame, drone), formatted in C.
+            # Timestamps are pre-formatted since they use fewer decimals.
+            frame = pd.DataFrame(records)
+            timestamps = self._sampled_frames()[0]
+            frame['timestamp'] = np.repeat(np.char.mod('%.2f', timestamps), num_drones)
+            frame.to_csv(output_path, index=False, float_format='%.3f', lineterminator='\r\n')
+        else:
+            with open(output_path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                
+                # Header
+                writer.writerow(FRAME_DTYPE.names)
+                
+                # Data rows
+                writer.writerows(
+                    [
+                        drone_id,
+                        f"{t:.2f}",
+                        f"{x:.3f}",
+                        f"{y:.3f}",
+                        f"{z:.3f}",
+                        r, g, b,
+                        light
+                    ]
+                    for drone_id, t, x, y, z, r, g, b, light in records.tolist()
+                )
         
         print(f"Exported CSV to {output_path}")
-        print(f"  Total rows: {sum(len(frame['drones']) for frame in sampled_states)}")
+        print(f"  Total rows: {num_rows}")
     
     def export_all(self, base_path):
         """
@@ -253,10 +392,7 @@ def export_paths_from_simulation(drone_system, recorded_frames, output_base_path
     # Record all frames
     for timestamp, positions, colors in recorded_frames:
         # Update drone system state (temporarily)
-        for i, (pos, color) in enumerate(zip(positions, colors)):
-            drone_system.drones[i].position = pos
-            drone_system.drones[i].color = color
-            drone_system.drones[i].light_on = np.any(color > 0)
+        drone_system.set_state_bulk(positions, colors)
         
         exporter.record_frame(timestamp)
     
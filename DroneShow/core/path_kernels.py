@@ -0,0 +1,100 @@
+"""
+Path Planning Kernels
+Numeric inner loops for path conflict checks, JIT-compiled with numba when available.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _first_conflict_numpy(path1, path2, step, min_sep_sq):
+    """NumPy version of first_conflict."""
+    num_frames = min(len(path1), len(path2))
+    diff = path1[:num_frames:step] - path2[:num_frames:step]
+    dist_sq = np.einsum('ij,ij->i', diff, diff)
+    if len(dist_sq) == 0:
+        return -1, np.inf
+
+    too_close = dist_sq < min_sep_sq
+    if too_close.any():
+        first = int(np.argmax(too_close))
+        return first, dist_sq[first]
+    return -1, dist_sq.min()
+
+
+def _any_conflict_numpy(stack, samples, min_sep_sq):
+    """NumPy version of any_conflict."""
+    diff = stack[:, :len(samples)] - samples[None]
+    dist_sq = np.einsum('kij,kij->ki', diff, diff)
+    return bool(np.any(dist_sq < min_sep_sq))
+
+
+if njit is not None:
+    # No fastmath: the minimum starts at inf, which fastmath assumes away
+    @njit(cache=True)
+    def first_conflict(path1, path2, step, min_sep_sq):
+        """
+        Scan two paths at every step-th frame for the first close approach.
+
+        Args:
+            path1, path2: numpy arrays of shape (num_frames, 3)
+            step: Frame stride between checks
+            min_sep_sq: Squared separation threshold
+
+        Returns:
+            (sample index of first conflict or -1, squared distance at that
+            sample, or the minimum squared distance when there is none)
+        """
+        num_frames = min(path1.shape[0], path2.shape[0])
+        min_dist_sq = np.inf
+        sample = 0
+        for i in range(0, num_frames, step):
+            dx = path1[i, 0] - path2[i, 0]
+            dy = path1[i, 1] - path2[i, 1]
+            dz = path1[i, 2] - path2[i, 2]
+            dist_sq = dx * dx + dy * dy + dz * dz
+            if dist_sq < min_sep_sq:
+                return sample, dist_sq
+            if dist_sq < min_dist_sq:
+                min_dist_sq = dist_sq
+            sample += 1
+        return -1, min_dist_sq
+
+    # No fastmath: the stack is NaN-padded and NaN comparisons must stay False
+    @njit(parallel=True, cache=True)
+    def any_conflict(stack, samples, min_sep_sq):
+        """
+        Check one sampled path against a stack of sampled paths.
+
+        Args:
+            stack: numpy array of shape (K, S, 3), NaN past each path's end
+            samples: numpy array of shape (s, 3) with s <= S
+            min_sep_sq: Squared separation threshold
+
+        Returns:
+            True if any stacked path comes within the threshold
+        """
+        num_paths = stack.shape[0]
+        num_samples = min(stack.shape[1], samples.shape[0])
+        hits = np.zeros(num_paths, dtype=np.bool_)
+        for k in prange(num_paths):
+            for i in range(num_samples):
+                dx = stack[k, i, 0] - samples[i, 0]
+                dy = stack[k, i, 1] - samples[i, 1]
+                dz = stack[k, i, 2] - samples[i, 2]
+                if dx * dx + dy * dy + dz * dz < min_sep_sq:
+                    hits[k] = True
+                    break
+        return hits.any()
+
+    # Compile once at import so the first planning call is not slowed down
+    _warmup = np.zeros((2, 3))
+    first_conflict(_warmup, _warmup, 1, 1.0)
+    any_conflict(_warmup[None], _warmup, 1.0)
+else:
+    first_conflict = _first_conflict_numpy
+    any_conflict = _any_conflict_numpy
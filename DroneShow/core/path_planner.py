@@ -5,7 +5,12 @@ Pre-calculates drone paths and resolves conflicts using priority-based system.
 
 import numpy as np
 from scipy.optimize import linear_sum_assignment
+from scipy.spatial.distance import cdist
 from config.drone_config import MIN_SEPARATION, MAX_SPEED
+from core.drone_system import ease_in_out_array
+from core.path_kernels import first_conflict, any_conflict
+
+_MIN_SEP_SQ = MIN_SEPARATION ** 2
 
 
 class PathPlanner:
@@ -22,6 +27,7 @@ class PathPlanner:
         """
         self.num_drones = num_drones
         self.paths = {}  # Will store pre-calculated paths
+        self._ease_profiles = {}  # num_frames -> eased t for each frame
     
     def assign_drones_to_targets(self, start_positions, target_positions):
         """
@@ -45,11 +51,10 @@ class PathPlanner:
             num_targets = num_drones
         
         # Calculate cost matrix (Euclidean distances)
-        cost_matrix = np.zeros((num_drones, num_targets))
-        for i in range(num_drones):
-            for j in range(num_targets):
-                distance = np.linalg.norm(start_positions[i] - target_positions[j])
-                cost_matrix[i, j] = distance
+        cost_matrix = cdist(
+            np.ascontiguousarray(start_positions, dtype=float),
+            np.ascontiguousarray(target_positions, dtype=float)
+        )
         
         # Solve assignment problem
         if num_targets > 0:
@@ -77,19 +82,18 @@ class PathPlanner:
             path: numpy array of shape (num_frames, 3) with positions at each frame
         """
         num_frames = int(duration * fps)
-        path = np.zeros((num_frames, 3))
+        start_pos = np.asarray(start_pos, dtype=float)
+        end_pos = np.asarray(end_pos, dtype=float)
         
-        for frame in range(num_frames):
-            t = frame / max(num_frames - 1, 1)
-            # Apply ease-in-ease-out
-            if t < 0.5:
-                t_eased = 2 * t * t
-            else:
-                t_eased = 1 - 2 * (1 - t) ** 2
-            
-            path[frame] = start_pos + t_eased * (end_pos - start_pos)
+        # Eased time for every frame (ease-in-ease-out), shared by all paths
+        # of the same length
+        t_eased = self._ease_profiles.get(num_frames)
+        if t_eased is None:
+            t_eased = ease_in_out_array(np.linspace(0.0, 1.0, num_frames))
+            t_eased.flags.writeable = False
+            self._ease_profiles[num_frames] = t_eased
         
-        return path
+        return start_pos + t_eased[:, None] * (end_pos - start_pos)
     
     def check_path_conflicts(self, path1, path2, time_interval=0.1, fps=30):
         """
@@ -106,20 +110,12 @@ class PathPlanner:
             min_distance: Minimum distance between paths
         """
         frames_per_check = max(1, int(time_interval * fps))
-        min_distance = float('inf')
-        
-        num_frames = min(len(path1), len(path2))
+        first, dist_sq = first_conflict(path1, path2, frames_per_check, _MIN_SEP_SQ)
         
-        for frame in range(0, num_frames, frames_per_check):
-            distance = np.linalg.norm(path1[frame] - path2[frame])
-            min_distance = min(min_distance, distance)
-            
-            if distance < MIN_SEPARATION:
-                return True, distance
-        
-        return False, min_distance
+        # Report the first conflicting frame, or the closest approach
+        return first >= 0, float(np.sqrt(dist_sq))
     
-    def resolve_conflicts(self, paths, drone_priorities):
+    def resolve_conflicts(self, paths, drone_priorities, time_interval=0.1, fps=30):
         """
         Resolve path conflicts using priority system.
         Lower priority drones are delayed if conflict detected.
@@ -128,41 +124,47 @@ class PathPlanner:
             paths: dict mapping drone_id -> path array
             drone_priorities: dict mapping drone_id -> priority value
                             (lower value = higher priority)
+            time_interval: Check interval in seconds
+            fps: Frames per second
         
         Returns:
             resolved_paths: dict mapping drone_id -> adjusted path array
         """
         resolved_paths = {}
         sorted_drones = sorted(drone_priorities.keys(), key=lambda d: drone_priorities[d])
+        if not sorted_drones:
+            return resolved_paths
         
-        for drone_id in sorted_drones:
+        delay_frames = 10  # 0.33 seconds at 30 fps
+        
+        # Sampled frames of every resolved path, stacked in priority order and
+        # NaN-padded so paths of different lengths never register a conflict
+        # past the end of the shorter one (same sampling as check_path_conflicts)
+        frames_per_check = max(1, int(time_interval * fps))
+        max_frames = max(len(paths[d]) for d in sorted_drones) + delay_frames
+        num_samples = -(-max_frames // frames_per_check)
+        resolved_stack = np.full((len(sorted_drones), num_samples, 3), np.nan)
+        
+        for k, drone_id in enumerate(sorted_drones):
             path = paths[drone_id]
-            conflicts = []
+            samples = path[::frames_per_check]
             
-            # Check against all higher-priority drones
-            for other_id in sorted_drones:
-                if other_id == drone_id:
-                    break  # Reached current drone
-                
-                if other_id in resolved_paths:
-                    has_conflict, min_dist = self.check_path_conflicts(
-                        path, resolved_paths[other_id]
-                    )
-                    
-                    if has_conflict:
-                        conflicts.append((other_id, min_dist))
+            # Check against all higher-priority drones in one pass
+            has_conflict = k > 0 and any_conflict(
+                resolved_stack[:k], samples, _MIN_SEP_SQ
+            )
             
             # If conflicts exist, delay this drone's movement
-            if conflicts:
+            if has_conflict:
                 # Simple resolution: add delay at start
-                delay_frames = 10  # 0.33 seconds at 30 fps
-                delayed_path = np.vstack([
+                path = np.vstack([
                     np.tile(path[0], (delay_frames, 1)),
                     path
                 ])
-                resolved_paths[drone_id] = delayed_path
-            else:
-                resolved_paths[drone_id] = path
+            
+            resolved_paths[drone_id] = path
+            samples = path[::frames_per_check]
+            resolved_stack[k, :len(samples)] = samples
         
         return resolved_paths
     
@@ -266,12 +268,12 @@ def validate_path(path, max_speed, fps=30):
     if len(path) < 2:
         return True, 0.0
     
-    # Calculate speeds between frames
-    distances = np.linalg.norm(np.diff(path, axis=0), axis=1)
+    # Calculate speeds between frames; only the largest step needs a sqrt
+    steps = np.diff(path, axis=0)
+    max_step_sq = np.einsum('ij,ij->i', steps, steps).max()
     dt = 1.0 / fps
-    speeds = distances / dt
     
-    max_speed_in_path = np.max(speeds)
+    max_speed_in_path = np.sqrt(max_step_sq) / dt
     
     if max_speed_in_path > max_speed:
         return False, max_speed_in_path - max_speed
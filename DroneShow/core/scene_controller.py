@@ -3,6 +3,9 @@ Scene Controller
 Manages timeline, scene transitions, and drone formations throughout the show.
 """
 
+from bisect import bisect_right
+from itertools import accumulate
+
 import numpy as np
 from config.drone_config import (
     SCENES, FPS, TRANSITION_DURATION,
@@ -13,6 +16,8 @@ from config.drone_config import (
     AUSTRALIA_COLOR_TOP, AUSTRALIA_COLOR_BOTTOM,
     TOTAL_DRONES
 )
+from core.drone_system import ease_in_out, interpolate_positions
+from core.formation_cache import FORMATION_CACHE_PATH, load_formation_cache
 from core.shape_generators import (
     generate_heart_formation,
     generate_star_formation,
@@ -21,6 +26,39 @@ from core.shape_generators import (
     generate_parking_grid
 )
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _blend_kernel(pos1, pos2, colors1, colors2, t, out_positions, out_colors):
+        """
+        Fused formation blend: one pass over both formations, one write each.
+        
+        Computes pos1 + t * (pos2 - pos1) and the rounded color blend
+        directly into the output arrays without temporaries.
+        """
+        for i in range(pos1.shape[0]):
+            for k in range(3):
+                out_positions[i, k] = pos1[i, k] + t * (pos2[i, k] - pos1[i, k])
+                c1 = np.float32(colors1[i, k])
+                c2 = np.float32(colors2[i, k])
+                out_colors[i, k] = np.uint8(np.rint(c1 + t * (c2 - c1)))
+    
+    # Compile at import for the read-only cached formations it is called with
+    _warmup_pos = np.zeros((1, 3), dtype=np.float32)
+    _warmup_colors = np.zeros((1, 3), dtype=np.uint8)
+    _warmup_pos.flags.writeable = False
+    _warmup_colors.flags.writeable = False
+    _blend_kernel(_warmup_pos, _warmup_pos, _warmup_colors, _warmup_colors,
+                  np.float32(0.0), np.zeros((1, 3), dtype=np.float32),
+                  np.zeros((1, 3), dtype=np.uint8))
+else:
+    _blend_kernel = None
+
 
 class Scene:
     """
@@ -43,6 +81,7 @@ class Scene:
         self.kwargs = kwargs
         self.positions = None
         self.colors = None
+        self.padded = None
     
     def generate_formation(self):
         """Generate the formation for this scene."""
@@ -56,13 +95,16 @@ class SceneController:
     Controls the sequence of scenes and transitions.
     """
     
-    def __init__(self, mode='testing', fps=FPS):
+    def __init__(self, mode='testing', fps=FPS,
+                 formation_cache_path=FORMATION_CACHE_PATH):
         """
         Initialize scene controller.
         
         Args:
             mode: 'testing' or 'production'
             fps: Frames per second
+            formation_cache_path: Pre-baked formations from build_formations.py
+                                  (None to always generate formations)
         """
         self.mode = mode
         self.fps = fps
@@ -71,6 +113,29 @@ class SceneController:
         self.current_time = 0.0
         
         self._setup_scenes()
+        
+        # Reuse pre-baked formations when an up-to-date cache exists
+        cached = load_formation_cache(formation_cache_path)
+        for scene in self.scenes:
+            if scene.name in cached:
+                scene.positions, scene.colors = cached[scene.name]
+        
+        # Pad every formation to TOTAL_DRONES once, up front; frames and
+        # transitions then read the padded arrays without further copies
+        for scene in self.scenes:
+            positions, colors = self._pad_or_trim_formation(*scene.generate_formation())
+            positions.flags.writeable = False
+            colors.flags.writeable = False
+            scene.padded = (positions, colors)
+        
+        # Prefix sums of scene durations for O(log S) time -> scene lookup
+        self._scene_ends = list(accumulate(scene.duration for scene in self.scenes))
+        self._scene_starts = [0.0] + self._scene_ends[:-1]
+        
+        # Output buffers for transition frames, reused every call
+        self._positions_out = np.empty((TOTAL_DRONES, 3), dtype=np.float32)
+        self._colors_blend = np.empty((TOTAL_DRONES, 3), dtype=np.float32)
+        self._colors_out = np.empty((TOTAL_DRONES, 3), dtype=np.uint8)
     
     def _setup_scenes(self):
         """Setup all scenes based on mode."""
@@ -158,7 +223,7 @@ class SceneController:
     
     def get_total_duration(self):
         """Get total show duration in seconds."""
-        return sum(scene.duration for scene in self.scenes)
+        return self._scene_ends[-1]
     
     def get_total_frames(self):
         """Get total number of frames."""
@@ -174,38 +239,39 @@ class SceneController:
         Returns:
             scene_index, scene_time (time within scene)
         """
-        elapsed = 0.0
-        for i, scene in enumerate(self.scenes):
-            if elapsed + scene.duration > time:
-                return i, time - elapsed
-            elapsed += scene.duration
-        
-        # Past end, return last scene
-        return len(self.scenes) - 1, 0.0
+        # Time usually marches forward, so the last scene is the likely hit
+        i = self.current_scene_index
+        if not (self._scene_starts[i] <= time < self._scene_ends[i]):
+            i = bisect_right(self._scene_ends, time)
+            if i >= len(self.scenes):
+                # Past end, return last scene
+                return len(self.scenes) - 1, 0.0
+            self.current_scene_index = i
+        
+        return i, time - self._scene_starts[i]
     
     def get_formation_at_time(self, time):
         """
         Get drone formation (positions and colors) at given time.
         Handles transitions between scenes.
         
+        The returned arrays are shared (cached formations or reused output
+        buffers) and are only valid until the next call; copy to keep them.
+        
         Args:
             time: Time in seconds
         
         Returns:
-            positions: numpy array of shape (N, 3)
-            colors: numpy array of shape (N, 3)
+            positions: float32 array of shape (TOTAL_DRONES, 3)
+            colors: uint8 array of shape (TOTAL_DRONES, 3)
         """
         scene_idx, scene_time = self.get_scene_at_time(time)
         
         # Check if we're in a transition
         if scene_time < TRANSITION_DURATION and scene_idx > 0:
             # Transitioning from previous scene
-            prev_scene = self.scenes[scene_idx - 1]
-            curr_scene = self.scenes[scene_idx]
-            
-            # Generate both formations
-            prev_pos, prev_colors = prev_scene.generate_formation()
-            curr_pos, curr_colors = curr_scene.generate_formation()
+            prev_pos, prev_colors = self.scenes[scene_idx - 1].padded
+            curr_pos, curr_colors = self.scenes[scene_idx].padded
             
             # Interpolate
             t = scene_time / TRANSITION_DURATION
@@ -218,11 +284,8 @@ class SceneController:
              scene_idx < len(self.scenes) - 1:
             # Transitioning to next scene
             curr_scene = self.scenes[scene_idx]
-            next_scene = self.scenes[scene_idx + 1]
-            
-            # Generate both formations
-            curr_pos, curr_colors = curr_scene.generate_formation()
-            next_pos, next_colors = next_scene.generate_formation()
+            curr_pos, curr_colors = self.scenes[scene_idx].padded
+            next_pos, next_colors = self.scenes[scene_idx + 1].padded
             
             # Interpolate
             t = (scene_time - (curr_scene.duration - TRANSITION_DURATION)) / TRANSITION_DURATION
@@ -233,79 +296,161 @@ class SceneController:
             )
         else:
             # Steady state within scene
-            positions, colors = self.scenes[scene_idx].generate_formation()
+            positions, colors = self.scenes[scene_idx].padded
         
-        # Ensure we have exactly TOTAL_DRONES positions/colors
-        positions, colors = self._pad_or_trim_formation(positions, colors)
+        return positions, colors
+    
+    def render_timeline(self):
+        """
+        Compute the formation for every frame of the show in one pass.
+        
+        Frames are blocked by scene: steady frames are filled by broadcasting
+        the scene's padded formation, and transition frames are blended
+        straight into the timeline through _blend_into, the same blend and
+        rounding get_formation_at_time uses. Frame k equals
+        get_formation_at_time(k / fps).
+        
+        Returns:
+            positions: float32 array of shape (total_frames, TOTAL_DRONES, 3)
+            colors: uint8 array of shape (total_frames, TOTAL_DRONES, 3)
+        """
+        num_frames = self.get_total_frames()
+        times = np.arange(num_frames) / self.fps
+        positions = np.empty((num_frames, TOTAL_DRONES, 3), dtype=np.float32)
+        colors = np.empty((num_frames, TOTAL_DRONES, 3), dtype=np.uint8)
+        
+        starts = np.searchsorted(times, self._scene_starts)
+        ends = np.searchsorted(times, self._scene_ends)
+        last = len(self.scenes) - 1
+        
+        for i, scene in enumerate(self.scenes):
+            a, b = starts[i], ends[i]
+            if a == b:
+                continue
+            scene_time = times[a:b] - self._scene_starts[i]
+            positions[a:b], colors[a:b] = scene.padded
+            
+            # Transitioning to next scene (applied first so an overlapping
+            # incoming transition takes precedence, as in get_formation_at_time)
+            if i < last:
+                k = np.searchsorted(scene_time, scene.duration - TRANSITION_DURATION, side='right')
+                t = (scene_time[k:] - (scene.duration - TRANSITION_DURATION)) / TRANSITION_DURATION
+                self._blend_block(scene.padded, self.scenes[i + 1].padded, t,
+                                  positions[a + k:b], colors[a + k:b])
+            
+            # Transitioning from previous scene
+            if i > 0:
+                k = np.searchsorted(scene_time, TRANSITION_DURATION)
+                t = scene_time[:k] / TRANSITION_DURATION
+                self._blend_block(self.scenes[i - 1].padded, scene.padded, t,
+                                  positions[a:a + k], colors[a:a + k])
+        
+        # Any frames rounding past the last scene end take the scalar path
+        for k in range(ends[-1], num_frames):
+            positions[k], colors[k] = self.get_formation_at_time(times[k])
         
         return positions, colors
     
+    def _blend_block(self, formation1, formation2, t, out_positions, out_colors):
+        """
+        Blend two padded formations for a block of transition frames.
+        
+        Args:
+            formation1, formation2: (positions, colors) padded scene formations
+            t: numpy array of shape (L,) with interpolation factors (0-1)
+            out_positions: float32 array of shape (L, TOTAL_DRONES, 3)
+            out_colors: uint8 array of shape (L, TOTAL_DRONES, 3)
+        """
+        pos1, colors1 = formation1
+        pos2, colors2 = formation2
+        for j, t_frame in enumerate(t.tolist()):
+            self._blend_into(pos1, colors1, pos2, colors2, ease_in_out(t_frame),
+                             out_positions[j], out_colors[j])
+    
     def _interpolate_formations(self, pos1, colors1, pos2, colors2, t):
         """
-        Interpolate between two formations with easing.
+        Interpolate between two padded formations with easing.
+        
+        Results are written into the controller's reusable output buffers.
         
         Args:
-            pos1, colors1: First formation
-            pos2, colors2: Second formation
+            pos1, colors1: First formation (a scene's padded arrays)
+            pos2, colors2: Second formation (a scene's padded arrays)
             t: Interpolation factor (0-1)
         
         Returns:
             Interpolated positions and colors
         """
-        # Apply ease-in-ease-out to t
-        if t < 0.5:
-            t_eased = 2 * t * t
-        else:
-            t_eased = 1 - 2 * (1 - t) ** 2
-        
-        # Ensure both formations have exactly TOTAL_DRONES
-        pos1, colors1 = self._pad_or_trim_formation(pos1, colors1)
-        pos2, colors2 = self._pad_or_trim_formation(pos2, colors2)
+        positions = self._positions_out
+        colors = self._colors_out
+        self._blend_into(pos1, colors1, pos2, colors2, ease_in_out(t),
+                         positions, colors)
+        return positions, colors
+    
+    def _blend_into(self, pos1, colors1, pos2, colors2, t_eased, out_positions, out_colors):
+        """
+        Blend two padded formations at an eased t into the given outputs.
         
-        # Interpolate
-        positions = pos1 + t_eased * (pos2 - pos1)
-        colors = colors1 + t_eased * (colors2 - colors1)
-        colors = np.round(colors).astype(int)
-        colors = np.clip(colors, 0, 255)
+        Every transition frame, per-frame or in render_timeline, is blended
+        here so all callers round colors identically.
         
-        return positions, colors
+        Args:
+            pos1, colors1: First formation (a scene's padded arrays)
+            pos2, colors2: Second formation (a scene's padded arrays)
+            t_eased: Eased interpolation factor (0-1)
+            out_positions: float32 array of shape (TOTAL_DRONES, 3)
+            out_colors: uint8 array of shape (TOTAL_DRONES, 3)
+        """
+        if _blend_kernel is not None:
+            _blend_kernel(pos1, pos2, colors1, colors2, np.float32(t_eased),
+                          out_positions, out_colors)
+            return
+        
+        # Interpolate in place: pos1 + t_eased * (pos2 - pos1)
+        interpolate_positions(pos1, pos2, t_eased, ease=False, out=out_positions)
+        
+        # Blend colors in float, then round into the uint8 buffer; a convex
+        # blend of 0-255 values never leaves that range, so no clip is needed
+        blend = np.subtract(colors2, colors1, out=self._colors_blend, dtype=np.float32)
+        blend *= t_eased
+        blend += colors1
+        np.rint(blend, out=blend)
+        np.copyto(out_colors, blend, casting='unsafe')
     
     def _pad_or_trim_formation(self, positions, colors):
         """
         Ensure formation has exactly TOTAL_DRONES drones.
         
+        The formation is copied straight into newly allocated TOTAL_DRONES
+        arrays, with parking positions written into the tail, so no
+        intermediate stacked or converted copies are made.
+        
         Args:
             positions: numpy array
             colors: numpy array
         
         Returns:
-            Padded/trimmed positions and colors
+            Padded/trimmed positions (float32) and colors (uint8)
         """
-        # Ensure both arrays have same length
-        num_pos = len(positions)
-        num_colors = len(colors)
-        
-        if num_pos != num_colors:
-            # Take minimum to be safe
-            min_len = min(num_pos, num_colors)
-            positions = positions[:min_len]
-            colors = colors[:min_len]
-        
-        num_current = len(positions)
+        # Ensure both arrays have same length (take minimum to be safe),
+        # trimming any excess over TOTAL_DRONES
+        num_current = min(len(positions), len(colors), TOTAL_DRONES)
+        
+        padded_positions = np.empty((TOTAL_DRONES, 3), dtype=np.float32)
+        padded_colors = np.zeros((TOTAL_DRONES, 3), dtype=np.uint8)
+        np.copyto(padded_positions[:num_current], positions[:num_current],
+                  casting='unsafe')
+        # Truncate like DroneSystem does when it stores float colors
+        np.copyto(padded_colors[:num_current], colors[:num_current],
+                  casting='unsafe')
         
         if num_current < TOTAL_DRONES:
-            # Need to add parking drones
-            parking_pos, parking_colors = generate_parking_grid(
-                TOTAL_DRONES, num_current
-            )
-            positions = np.vstack([positions, parking_pos])
-            colors = np.vstack([colors, parking_colors])
-        elif num_current > TOTAL_DRONES:
-            # Trim excess
-            positions = positions[:TOTAL_DRONES]
-            colors = colors[:TOTAL_DRONES]
+            # Need to add parking drones (lights off, colors stay zero)
+            parking_pos, _ = generate_parking_grid(TOTAL_DRONES, num_current)
+            np.copyto(padded_positions[num_current:], parking_pos,
+                      casting='unsafe')
         
-        return positions, colors
+        return padded_positions, padded_colors
     
     def get_scene_info(self):
         """
@@ -3,6 +3,9 @@ Shape Generators for Drone Show
 Generate 3D coordinates for various formations (heart, star, text, parking grid).
 """
 
+from functools import lru_cache
+from math import isqrt
+
 import numpy as np
 from matplotlib.textpath import TextPath
 from matplotlib.font_manager import FontProperties
@@ -17,6 +20,180 @@ from config.drone_config import (
     MIN_SEPARATION
 )
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def _min_separation_kernel(points_yz, min_sep_sq):
+        """
+        Greedy minimum-separation filter (same rule as enforce_min_separation_2d).
+        
+        Returns the indices of the kept points, in input order. The distance
+        test runs over a preallocated buffer of kept points and stops at the
+        first point that is too close.
+        """
+        n = points_yz.shape[0]
+        kept = np.empty((n, 2))
+        kept_idx = np.empty(n, dtype=np.int64)
+        num_kept = 0
+        for i in range(n):
+            y = points_yz[i, 0]
+            z = points_yz[i, 1]
+            far = True
+            for j in range(num_kept):
+                dy = y - kept[j, 0]
+                dz = z - kept[j, 1]
+                if dy * dy + dz * dz < min_sep_sq:
+                    far = False
+                    break
+            if far:
+                kept[num_kept, 0] = y
+                kept[num_kept, 1] = z
+                kept_idx[num_kept] = i
+                num_kept += 1
+        return kept_idx[:num_kept]
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _inside_polygon_kernel(points, polygon):
+        """
+        Crossing-number point-in-polygon test for every point in parallel.
+        
+        Args:
+            points: numpy array of shape (M, 2)
+            polygon: numpy array of shape (V, 2); closing edge is implied
+        
+        Returns:
+            Boolean mask of shape (M,)
+        """
+        num_vertices = polygon.shape[0]
+        inside = np.zeros(points.shape[0], dtype=np.bool_)
+        for p in prange(points.shape[0]):
+            px = points[p, 0]
+            py = points[p, 1]
+            crossings = False
+            j = num_vertices - 1
+            for i in range(num_vertices):
+                xi = polygon[i, 0]
+                yi = polygon[i, 1]
+                xj = polygon[j, 0]
+                yj = polygon[j, 1]
+                if (yi > py) != (yj > py):
+                    if px < (xj - xi) * (py - yi) / (yj - yi) + xi:
+                        crossings = not crossings
+                j = i
+            inside[p] = crossings
+        return inside
+    
+    # Compile once at import so the first formation is not slowed down
+    _min_separation_kernel(np.zeros((1, 2)), 1.0)
+    _inside_polygon_kernel(np.zeros((1, 2)), np.zeros((3, 2)))
+else:
+    _min_separation_kernel = None
+    _inside_polygon_kernel = None
+
+
+# Shared PCG64 generator for formation sampling, seeded so shows are
+# reproducible; Generator.choice without replacement and shuffle=False
+# avoids building a full permutation
+FORMATION_SEED = 12345
+_rng = np.random.default_rng(FORMATION_SEED)
+
+
+def set_seed(seed):
+    """
+    Reseed the random generator shared by the formation generators.
+    
+    Args:
+        seed: Seed for np.random.default_rng (None for fresh entropy)
+    """
+    global _rng
+    _rng = np.random.default_rng(seed)
+
+
+def _points_in_polygon(points, polygon):
+    """
+    Test which 2D points lie inside a simple polygon.
+    
+    Uses the compiled crossing-number kernel when numba is installed,
+    otherwise matplotlib's path containment test.
+    
+    Args:
+        points: numpy array of shape (M, 2)
+        polygon: numpy array of shape (V, 2) with the outline vertices
+    
+    Returns:
+        Boolean mask of shape (M,)
+    """
+    if _inside_polygon_kernel is not None:
+        return _inside_polygon_kernel(
+            np.ascontiguousarray(points, dtype=float),
+            np.ascontiguousarray(polygon, dtype=float)
+        )
+    
+    from matplotlib.path import Path
+    return Path(polygon).contains_points(points)
+
+
+def _solid_colors(color, num_drones):
+    """
+    Colors for a single-color formation as a zero-copy read-only view.
+    
+    Args:
+        color: RGB tuple (0-255)
+        num_drones: Number of drones
+    
+    Returns:
+        numpy array view of shape (num_drones, 3)
+    """
+    return np.broadcast_to(np.asarray(color, dtype=np.float32), (num_drones, 3))
+
+
+def _sample_flat_formation(y, z, num_drones):
+    """
+    Sample grid points of a flat formation and center them in 3D.
+    
+    Points are randomly subsampled down to num_drones, or padded with up to
+    100 jittered duplicates if slightly short, then written once into the
+    final array with the formation center added.
+    
+    Args:
+        y, z: 1D arrays of candidate point coordinates in the Y-Z plane
+        num_drones: Number of drones requested
+    
+    Returns:
+        positions: float32 numpy array of shape (num_drones, 3), or fewer
+                   when there are not enough points to pad
+    """
+    num_points = len(y)
+    num_extra = 0
+    
+    if num_points > num_drones:
+        indices = _rng.choice(num_points, num_drones, replace=False, shuffle=False)
+    else:
+        indices = np.arange(num_points)
+        # Pad with a few extra points if we're a bit short
+        # This is OK since grid spacing already ensures MIN_SEPARATION
+        extra_needed = num_drones - num_points
+        if 0 < extra_needed <= 100 and num_points > 0:
+            num_extra = extra_needed
+            indices = np.concatenate([indices, _rng.integers(0, num_points, extra_needed)])
+    
+    # Center at formation center, in single precision for the render pipeline
+    positions = np.empty((len(indices), 3), dtype=np.float32)
+    positions[:, 0] = FORMATION_CENTER[0]  # X = 0 + 0 = 0
+    positions[:, 1] = y[indices] + FORMATION_CENTER[1]  # Y centered
+    positions[:, 2] = z[indices] + FORMATION_CENTER[2]  # Z centered
+    
+    if num_extra:
+        # Add small offset to avoid exact duplicates (within MIN_SEPARATION tolerance)
+        positions[-num_extra:, 1:] += _rng.uniform(-0.3, 0.3, (num_extra, 2))
+    
+    return positions
+
 
 def enforce_min_separation_2d(positions, min_sep=MIN_SEPARATION):
     """
@@ -33,22 +210,51 @@ def enforce_min_separation_2d(positions, min_sep=MIN_SEPARATION):
         return positions
     
     # Use only Y and Z coordinates for distance calculation (2D)
-    kept_positions = [positions[0]]  # Always keep first point
-    
-    for i in range(1, len(positions)):
-        pos = positions[i]
-        # Check distance to all previously kept positions (in Y-Z plane only)
-        min_dist = float('inf')
-        for kept_pos in kept_positions:
-            # 2D distance in Y-Z plane
-            dist = np.sqrt((pos[1] - kept_pos[1])**2 + (pos[2] - kept_pos[2])**2)
-            min_dist = min(min_dist, dist)
+    points_yz = np.asarray(positions, dtype=float)[:, 1:3]
+    min_sep_sq = min_sep ** 2
+    
+    if _min_separation_kernel is not None:
+        kept = _min_separation_kernel(np.ascontiguousarray(points_yz), min_sep_sq)
+        return np.asarray(positions)[kept]
+    
+    # Greedy pass: each point is tested against all kept points at once,
+    # using squared distances; kept points are appended to a fixed buffer
+    kept_yz = np.empty_like(points_yz)
+    kept_idx = np.empty(len(points_yz), dtype=np.intp)
+    kept_yz[0] = points_yz[0]  # Always keep first point
+    kept_idx[0] = 0
+    num_kept = 1
+    
+    for i in range(1, len(points_yz)):
+        diff = kept_yz[:num_kept] - points_yz[i]
+        dist_sq = np.einsum('ij,ij->i', diff, diff)
         
         # Keep point if it's far enough from all other points
-        if min_dist >= min_sep:
-            kept_positions.append(pos)
+        if dist_sq.min() >= min_sep_sq:
+            kept_yz[num_kept] = points_yz[i]
+            kept_idx[num_kept] = i
+            num_kept += 1
     
-    return np.array(kept_positions)
+    return np.asarray(positions)[kept_idx[:num_kept]]
+
+
+# 2D parametric heart, evaluated once at import:
+# y = 16*sin³(t)
+# z = 13*cos(t) - 5*cos(2t) - 2*cos(3t) - cos(4t)
+def _heart_curve(t):
+    """Evaluate the parametric heart at parameters t, returning (y, z)."""
+    y = 16 * np.sin(t)**3
+    z = 13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t)
+    return y, z
+
+
+# Outline for filling the heart formation
+_HEART_T = np.linspace(0, 2 * np.pi, 200)
+_HEART_Y_OUTLINE, _HEART_Z_OUTLINE = _heart_curve(_HEART_T)
+
+# Dense master curve, resampled for heart emojis of any size
+_HEART_MASTER_T = np.linspace(0, 2 * np.pi, 2048)
+_HEART_MASTER_Y, _HEART_MASTER_Z = _heart_curve(_HEART_MASTER_T)
 
 
 def generate_heart_formation(num_drones=900):
@@ -63,14 +269,9 @@ def generate_heart_formation(num_drones=900):
         positions: numpy array of shape (num_drones, 3) with (x, y, z) coordinates
         colors: numpy array of shape (num_drones, 3) with RGB values (0-255)
     """
-    # 2D parametric heart equations
-    # y = 16*sin³(t)
-    # z = 13*cos(t) - 5*cos(2t) - 2*cos(3t) - cos(4t)
-    
-    # Generate outline points first
-    t = np.linspace(0, 2 * np.pi, 200)
-    y_outline = 16 * np.sin(t)**3
-    z_outline = 13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t)
+    # Outline points of the 2D parametric heart (precomputed)
+    y_outline = _HEART_Y_OUTLINE
+    z_outline = _HEART_Z_OUTLINE
     
     # Find bounds for grid generation
     y_min, y_max = y_outline.min(), y_outline.max()
@@ -88,11 +289,9 @@ def generate_heart_formation(num_drones=900):
     y_flat = Y.ravel()
     z_flat = Z.ravel()
     
-    # Filter points inside heart using matplotlib path
-    from matplotlib.path import Path
-    heart_path = Path(np.column_stack([y_outline, z_outline]))
+    # Filter points inside heart outline
     points_2d = np.column_stack([y_flat, z_flat])
-    inside_mask = heart_path.contains_points(points_2d)
+    inside_mask = _points_in_polygon(points_2d, np.column_stack([y_outline, z_outline]))
     
     y_inside = y_flat[inside_mask]
     z_inside = z_flat[inside_mask]
@@ -105,38 +304,13 @@ def generate_heart_formation(num_drones=900):
     y_scaled = y_inside * scale_y
     z_scaled = z_inside * scale_z
     
-    # Create 3D positions (X=0 for all points - flat in Y-Z plane)
-    # Grid already has MIN_SEPARATION spacing, so no need for aggressive filtering
-    positions_filtered = np.column_stack([
-        np.zeros(len(y_scaled)),  # X = 0 (flat)
-        y_scaled,
-        z_scaled
-    ])
-    
-    # Randomly sample to get requested number of drones
-    if len(positions_filtered) > num_drones:
-        indices = np.random.choice(len(positions_filtered), num_drones, replace=False)
-        positions_filtered = positions_filtered[indices]
-    elif len(positions_filtered) < num_drones:
-        # Pad with a few extra points if we're a bit short
-        # This is OK since grid spacing already ensures MIN_SEPARATION
-        extra_needed = num_drones - len(positions_filtered)
-        if extra_needed <= 100 and len(positions_filtered) > 0:
-            indices = np.random.choice(len(positions_filtered), extra_needed, replace=True)
-            extra_positions = positions_filtered[indices].copy()
-            # Add small offset to avoid exact duplicates (within MIN_SEPARATION tolerance)
-            extra_positions[:, 1] += np.random.uniform(-0.3, 0.3, extra_needed)
-            extra_positions[:, 2] += np.random.uniform(-0.3, 0.3, extra_needed)
-            positions_filtered = np.vstack([positions_filtered, extra_positions])
-    
-    # Center at formation center
-    positions = positions_filtered.copy()
-    positions[:, 0] += FORMATION_CENTER[0]  # X = 0 + 0 = 0
-    positions[:, 1] += FORMATION_CENTER[1]  # Y centered
-    positions[:, 2] += FORMATION_CENTER[2]  # Z centered
+    # Sample the requested number of drones and place them in the Y-Z plane
+    # (X=0 for all points); grid already has MIN_SEPARATION spacing, so no
+    # need for aggressive filtering
+    positions = _sample_flat_formation(y_scaled, z_scaled, num_drones)
     
     # All drones are red
-    colors = np.tile(HEART_COLOR, (len(positions), 1))
+    colors = _solid_colors(HEART_COLOR, len(positions))
     
     return positions, colors
 
@@ -160,13 +334,12 @@ def generate_star_formation(num_drones=850, num_points=5):
     
     # Generate star vertices (outer and inner points)
     # Start from top (90 degrees) and go clockwise
-    star_vertices_2d = []
-    for i in range(num_points * 2):
-        angle = np.pi/2 - (i * np.pi / num_points)  # Start from top, go clockwise
-        radius = outer_radius if i % 2 == 0 else inner_radius
-        y = radius * np.cos(angle)
-        z = radius * np.sin(angle)
-        star_vertices_2d.append([y, z])
+    i = np.arange(num_points * 2)
+    angles = np.pi/2 - (i * np.pi / num_points)  # Start from top, go clockwise
+    radii = np.where(i % 2 == 0, outer_radius, inner_radius)
+    star_vertices_2d = np.empty((len(i), 2))
+    star_vertices_2d[:, 0] = radii * np.cos(angles)
+    star_vertices_2d[:, 1] = radii * np.sin(angles)
     
     # Create dense grid for formation (use smaller spacing than MIN_SEPARATION)
     # Professional drone shows use 0.8-1.5m spacing for visible formations
@@ -179,61 +352,56 @@ def generate_star_formation(num_drones=850, num_points=5):
     y_flat = Y.ravel()
     z_flat = Z.ravel()
     
-    # Filter points inside star using matplotlib path
-    from matplotlib.path import Path
-    star_path = Path(np.array(star_vertices_2d))
+    # Filter points inside star outline
     points_2d = np.column_stack([y_flat, z_flat])
-    inside_mask = star_path.contains_points(points_2d)
+    inside_mask = _points_in_polygon(points_2d, star_vertices_2d)
     
     y_inside = y_flat[inside_mask]
     z_inside = z_flat[inside_mask]
     
-    # Create 3D positions (X=0 for all points - flat in Y-Z plane)
-    # Grid already has MIN_SEPARATION spacing
-    positions_filtered = np.column_stack([
-        np.zeros(len(y_inside)),  # X = 0 (flat)
-        y_inside,
-        z_inside
-    ])
-    
-    # Randomly sample to get requested number of drones
-    if len(positions_filtered) > num_drones:
-        indices = np.random.choice(len(positions_filtered), num_drones, replace=False)
-        positions_filtered = positions_filtered[indices]
-    elif len(positions_filtered) < num_drones:
-        # Pad with a few extra points if we're a bit short
-        extra_needed = num_drones - len(positions_filtered)
-        if extra_needed <= 100 and len(positions_filtered) > 0:
-            indices = np.random.choice(len(positions_filtered), extra_needed, replace=True)
-            extra_positions = positions_filtered[indices].copy()
-            # Add small offset to avoid exact duplicates
-            extra_positions[:, 1] += np.random.uniform(-0.3, 0.3, extra_needed)
-            extra_positions[:, 2] += np.random.uniform(-0.3, 0.3, extra_needed)
-            positions_filtered = np.vstack([positions_filtered, extra_positions])
-    
-    # Center at formation center
-    positions = positions_filtered.copy()
-    positions[:, 0] += FORMATION_CENTER[0]  # X = 0 + 0 = 0
-    positions[:, 1] += FORMATION_CENTER[1]  # Y centered
-    positions[:, 2] += FORMATION_CENTER[2]  # Z centered
+    # Sample the requested number of drones and place them in the Y-Z plane
+    # (X=0 for all points); grid already has MIN_SEPARATION spacing
+    positions = _sample_flat_formation(y_inside, z_inside, num_drones)
     
     # All drones are gold
-    colors = np.tile(STAR_COLOR, (len(positions), 1))
+    colors = _solid_colors(STAR_COLOR, len(positions))
     
     return positions, colors
 
 
+# Bernstein bases for sampling Bezier curves at fixed parameter steps
+_QUAD_T = np.linspace(0, 1, 10)
+_QUAD_BASIS = np.stack([(1 - _QUAD_T)**2, 2 * (1 - _QUAD_T) * _QUAD_T, _QUAD_T**2], axis=-1)
+_CUBIC_T = np.linspace(0, 1, 15)
+_CUBIC_BASIS = np.stack([
+    (1 - _CUBIC_T)**3, 3 * (1 - _CUBIC_T)**2 * _CUBIC_T,
+    3 * (1 - _CUBIC_T) * _CUBIC_T**2, _CUBIC_T**3
+], axis=-1)
+
+
+# Shared result for text without an outline, read-only like the others
+_EMPTY_OUTLINE = np.empty((0, 2))
+_EMPTY_OUTLINE.flags.writeable = False
+
+
+@lru_cache(maxsize=None)
 def sample_text_outline(text, height=8.0, sample_interval=0.15):
     """
     Convert text to outline points using matplotlib.
     
+    Results are memoized, since scenes reuse the same strings (e.g. "I",
+    "VIETNAM"). Every call with the same arguments returns the same array,
+    so it is read-only; callers that need to modify the points must copy
+    them first.
+    
     Args:
         text: String to render
         height: Height of text in meters
         sample_interval: Distance between sampled points in meters
     
     Returns:
-        points: List of (x, y) coordinates
+        points: Read-only numpy array of shape (M, 2) with (x, y)
+                coordinates; M is 0 when the text has no outline
     """
     # Use bold sans-serif font
     fp = FontProperties(family='sans-serif', weight='bold')
@@ -246,7 +414,7 @@ def sample_text_outline(text, height=8.0, sample_interval=0.15):
     codes = path.codes
     
     if len(vertices) == 0:
-        return np.array([])
+        return _EMPTY_OUTLINE
     
     # Scale to desired height
     y_min, y_max = vertices[:, 1].min(), vertices[:, 1].max()
@@ -258,56 +426,71 @@ def sample_text_outline(text, height=8.0, sample_interval=0.15):
     
     vertices = vertices * scale_factor
     
-    # Sample points along the path
-    sampled_points = []
-    
-    current_point = None
-    for i, (vertex, code) in enumerate(zip(vertices, codes)):
-        if code == 1:  # MOVETO
-            current_point = vertex
-        elif code == 2:  # LINETO
-            if current_point is not None:
-                # Sample along line segment
-                start = current_point
-                end = vertex
-                distance = np.linalg.norm(end - start)
-                num_samples = max(2, int(distance / sample_interval))
-                
-                for t in np.linspace(0, 1, num_samples):
-                    point = start + t * (end - start)
-                    sampled_points.append(point)
-                
-                current_point = vertex
-        elif code == 3:  # CURVE3 (quadratic bezier)
-            # Simple approximation: sample along control polygon
-            if current_point is not None and i + 1 < len(vertices):
-                control = vertex
-                end = vertices[i + 1]
-                
-                # Sample bezier curve
-                for t in np.linspace(0, 1, 10):
-                    point = (1-t)**2 * current_point + 2*(1-t)*t * control + t**2 * end
-                    sampled_points.append(point)
-                
-                current_point = end
-        elif code == 4:  # CURVE4 (cubic bezier)
-            # Simple approximation
-            if current_point is not None and i + 2 < len(vertices):
-                control1 = vertex
-                control2 = vertices[i + 1]
-                end = vertices[i + 2]
-                
-                for t in np.linspace(0, 1, 15):
-                    point = (1-t)**3 * current_point + 3*(1-t)**2*t * control1 + \
-                            3*(1-t)*t**2 * control2 + t**3 * end
-                    sampled_points.append(point)
-                
-                current_point = end
-    
-    if len(sampled_points) == 0:
-        return np.array([])
-    
-    return np.array(sampled_points)
+    # Sample points along the path. Each vertex emits samples from the
+    # current point; resolve the current point before every vertex first,
+    # then evaluate all segments of each kind at once.
+    num_vertices = len(vertices)
+    index = np.arange(num_vertices)
+    is_move = codes == 1
+    started = np.cumsum(is_move) > 0  # A MOVETO has set the current point
+    active = np.zeros(num_vertices, dtype=bool)
+    active[1:] = started[:-1]
+    
+    is_line = (codes == 2) & active
+    is_quad = (codes == 3) & active & (index + 1 < num_vertices)
+    is_cubic = (codes == 4) & active & (index + 2 < num_vertices)
+    
+    # Vertex that becomes the current point after each vertex (-1: unchanged)
+    becomes = np.full(num_vertices, -1)
+    becomes[is_move | is_line] = index[is_move | is_line]
+    becomes[is_quad] = index[is_quad] + 1
+    becomes[is_cubic] = index[is_cubic] + 2
+    last_set = np.maximum.accumulate(np.where(becomes >= 0, index, -1))
+    current_after = np.where(last_set >= 0, becomes[np.maximum(last_set, 0)], -1)
+    current = np.empty(num_vertices, dtype=int)
+    current[0] = -1
+    current[1:] = current_after[:-1]
+    
+    # Number of samples emitted by each vertex, laid out in vertex order
+    line_idx = np.flatnonzero(is_line)
+    line_start = vertices[current[line_idx]]
+    line_delta = vertices[line_idx] - line_start
+    line_counts = np.maximum(
+        2, (np.linalg.norm(line_delta, axis=1) / sample_interval).astype(int)
+    )
+    counts = np.zeros(num_vertices, dtype=int)
+    counts[line_idx] = line_counts
+    counts[is_quad] = len(_QUAD_BASIS)
+    counts[is_cubic] = len(_CUBIC_BASIS)
+    offsets = np.cumsum(counts) - counts
+    
+    if counts.sum() == 0:
+        return _EMPTY_OUTLINE
+    sampled_points = np.empty((counts.sum(), 2))
+    
+    # Lines: start + t * (end - start) with t = linspace(0, 1, n) per segment
+    segment = np.repeat(np.arange(len(line_idx)), line_counts)
+    step = np.arange(len(segment)) - (np.cumsum(line_counts) - line_counts)[segment]
+    t = step / (line_counts[segment] - 1)
+    sampled_points[offsets[line_idx][segment] + step] = \
+        line_start[segment] + t[:, None] * line_delta[segment]
+    
+    # Quadratic and cubic Bezier curves: one basis product per curve kind
+    for mask, basis in ((is_quad, _QUAD_BASIS), (is_cubic, _CUBIC_BASIS)):
+        curve_idx = np.flatnonzero(mask)
+        if len(curve_idx) == 0:
+            continue
+        controls = np.stack(
+            [vertices[current[curve_idx]]] +
+            [vertices[curve_idx + k] for k in range(basis.shape[1] - 1)],
+            axis=1
+        )
+        samples = np.einsum('tk,nkd->ntd', basis, controls)
+        rows = offsets[curve_idx][:, None] + np.arange(len(basis))
+        sampled_points[rows.ravel()] = samples.reshape(-1, 2)
+    
+    sampled_points.flags.writeable = False
+    return sampled_points
 
 
 def generate_text_formation(text, num_drones, color_top, color_bottom):
@@ -329,7 +512,7 @@ def generate_text_formation(text, num_drones, color_top, color_bottom):
     
     if len(outline_points) == 0:
         # Fallback: return empty formation
-        return np.zeros((0, 3)), np.zeros((0, 3))
+        return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)
     
     # Adjust number of points to match num_drones
     num_outline_points = len(outline_points)
@@ -341,21 +524,19 @@ def generate_text_formation(text, num_drones, color_top, color_bottom):
     elif num_outline_points < num_drones:
         # Upsample by duplicating nearby points with small offsets
         extra_needed = num_drones - num_outline_points
-        extra_points = []
-        for _ in range(extra_needed):
-            idx = np.random.randint(0, num_outline_points)
-            point = outline_points[idx].copy()
-            # Add small random offset
-            point += np.random.uniform(-0.1, 0.1, 2)
-            extra_points.append(point)
-        outline_points = np.vstack([outline_points, extra_points])
+        upsampled = np.empty((num_drones, 2))
+        upsampled[:num_outline_points] = outline_points
+        idx = _rng.integers(0, num_outline_points, extra_needed)
+        # Add small random offset
+        upsampled[num_outline_points:] = outline_points[idx] + _rng.uniform(-0.1, 0.1, (extra_needed, 2))
+        outline_points = upsampled
     
     # Convert 2D points to 3D (place in Y-Z plane)
     # Center the text around the formation center
     text_center_x = (outline_points[:, 0].min() + outline_points[:, 0].max()) / 2
     text_center_y = (outline_points[:, 1].min() + outline_points[:, 1].max()) / 2
     
-    positions = np.zeros((len(outline_points), 3))
+    positions = np.zeros((len(outline_points), 3), dtype=np.float32)
     positions[:, 0] = FORMATION_CENTER[0]  # X at center
     positions[:, 1] = outline_points[:, 0] - text_center_x + FORMATION_CENTER[1]  # Y centered
     positions[:, 2] = outline_points[:, 1] - text_center_y + FORMATION_CENTER[2]  # Z centered
@@ -364,19 +545,15 @@ def generate_text_formation(text, num_drones, color_top, color_bottom):
     z_values = positions[:, 2]
     z_min, z_max = z_values.min(), z_values.max()
     
-    colors = np.zeros((len(positions), 3))
-    for i, z in enumerate(z_values):
-        if z_max > z_min:
-            t = (z - z_min) / (z_max - z_min)
-        else:
-            t = 0.5
-        
-        # Interpolate from bottom color to top color
-        colors[i] = [
-            color_bottom[0] + t * (color_top[0] - color_bottom[0]),
-            color_bottom[1] + t * (color_top[1] - color_bottom[1]),
-            color_bottom[2] + t * (color_top[2] - color_bottom[2])
-        ]
+    if z_max > z_min:
+        t = (z_values - z_min) / (z_max - z_min)
+    else:
+        t = np.full(len(z_values), 0.5, dtype=np.float32)
+    
+    # Interpolate from bottom color to top color for all drones at once
+    color_bottom = np.asarray(color_bottom, dtype=np.float32)
+    color_top = np.asarray(color_top, dtype=np.float32)
+    colors = color_bottom + t[:, None] * (color_top - color_bottom)
     
     return positions, colors
 
@@ -392,12 +569,10 @@ def generate_simple_heart_emoji(num_drones=100):
         positions: numpy array of shape (num_drones, 3)
         colors: numpy array of shape (num_drones, 3)
     """
-    # Parametric heart in 2D
+    # Parametric heart in 2D, resampled from the precomputed master curve
     t = np.linspace(0, 2 * np.pi, num_drones)
-    
-    # Heart parametric equations (simplified 2D)
-    x = 16 * np.sin(t)**3
-    y = 13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t)
+    x = np.interp(t, _HEART_MASTER_T, _HEART_MASTER_Y)
+    y = np.interp(t, _HEART_MASTER_T, _HEART_MASTER_Z)
     
     # Scale to appropriate size (about 4 meters)
     scale = 4.0 / 32.0
@@ -405,13 +580,13 @@ def generate_simple_heart_emoji(num_drones=100):
     y = y * scale
     
     # Convert to 3D
-    positions = np.zeros((num_drones, 3))
+    positions = np.zeros((num_drones, 3), dtype=np.float32)
     positions[:, 0] = FORMATION_CENTER[0]
     positions[:, 1] = x + FORMATION_CENTER[1]
     positions[:, 2] = y + FORMATION_CENTER[2]
     
     # All white
-    colors = np.tile(WHITE_COLOR, (num_drones, 1))
+    colors = _solid_colors(WHITE_COLOR, num_drones)
     
     return positions, colors
 
@@ -467,26 +642,33 @@ def generate_combined_text_formation(prefix, text_body, emoji_drones=100,
                   COMBINED_TEXT_SPACING + text_width
     start_y = FORMATION_CENTER[1] - total_width / 2
     
+    # Allocate the combined formation once; each part is written into its
+    # own slice: prefix, then emoji, then main text
+    num_prefix = len(prefix_points)
+    emoji_end = num_prefix + len(emoji_pos)
+    total = emoji_end + len(text_pos)
+    all_positions = np.empty((total, 3), dtype=np.float32)
+    all_colors = np.empty((total, 3), dtype=np.float32)
+    
     # Position prefix
-    prefix_positions = np.zeros((len(prefix_points), 3))
+    prefix_positions = all_positions[:num_prefix]
     prefix_positions[:, 0] = FORMATION_CENTER[0]
     prefix_positions[:, 1] = prefix_points[:, 0] + start_y + prefix_width/2
     prefix_positions[:, 2] = prefix_points[:, 1] + FORMATION_CENTER[2]
-    prefix_colors = np.tile(WHITE_COLOR, (len(prefix_points), 1))
+    all_colors[:num_prefix] = WHITE_COLOR
     
     # Position emoji
     emoji_offset_y = start_y + prefix_width + COMBINED_TEXT_SPACING + emoji_width/2
-    emoji_pos[:, 1] = emoji_pos[:, 1] - FORMATION_CENTER[1] + emoji_offset_y
+    all_positions[num_prefix:emoji_end] = emoji_pos
+    all_positions[num_prefix:emoji_end, 1] += emoji_offset_y - FORMATION_CENTER[1]
+    all_colors[num_prefix:emoji_end] = emoji_colors
     
     # Position main text
     text_offset_y = start_y + prefix_width + COMBINED_TEXT_SPACING + \
                     emoji_width + COMBINED_TEXT_SPACING + text_width/2
-    if len(text_pos) > 0:
-        text_pos[:, 1] = text_pos[:, 1] - FORMATION_CENTER[1] + text_offset_y
-    
-    # Combine all
-    all_positions = np.vstack([prefix_positions, emoji_pos, text_pos])
-    all_colors = np.vstack([prefix_colors, emoji_colors, text_colors])
+    all_positions[emoji_end:] = text_pos
+    all_positions[emoji_end:, 1] += text_offset_y - FORMATION_CENTER[1]
+    all_colors[emoji_end:] = text_colors
     
     return all_positions, all_colors
 
@@ -506,29 +688,22 @@ def generate_parking_grid(num_drones=1000, used_drones=0):
     parked_drones = num_drones - used_drones
     
     if parked_drones <= 0:
-        return np.zeros((0, 3)), np.zeros((0, 3))
+        return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.float32)
     
     # Calculate grid dimensions
-    grid_cols = int(np.ceil(np.sqrt(parked_drones)))
-    grid_rows = int(np.ceil(parked_drones / grid_cols))
-    
-    # Generate grid positions
-    positions = []
-    for row in range(grid_rows):
-        for col in range(grid_cols):
-            if len(positions) >= parked_drones:
-                break
-            
-            x = (col - grid_cols/2) * PARKING_SPACING
-            y = (row - grid_rows/2) * PARKING_SPACING
-            z = PARKING_Z
-            
-            positions.append([x, y, z])
-    
-    positions = np.array(positions[:parked_drones])
+    grid_cols = isqrt(parked_drones - 1) + 1  # ceil(sqrt(n)) in exact integers
+    grid_rows = -(-parked_drones // grid_cols)
+    
+    # Generate grid positions row by row, keeping the first parked_drones cells
+    rows, cols = np.mgrid[0:grid_rows, 0:grid_cols]
+    positions = np.column_stack([
+        (cols.ravel() - grid_cols/2) * PARKING_SPACING,
+        (rows.ravel() - grid_rows/2) * PARKING_SPACING,
+        np.full(grid_rows * grid_cols, float(PARKING_Z))
+    ])[:parked_drones].astype(np.float32)
     
     # All lights off (black color)
-    colors = np.zeros((parked_drones, 3))
+    colors = _solid_colors((0.0, 0.0, 0.0), parked_drones)
     
     return positions, colors
 
@@ -6,10 +6,17 @@ Main script to orchestrate and render the complete drone show.
 import os
 import sys
 import argparse
-import logging
+import multiprocessing
+import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')  # Frames are rendered offscreen and piped to ffmpeg
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
+from matplotlib.collections import PathCollection
+from matplotlib.markers import MarkerStyle
 from mpl_toolkits.mplot3d import Axes3D
 
 try:
@@ -17,8 +24,18 @@ try:
 except ImportError:
     tqdm = None
 
+try:
+    import imageio_ffmpeg
+except ImportError:
+    imageio_ffmpeg = None
+
+try:
+    from vispy import scene as vispy_scene
+except ImportError:
+    vispy_scene = None
+
 from config.drone_config import (
-    TOTAL_DRONES, FPS, VIDEO_RESOLUTION, VIDEO_BITRATE,
+    TOTAL_DRONES, FPS, VIDEO_RESOLUTION, VIDEO_BITRATE, VIDEO_CODEC,
     BACKGROUND_COLOR, SPACE_WIDTH, SPACE_HEIGHT
 )
 from core.drone_system import DroneSystem
@@ -27,12 +44,340 @@ from core.camera_controller import CameraController
 from core.path_exporter import PathExporter
 
 
+# Largest lit drone movement (m) between frames still drawn as the same
+# image; far below a pixel at 4K
+STATIC_FRAME_TOLERANCE = 0.01
+
+# Resolution of the matplotlib figure; VIDEO_RESOLUTION is in pixels
+FIGURE_DPI = 100
+
+
+def open_video_pipe(output_path, width, height, fps):
+    """
+    Start an ffmpeg process that encodes raw RGBA frames written to its stdin.
+    
+    Uses the ffmpeg binary bundled with imageio-ffmpeg when it is installed,
+    otherwise the one matplotlib is configured to use.
+    
+    Args:
+        output_path: Path to the output video
+        width, height: Frame size in pixels
+        fps: Frames per second
+    
+    Returns:
+        subprocess.Popen with a writable stdin
+    """
+    if imageio_ffmpeg is not None:
+        ffmpeg = imageio_ffmpeg.get_ffmpeg_exe()
+    else:
+        ffmpeg = mpl.rcParams['animation.ffmpeg_path']
+    
+    command = [
+        ffmpeg, '-y', '-loglevel', 'error',
+        '-f', 'rawvideo', '-vcodec', 'rawvideo',
+        '-s', f'{width}x{height}', '-pix_fmt', 'rgba', '-r', str(fps),
+        '-i', '-',
+        '-vcodec', VIDEO_CODEC, '-pix_fmt', 'yuv420p', '-b:v', f'{VIDEO_BITRATE}k',
+        '-metadata', 'title=Drone Show Simulation',
+        output_path
+    ]
+    return subprocess.Popen(command, stdin=subprocess.PIPE)
+
+
+class FrameRenderer:
+    """
+    Draws drone frames offscreen onto its own matplotlib figure.
+    
+    Holds no simulation state, so render worker processes can each own one.
+    """
+    
+    def __init__(self):
+        """Initialize the figure, camera and scatter."""
+        self.camera_controller = CameraController()
+        self._background = None  # Cached canvas pixels behind the scatter
+        self._setup_figure()
+    
+    def _setup_figure(self):
+        """Setup matplotlib figure and axes."""
+        # Calculate figure size for 4K resolution
+        width_inch = VIDEO_RESOLUTION[0] / FIGURE_DPI
+        height_inch = VIDEO_RESOLUTION[1] / FIGURE_DPI
+        
+        self.fig = plt.figure(figsize=(width_inch, height_inch), dpi=FIGURE_DPI)
+        self.ax = self.fig.add_subplot(111, projection='3d')
+        
+        # Set background color
+        self.fig.patch.set_facecolor('black')
+        self.ax.set_facecolor('black')
+        
+        # Remove axes
+        self.ax.set_axis_off()
+        
+        # Set initial limits
+        self.ax.set_xlim(-SPACE_WIDTH/2, SPACE_WIDTH/2)
+        self.ax.set_ylim(-SPACE_WIDTH/2, SPACE_WIDTH/2)
+        self.ax.set_zlim(0, SPACE_HEIGHT)
+        
+        # Camera framing is constant, so apply it once here
+        self.camera_controller.setup_axes(self.ax)
+        
+        # Initial scatter plot (will be updated). It is the only artist that
+        # changes between frames; the axes are off and the background is
+        # plain black, so it is blitted over a cached background.
+        # Drones are projected to the 3D axes' 2D plane by _update_scatter,
+        # so this is a plain 2D collection drawn with the axes' transform.
+        # It is not added to the axes (Axes3D.draw would try to project it),
+        # so the background draw leaves it out.
+        marker = MarkerStyle('o')
+        self.scatter = PathCollection(
+            (marker.get_path().transformed(marker.get_transform()),),
+            sizes=(10,),
+            offsets=np.empty((0, 2)),
+            offset_transform=self.ax.transData,
+            edgecolors='face'
+        )
+        self.scatter.set_figure(self.fig)
+        self.scatter.set_clip_path(self.ax.patch)
+        self._proj_view = None
+        self._proj = None
+        
+        # The collection's own offset array, written in place each frame, and
+        # a reusable face color buffer handed to set_facecolor (see
+        # _update_scatter)
+        self._offsets = None
+        self._rgba = None
+    
+    def _update_scatter(self, positions, colors):
+        """
+        Project drone positions with the current view and update the scatter.
+        
+        Matches Axes3D scatter rendering (alpha 0.9, far drones drawn first
+        and shaded darker) with one matrix product per frame; the projection
+        matrix is only rebuilt when the camera view changes. Offsets are
+        written straight into the collection's array. Colors go through
+        set_facecolor every frame: the first draw rebinds the collection's
+        face color array (update_scalarmappable), so writes into an array
+        taken before it would never reach the screen.
+        
+        Args:
+            positions: numpy array of shape (N, 3)
+            colors: numpy array of shape (N, 3) with RGB values (0-1)
+        """
+        view = (self.ax.elev, self.ax.azim, self.ax.roll)
+        if view != self._proj_view:
+            self._proj = self.ax.get_proj()
+            self._proj_view = view
+        
+        # Homogeneous projection: [x y z 1] @ M.T, then divide by w
+        projected = positions @ self._proj[:, :3].T + self._proj[:, 3]
+        projected[:, :3] /= projected[:, 3:]
+        depth = projected[:, 2]
+        order = np.argsort(depth)[::-1]
+        
+        # Adopt the offset array the setter allocates once; edges follow the faces
+        if self._rgba is None or len(self._rgba) != len(positions):
+            self.scatter.set_offsets(np.zeros((len(positions), 2)))
+            self._offsets = self.scatter.get_offsets()
+            self._rgba = np.empty((len(positions), 4))
+        
+        np.take(projected[:, :2], order, axis=0, out=self._offsets)
+        self._rgba[:, :3] = colors[order]
+        
+        # Depth shading: alpha fades to 30% towards the far end
+        self._rgba[:, 3] = 0.9
+        if len(depth) and depth.max() > depth.min():
+            self._rgba[:, 3] *= 1 - 0.7 * (depth[order] - depth.min()) / (depth.max() - depth.min())
+        self.scatter.set_facecolor(self._rgba)
+    
+    @staticmethod
+    def frame_size():
+        """
+        Size of the rendered frames, without creating a figure.
+        
+        Returns:
+            (width, height) in pixels, as the Agg canvas truncates them
+        """
+        return (int(VIDEO_RESOLUTION[0] / FIGURE_DPI * FIGURE_DPI),
+                int(VIDEO_RESOLUTION[1] / FIGURE_DPI * FIGURE_DPI))
+    
+    def init_frame(self):
+        """
+        Draw the static background once and cache it for blitting.
+        
+        Returns:
+            (width, height) of the rendered frames in pixels
+        """
+        self.camera_controller.update_axes(self.ax, 0.0)
+        self.fig.canvas.draw()  # The scatter is not part of the axes
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        height, width = np.asarray(self.fig.canvas.buffer_rgba()).shape[:2]
+        return width, height
+    
+    def draw(self, positions, colors, time):
+        """
+        Draw one frame over the cached background.
+        
+        Requires init_frame to have been called.
+        
+        Args:
+            positions: numpy array of shape (N, 3)
+            colors: numpy array of shape (N, 3) with RGB values (0-1)
+            time: Show time in seconds (for the camera)
+        
+        Returns:
+            RGBA pixel buffer of the canvas, valid until the next frame
+        """
+        # Update camera, then the scatter projected through it
+        self.camera_controller.update_axes(self.ax, time)
+        self._update_scatter(positions, colors)
+        
+        canvas = self.fig.canvas
+        canvas.restore_region(self._background)
+        self.ax.draw_artist(self.scatter)
+        return canvas.buffer_rgba()
+    
+    def close(self):
+        """Release the figure."""
+        plt.close(self.fig)
+
+
+class VispyFrameRenderer:
+    """
+    Draws drone frames offscreen with vispy, rasterizing on the GPU.
+    
+    Same interface as FrameRenderer. The camera follows CameraController;
+    perspective and marker size approximate the matplotlib rendering.
+    """
+    
+    def __init__(self):
+        """Initialize the canvas, camera and markers."""
+        self.camera_controller = CameraController()
+        self.canvas = vispy_scene.SceneCanvas(
+            size=VIDEO_RESOLUTION,
+            bgcolor=tuple(c / 255 for c in BACKGROUND_COLOR),
+            show=False
+        )
+        self.view = self.canvas.central_widget.add_view()
+        self.view.camera = vispy_scene.TurntableCamera(
+            fov=self.camera_controller.fov,
+            center=tuple(self.camera_controller.target)
+        )
+        self.markers = vispy_scene.visuals.Markers(parent=self.view.scene)
+        self._rgba = None
+    
+    @staticmethod
+    def frame_size():
+        """
+        Size of the rendered frames, without creating a canvas.
+        
+        Returns:
+            (width, height) in pixels
+        """
+        return VIDEO_RESOLUTION
+    
+    def init_frame(self):
+        """
+        Set up the first frame.
+        
+        Returns:
+            (width, height) of the rendered frames in pixels
+        """
+        self._update_camera(0.0)
+        return VIDEO_RESOLUTION
+    
+    def _update_camera(self, time):
+        """
+        Point the camera as CameraController does for the matplotlib axes.
+        
+        Args:
+            time: Show time in seconds
+        """
+        elevation, azimuth = self.camera_controller.get_view_angles(time)
+        position = np.asarray(self.camera_controller.get_position(time))
+        camera = self.view.camera
+        camera.elevation = elevation
+        # matplotlib azimuth 0 looks from +X; vispy azimuth 0 looks from -Y
+        camera.azimuth = azimuth + 90
+        camera.distance = float(np.linalg.norm(position - self.camera_controller.target))
+    
+    def draw(self, positions, colors, time):
+        """
+        Draw one frame.
+        
+        Args:
+            positions: numpy array of shape (N, 3)
+            colors: numpy array of shape (N, 3) with RGB values (0-1)
+            time: Show time in seconds (for the camera)
+        
+        Returns:
+            RGBA pixel array of shape (height, width, 4)
+        """
+        self._update_camera(time)
+        
+        if self._rgba is None or len(self._rgba) != len(colors):
+            self._rgba = np.empty((len(colors), 4), dtype=np.float32)
+            self._rgba[:, 3] = 0.9
+        self._rgba[:, :3] = colors
+        
+        self.markers.set_data(positions, face_color=self._rgba, edge_width=0, size=4)
+        return self.canvas.render(alpha=True)
+    
+    def close(self):
+        """Release the canvas."""
+        self.canvas.close()
+
+
+# Frame renderers selectable with --backend
+RENDER_BACKENDS = {
+    'matplotlib': FrameRenderer,
+    'vispy': VispyFrameRenderer,
+}
+
+
+# Per-process state of render workers (see DroneShowRenderer.render)
+_worker_renderer = None
+_worker_states = None
+
+
+def _init_render_worker(positions_path, colors_path, fps, backend='matplotlib'):
+    """
+    Set up a render worker process with its own figure.
+    
+    Args:
+        positions_path, colors_path: .npy files with the simulated states
+        fps: Frames per second
+        backend: Frame renderer, a key of RENDER_BACKENDS
+    """
+    global _worker_renderer, _worker_states
+    _worker_states = (
+        np.load(positions_path, mmap_mode='r'),
+        np.load(colors_path, mmap_mode='r'),
+        fps
+    )
+    _worker_renderer = RENDER_BACKENDS[backend]()
+    _worker_renderer.init_frame()
+
+
+def _render_worker_frame(frame):
+    """
+    Render one simulated frame in a worker process.
+    
+    Args:
+        frame: Frame number
+    
+    Returns:
+        RGBA pixel bytes
+    """
+    positions, colors, fps = _worker_states
+    return bytes(_worker_renderer.draw(positions[frame], colors[frame], frame / fps))
+
+
 class DroneShowRenderer:
     """
     Renders the complete drone show animation.
     """
     
-    def __init__(self, mode='testing', fps=FPS, export_paths=False):
+    def __init__(self, mode='testing', fps=FPS, export_paths=False, backend='matplotlib'):
         """
         Initialize the drone show renderer.
         
@@ -40,16 +385,20 @@ class DroneShowRenderer:
             mode: 'testing' or 'production'
             fps: Frames per second
             export_paths: Whether to export flight paths
+            backend: Frame renderer, a key of RENDER_BACKENDS
         """
+        if backend == 'vispy' and vispy_scene is None:
+            raise RuntimeError("The vispy backend requires vispy (pip install vispy)")
+        
         self.mode = mode
         self.fps = fps
         self.export_paths = export_paths
+        self.backend = backend
         
         # Initialize components
         print(f"Initializing drone show ({mode} mode)...")
         self.drone_system = DroneSystem(TOTAL_DRONES)
         self.scene_controller = SceneController(mode, fps)
-        self.camera_controller = CameraController()
         
         if export_paths:
             self.path_exporter = PathExporter(self.drone_system, fps)
@@ -64,48 +413,33 @@ class DroneShowRenderer:
         print(f"  Total frames: {self.total_frames}")
         print(f"  FPS: {fps}")
         
-        # Setup figure
-        self._setup_figure()
-    
-    def _setup_figure(self):
-        """Setup matplotlib figure and axes."""
-        # Calculate figure size for 4K resolution
-        width_inch = VIDEO_RESOLUTION[0] / 100
-        height_inch = VIDEO_RESOLUTION[1] / 100
-        
-        self.fig = plt.figure(figsize=(width_inch, height_inch), dpi=100)
-        self.ax = self.fig.add_subplot(111, projection='3d')
-        
-        # Set background color
-        self.fig.patch.set_facecolor('black')
-        self.ax.set_facecolor('black')
-        
-        # Remove axes
-        self.ax.set_axis_off()
-        
-        # Set initial limits
-        self.ax.set_xlim(-SPACE_WIDTH/2, SPACE_WIDTH/2)
-        self.ax.set_ylim(-SPACE_WIDTH/2, SPACE_WIDTH/2)
-        self.ax.set_zlim(0, SPACE_HEIGHT)
-        
-        # Initial scatter plot (will be updated)
-        self.scatter = self.ax.scatter([], [], [], s=10, c=[], alpha=0.9)
+        # Formations for every frame, and the simulated drone states staged
+        # from them, both filled by precompute_all_frames()
+        self.timeline = None
+        self.pos_buf = None
+        self.col_buf = None
+        self.static_frames = None
+        self.frame_renderer = None  # Created by render() when drawing here
     
     def update_frame(self, frame):
         """
-        Update animation for given frame.
+        Advance the simulation to the given frame.
         
         Args:
             frame: Frame number
         
         Returns:
-            Modified artists
+            positions: Live view of the drone positions, shape (N, 3)
+            colors: Normalized RGB colors (0-1), reused on the next call
         """
         # Calculate current time
         time = frame / self.fps
         
         # Get formation at this time
-        positions, colors = self.scene_controller.get_formation_at_time(time)
+        if self.timeline is not None:
+            positions, colors = self.timeline[0][frame], self.timeline[1][frame]
+        else:
+            positions, colors = self.scene_controller.get_formation_at_time(time)
         
         # Update drone system targets
         self.drone_system.set_formation(positions, colors)
@@ -114,33 +448,95 @@ class DroneShowRenderer:
         dt = 1.0 / self.fps
         self.drone_system.update(dt)
         
-        # Get current positions and colors
-        current_positions = self.drone_system.get_positions()
-        current_colors = self.drone_system.get_colors_normalized()
-        
-        # Update scatter plot
-        self.scatter._offsets3d = (
-            current_positions[:, 0],
-            current_positions[:, 1],
-            current_positions[:, 2]
-        )
-        self.scatter.set_color(current_colors)
-        
-        # Update camera
-        self.camera_controller.apply_to_axes(self.ax, time)
-        
         # Record for path export if enabled
         if self.path_exporter:
             self.path_exporter.record_frame(time)
         
-        return self.scatter,
+        # Get current positions and colors
+        return self.drone_system.get_positions(), self.drone_system.get_colors_normalized()
+    
+    def precompute_all_frames(self, directory):
+        """
+        Simulate the whole show once into contiguous memory-mapped buffers.
+        
+        Formations come from the scene timeline in one batched pass; physics
+        and path recording then step through every frame, so rendering only
+        has to index self.pos_buf / self.col_buf.
+        
+        Frames where nothing visibly changes since the last drawn frame are
+        flagged in self.static_frames so the renderer can emit the previous
+        pixels again. Dark drones are invisible against the black background
+        and are ignored, so this covers the blackouts; lit drones keep
+        drifting around their targets and are always redrawn.
+        
+        Args:
+            directory: Directory for the positions.npy and colors.npy files
+        
+        Returns:
+            (positions_path, colors_path)
+        """
+        # Precompute every frame's formation instead of querying per frame
+        self.timeline = self.scene_controller.render_timeline()
+        
+        positions_path = os.path.join(directory, 'positions.npy')
+        colors_path = os.path.join(directory, 'colors.npy')
+        shape = (self.total_frames, TOTAL_DRONES, 3)
+        self.pos_buf = np.lib.format.open_memmap(positions_path, 'w+', np.float32, shape)
+        self.col_buf = np.lib.format.open_memmap(colors_path, 'w+', np.float32, shape)
+        
+        self.static_frames = np.zeros(self.total_frames, dtype=bool)
+        camera = CameraController()
+        drawn = 0  # Last frame that will actually be drawn
+        
+        for frame in range(self.total_frames):
+            positions, colors = self.update_frame(frame)
+            self.pos_buf[frame], self.col_buf[frame] = positions, colors
+            
+            # Compare against the last drawn frame, not the previous one, so
+            # slow drift still accumulates into a redraw. Equal colors also
+            # mean the same drones are lit.
+            lit = self.col_buf[frame].any(axis=1)
+            if frame and (
+                camera.get_view_angles(frame / self.fps) == camera.get_view_angles(drawn / self.fps)
+                and np.array_equal(self.col_buf[frame], self.col_buf[drawn])
+                and not (np.abs(positions[lit] - self.pos_buf[drawn][lit]) >= STATIC_FRAME_TOLERANCE).any()
+            ):
+                self.static_frames[frame] = True
+            else:
+                drawn = frame
+        self.pos_buf.flush()
+        self.col_buf.flush()
+        
+        # Formations are no longer needed once the drone states are staged
+        self.timeline = None
+        return positions_path, colors_path
+    
+    def render_frame(self, frame):
+        """
+        Draw one precomputed frame in this process.
+        
+        Args:
+            frame: Frame number
+        
+        Returns:
+            RGBA pixel buffer of the canvas, valid until the next frame
+        """
+        return self.frame_renderer.draw(
+            self.pos_buf[frame], self.col_buf[frame], frame / self.fps
+        )
     
-    def render(self, output_path='outputs/drone_show.mp4'):
+    def render(self, output_path='outputs/drone_show.mp4', workers=None):
         """
         Render the complete animation to video.
         
+        The show is simulated up front by precompute_all_frames; the frames
+        are then independent and are drawn here or by a pool of processes,
+        and piped to ffmpeg in order.
+        
         Args:
             output_path: Path to save the video
+            workers: Number of render processes (default: CPU count);
+                     1 draws every frame in this process
         """
         print(f"\nRendering drone show to {output_path}...")
         print("This may take several minutes...\n")
@@ -148,62 +544,56 @@ class DroneShowRenderer:
         # Ensure output directory exists
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Create progress bar with proper configuration
-        if tqdm:
-            # Configure tqdm to stay on one line
-            pbar = tqdm(
-                total=self.total_frames,
-                desc="Rendering",
-                unit="frame",
-                dynamic_ncols=True,
-                leave=True,
-                position=0,
-                file=None  # Use default (sys.stderr)
-            )
+        workers = workers or os.cpu_count() or 1
+        if self.backend == 'vispy':
+            # The GPU already rasterizes in parallel; one GL context suffices
+            workers = 1
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_paths = self.precompute_all_frames(tmpdir)
             
-            # Wrap update function
-            original_update = self.update_frame
-            def update_with_progress(frame):
-                result = original_update(frame)
-                pbar.update(1)
-                return result
+            frames = range(self.total_frames)
+            if tqdm:
+                # Configure tqdm to stay on one line
+                frames = tqdm(
+                    frames,
+                    desc="Rendering",
+                    unit="frame",
+                    dynamic_ncols=True,
+                    leave=True,
+                    position=0,
+                    file=None  # Use default (sys.stderr)
+                )
             
-            update_func = update_with_progress
-        else:
-            update_func = self.update_frame
-        
-        # Create animation
-        anim = FuncAnimation(
-            self.fig,
-            update_func,
-            frames=self.total_frames,
-            interval=1000/self.fps,
-            blit=False
-        )
-        
-        # Save animation with minimal verbosity
-        writer = FFMpegWriter(
-            fps=self.fps,
-            bitrate=VIDEO_BITRATE,
-            metadata={'title': 'Drone Show Simulation'}
-        )
-        
-        # Suppress matplotlib logging during save
-        matplotlib_logger = logging.getLogger('matplotlib')
-        animation_logger = logging.getLogger('matplotlib.animation')
-        original_mpl_level = matplotlib_logger.level
-        original_anim_level = animation_logger.level
-        matplotlib_logger.setLevel(logging.WARNING)
-        animation_logger.setLevel(logging.WARNING)
-        
-        try:
-            anim.save(output_path, writer=writer)
-        finally:
-            matplotlib_logger.setLevel(original_mpl_level)
-            animation_logger.setLevel(original_anim_level)
-        
-        if tqdm:
-            pbar.close()
+            # Frames are blitted onto a canvas and piped to ffmpeg as raw
+            # pixels, without a full figure redraw or savefig per frame.
+            # With workers, only the worker processes need a renderer.
+            if workers == 1:
+                self.frame_renderer = RENDER_BACKENDS[self.backend]()
+                width, height = self.frame_renderer.init_frame()
+            else:
+                width, height = RENDER_BACKENDS[self.backend].frame_size()
+            video = open_video_pipe(output_path, width, height, self.fps)
+            try:
+                if workers == 1:
+                    for frame in frames:
+                        # Static frames reuse the pixels of the last drawn frame
+                        if not self.static_frames[frame]:
+                            pixels = self.render_frame(frame)
+                        video.stdin.write(pixels)
+                else:
+                    self._render_parallel(frames, video, state_paths, workers)
+            finally:
+                video.stdin.close()
+                video.wait()
+                if self.frame_renderer is not None:
+                    self.frame_renderer.close()
+                    self.frame_renderer = None
+                # Release the memmaps before their directory is removed
+                self.pos_buf = self.col_buf = None
+        
+        if video.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with status {video.returncode}")
         
         print(f"\n✓ Animation saved to {output_path}")
         
@@ -212,8 +602,46 @@ class DroneShowRenderer:
             print("\nExporting flight paths...")
             base_path = output_path.replace('.mp4', '_paths')
             self.path_exporter.export_all(base_path)
+    
+    def _render_parallel(self, frames, video, state_paths, workers):
+        """
+        Draw precomputed frames in a process pool and pipe them in order.
         
-        plt.close(self.fig)
+        Args:
+            frames: Iterable of frame numbers (may be a progress bar)
+            video: ffmpeg process reading raw frames on stdin
+            state_paths: (positions_path, colors_path) of the staged states
+            workers: Number of render processes
+        """
+        # Spawn rather than fork: the numba kernels have already started
+        # threads in this process, and forking them deadlocks at exit
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_render_worker,
+            initargs=(*state_paths, self.fps, self.backend)
+        ) as pool:
+            # Bound the frames in flight; each 4K frame is ~33 MB
+            # Static frames are not submitted; None repeats the last pixels
+            pending = deque()
+            pixels = None
+            
+            def write_next():
+                nonlocal pixels
+                future = pending.popleft()
+                if future is not None:
+                    pixels = future.result()
+                video.stdin.write(pixels)
+            
+            for frame in frames:
+                pending.append(
+                    None if self.static_frames[frame]
+                    else pool.submit(_render_worker_frame, frame)
+                )
+                if len(pending) >= 2 * workers:
+                    write_next()
+            while pending:
+                write_next()
     
     def get_scene_info(self):
         """Get information about all scenes."""
@@ -236,6 +664,12 @@ Examples:
   # Export flight paths
   python drone_show.py --export-paths
   
+  # Render frames in 4 processes
+  python drone_show.py --workers 4
+  
+  # Rasterize on the GPU with vispy
+  python drone_show.py --backend vispy
+  
   # Custom output path
   python drone_show.py --output outputs/my_show.mp4
   
@@ -270,6 +704,20 @@ Examples:
         help='Export flight paths to JSON and CSV for real-world operations'
     )
     
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=None,
+        help='Number of processes rendering frames (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=sorted(RENDER_BACKENDS),
+        default='matplotlib',
+        help='Frame renderer: matplotlib (CPU, default) or vispy (OpenGL, GPU)'
+    )
+    
     parser.add_argument(
         '--info',
         action='store_true',
@@ -293,7 +741,8 @@ Examples:
         renderer = DroneShowRenderer(
             mode=args.mode,
             fps=args.fps,
-            export_paths=args.export_paths
+            export_paths=args.export_paths,
+            backend=args.backend
         )
         
         # Show scene info if requested
@@ -308,7 +757,7 @@ Examples:
             return 0
         
         # Render
-        renderer.render(args.output)
+        renderer.render(args.output, workers=args.workers)
         
         print("\n" + "=" * 70)
         print("✓ DRONE SHOW COMPLETE")
@@ -15,7 +15,8 @@ from core.shape_generators import (
     generate_heart_formation,
     generate_star_formation,
     generate_text_formation,
-    enforce_min_separation_2d
+    enforce_min_separation_2d,
+    set_seed
 )
 from config.drone_config import (
     HEART_DRONES, STAR_DRONES, VIETNAM_DRONES,
@@ -52,6 +53,16 @@ class Test2DFormations:
         assert y_range <= 70, f"Heart Y range ({y_range:.1f}m) exceeds expected ~60m"
         assert z_range <= 70, f"Heart Z range ({z_range:.1f}m) exceeds expected ~60m"
     
+    def test_formations_are_reproducible_with_seed(self):
+        """Verify reseeding reproduces the same sampled formation."""
+        set_seed(7)
+        first, _ = generate_heart_formation(HEART_DRONES)
+        set_seed(7)
+        second, _ = generate_heart_formation(HEART_DRONES)
+        
+        assert np.array_equal(first, second), \
+            "Same seed should give the same heart formation"
+    
     def test_star_formation_is_2d(self):
         """Verify star formation is flat in Y-Z plane (all X coordinates = 0)."""
         positions, colors = generate_star_formation(STAR_DRONES)
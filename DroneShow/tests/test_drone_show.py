@@ -0,0 +1,52 @@
+"""
+Test cases for the offscreen frame renderer and show precomputation.
+Validates that rendered frames actually show the drones, and which frames
+are skipped as unchanged.
+"""
+
+import numpy as np
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.drone_config import SPACE_HEIGHT
+from drone_show import DroneShowRenderer, FrameRenderer
+
+
+class TestFrameRenderer:
+    """Test suite for FrameRenderer drawing."""
+
+    def test_drawn_frames_show_drones(self):
+        """Verify drone colors reach the canvas on every frame, not just the first."""
+        rng = np.random.default_rng(0)
+        positions = rng.uniform(-10, 10, (200, 3))
+        positions[:, 2] += SPACE_HEIGHT / 2
+        colors = np.ones((200, 3))
+
+        renderer = FrameRenderer()
+        try:
+            renderer.init_frame()
+            for time in (0.0, 1.0, 2.0):
+                frame = np.asarray(renderer.draw(positions, colors, time))
+                lit = np.count_nonzero(frame[:, :, :3].max(axis=2) > 64)
+                assert lit > 1000, f"Frame at t={time}s has only {lit} lit pixels"
+        finally:
+            renderer.close()
+
+
+class TestDroneShowRenderer:
+    """Test suite for DroneShowRenderer precomputation."""
+
+    def test_blackout_frames_are_skipped(self, tmp_path):
+        """Verify frames with every drone dark reuse the last drawn frame."""
+        renderer = DroneShowRenderer('testing')
+        renderer.precompute_all_frames(str(tmp_path))
+
+        lit = renderer.col_buf.any(axis=2).any(axis=1)
+        static = renderer.static_frames
+        assert static.sum() > 0, "No frames were skipped"
+        # Dark frames after a dark frame are skipped; lit drones keep
+        # drifting, so frames showing them are always drawn
+        assert np.array_equal(static[1:], ~lit[1:] & ~lit[:-1])
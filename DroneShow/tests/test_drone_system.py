@@ -0,0 +1,140 @@
+"""
+Test cases for the drone swarm physics.
+Validates the array-based DroneSystem against the single-drone reference physics.
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.drone_system as drone_system
+from core.drone_system import Drone, DroneSystem
+
+
+class TestDroneSystem:
+    """Test suite for DroneSystem state and physics."""
+
+    @pytest.mark.parametrize('use_kernel', [True, False])
+    def test_update_matches_single_drone_physics(self, monkeypatch, use_kernel):
+        """Verify the vectorized update follows Drone.update_physics exactly."""
+        monkeypatch.setattr(drone_system, 'POSITION_DRIFT', 0.0)
+        if not use_kernel:
+            monkeypatch.setattr(drone_system, '_update_kernel', None)
+        elif drone_system._update_kernel is None:
+            pytest.skip("numba not installed")
+        rng = np.random.default_rng(0)
+        num_drones = 50
+
+        system = DroneSystem(num_drones)
+        reference = [Drone(i) for i in range(num_drones)]
+
+        targets = rng.uniform(-30, 30, (40, 3))
+        colors = rng.integers(0, 256, (40, 3))
+        system.set_formation(targets, colors)
+        for i in range(40):
+            reference[i].set_target(targets[i], colors[i])
+
+        dt = 1.0 / 30
+        for _ in range(45):
+            system.update(dt)
+            for drone in reference:
+                drone.update_physics(dt)
+
+        expected = np.array([drone.position for drone in reference])
+        assert np.allclose(system.get_positions(), expected, atol=1e-6), \
+            "Vectorized physics diverged from single-drone physics"
+
+    @pytest.mark.parametrize('use_kernel', [True, False])
+    def test_settled_drones_wake_on_new_target(self, monkeypatch, use_kernel):
+        """Verify drones at rest are skipped until their target changes."""
+        if not use_kernel:
+            monkeypatch.setattr(drone_system, '_update_kernel', None)
+        elif drone_system._update_kernel is None:
+            pytest.skip("numba not installed")
+        system = DroneSystem(5, seed=0)
+        system.set_formation(np.zeros((5, 3)), np.zeros((5, 3)))
+        system.update(1.0 / 30)
+        assert system._settled.all(), "Drones at their target should settle"
+
+        system.update(1.0 / 30)
+        assert np.all(system.get_positions() == 0.0), "Settled drones must not drift"
+
+        targets = np.zeros((5, 3))
+        targets[2] = (0.0, 5.0, 5.0)
+        system.set_formation(targets, np.zeros((5, 3)))
+        system.update(1.0 / 30)
+        assert not system._settled[2], "Drone with a new target should wake"
+        assert system._settled[[0, 1, 3, 4]].all()
+        assert np.any(system.get_positions()[2] != 0.0)
+
+    def test_inactive_drones_are_dark(self):
+        """Verify drones beyond the formation size have their lights off."""
+        system = DroneSystem(10)
+        positions = np.ones((4, 3))
+        colors = np.full((4, 3), 200)
+        system.set_formation(positions, colors)
+
+        rendered = system.get_colors()
+        assert np.all(rendered[:4] == 200), "Active drones should keep their color"
+        assert np.all(rendered[4:] == 0), "Inactive drones should be dark"
+
+    def test_drone_view_writes_through(self):
+        """Verify per-drone views read and write the system arrays."""
+        system = DroneSystem(3)
+        system.drones[1].position = (1.0, 2.0, 3.0)
+        system.drones[1].light_on = True
+
+        assert np.allclose(system.get_positions()[1], [1.0, 2.0, 3.0])
+        assert system.get_all_states()[1]['light_on'] is True
+
+    def test_set_state_bulk_matches_per_drone_writes(self):
+        """Verify the bulk setter matches assigning each drone view in turn."""
+        positions = np.arange(12, dtype=float).reshape(4, 3)
+        colors = np.array([[255, 0, 0], [0, 0, 0], [0, 10, 0], [0, 0, 0]])
+
+        bulk = DroneSystem(5)
+        bulk.set_state_bulk(positions, colors)
+
+        looped = DroneSystem(5)
+        for i, (pos, color) in enumerate(zip(positions, colors)):
+            looped.drones[i].position = pos
+            looped.drones[i].color = color
+            looped.drones[i].light_on = np.any(color > 0)
+
+        assert np.array_equal(bulk.positions, looped.positions)
+        assert np.array_equal(bulk.colors, looped.colors)
+        assert np.array_equal(bulk.lights_on, looped.lights_on)
+        assert np.array_equal(bulk._settled, looped._settled)
+
+    @pytest.mark.parametrize('use_numexpr', [True, False])
+    def test_interpolate_positions_keeps_float32(self, monkeypatch, use_numexpr):
+        """Verify float32 positions are interpolated in float32, in place."""
+        if not use_numexpr:
+            monkeypatch.setattr(drone_system, 'numexpr', None)
+        elif drone_system.numexpr is None:
+            pytest.skip("numexpr not installed")
+        start = np.zeros((4, 3), dtype=np.float32)
+        end = np.full((4, 3), 10.0, dtype=np.float32)
+        out = np.empty((4, 3), dtype=np.float32)
+
+        result = drone_system.interpolate_positions(start, end, 0.25, ease=False, out=out)
+        assert result is out
+        assert np.allclose(out, 2.5)
+        assert drone_system.interpolate_positions(start, end, 0.25).dtype == np.float32
+
+    def test_interpolate_colors_uint8_does_not_wrap(self):
+        """Verify uint8 colors blend without wrapping around on subtraction."""
+        start = np.array([[200, 0, 0], [0, 255, 10]], dtype=np.uint8)
+        end = np.array([[100, 0, 0], [255, 0, 0]], dtype=np.uint8)
+
+        result = drone_system.interpolate_colors(start, end, 0.5, ease=False)
+        assert np.array_equal(result, [[150, 0, 0], [128, 128, 5]])
+        assert np.array_equal(drone_system.interpolate_colors(start, end, 1.0), end)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
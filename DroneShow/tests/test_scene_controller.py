@@ -0,0 +1,39 @@
+"""
+Test cases for the scene timeline.
+Validates the batch-rendered timeline against the per-frame formation lookup.
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.scene_controller as scene_controller
+from core.scene_controller import SceneController
+
+
+class TestSceneController:
+    """Test suite for SceneController timeline rendering."""
+
+    @pytest.mark.parametrize('use_kernel', [True, False])
+    def test_render_timeline_matches_per_frame_formations(self, monkeypatch, use_kernel):
+        """Verify every timeline frame equals get_formation_at_time exactly."""
+        if not use_kernel:
+            monkeypatch.setattr(scene_controller, '_blend_kernel', None)
+        elif scene_controller._blend_kernel is None:
+            pytest.skip("numba not installed")
+        controller = SceneController(mode='testing', formation_cache_path=None)
+        positions, colors = controller.render_timeline()
+
+        assert len(positions) == controller.get_total_frames()
+        for k in range(len(positions)):
+            expected_positions, expected_colors = controller.get_formation_at_time(k / controller.fps)
+            assert np.array_equal(positions[k], expected_positions), f"Positions differ at frame {k}"
+            assert np.array_equal(colors[k], expected_colors), f"Colors differ at frame {k}"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
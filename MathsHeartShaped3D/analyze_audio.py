@@ -17,14 +17,125 @@ except ImportError:
     tqdm = None
 
 
+# Analysis frames: 512-sample hops at librosa's default 22050 Hz, scaled by
+# an integer factor for higher native rates so the time grid stays ~23 ms
+BASE_SAMPLE_RATE = 22050
+BASE_HOP_LENGTH = 512
+BLOCK_SECONDS = 30  # Audio held in memory at once while streaming
+
+
+def _open_audio_blocks(audio_path):
+    """
+    Stream an audio file as mono blocks with frame-aligned overlap.
+    
+    Consecutive blocks overlap by frame_length - hop_length samples, so
+    features computed per block with center=False concatenate into the
+    same frames as one pass over the whole signal. Features that depend on
+    neighbouring frames or on block-wide statistics need state carried
+    across blocks; analyze_audio does this for the onset envelope. Formats
+    libsndfile cannot read are loaded whole (as a single block) instead.
+    
+    Parameters:
+    - audio_path: Path to audio file
+    
+    Returns:
+    - sr: Sample rate of the blocks
+    - hop_length, frame_length: Analysis frame geometry in samples
+    - duration: Audio duration in seconds
+    - blocks: Iterable of 1D float32 sample arrays
+    """
+    try:
+        sr = librosa.get_samplerate(audio_path)
+        streamed = True
+    except RuntimeError:
+        # Not readable by soundfile (e.g. MP3 on older libsndfile)
+        sr = BASE_SAMPLE_RATE
+        streamed = False
+    
+    hop_length = BASE_HOP_LENGTH * max(1, round(sr / BASE_SAMPLE_RATE))
+    frame_length = 4 * hop_length
+    
+    if streamed:
+        duration = librosa.get_duration(path=audio_path)
+        blocks = librosa.stream(
+            audio_path,
+            block_length=max(1, BLOCK_SECONDS * sr // hop_length),
+            frame_length=frame_length,
+            hop_length=hop_length,
+            mono=True,
+            dtype=np.float32
+        )
+    else:
+        y, sr = librosa.load(audio_path, sr=sr)
+        duration = librosa.get_duration(y=y, sr=sr)
+        blocks = [y]
+    
+    return sr, hop_length, frame_length, duration, blocks
+
+
+def _quantize(values):
+    """
+    Quantize a feature curve to uint8 over its own value range.
+    
+    Parameters:
+    - values: 1D array of feature values
+    
+    Returns:
+    - codes: uint8 array, 0 at the minimum and 255 at the maximum
+    - value_range: float32 array [min, max] for dequantizing
+    """
+    values = np.asarray(values, dtype=np.float32)
+    lo, hi = (float(values.min()), float(values.max())) if values.size else (0.0, 0.0)
+    scale = 255.0 / (hi - lo) if hi > lo else 0.0
+    codes = np.rint((values - lo) * scale).astype(np.uint8)
+    return codes, np.array([lo, hi], dtype=np.float32)
+
+
+def save_features(features, output_path):
+    """
+    Save extracted features, as compressed NPZ or JSON by file extension.
+    
+    NPZ stores timestamps as float32 arrays and the scalar metadata as 0-d
+    arrays. Feature curves (*_values) only drive visuals, so they are
+    stored as uint8 codes with a companion *_range [min, max] entry; that
+    is 1/255 of the curve's range, with a quarter of the bytes. NPZ is
+    several times smaller than JSON and loads without parsing text. Both
+    formats are read by core.audio_sync.load_audio_features.
+    
+    Parameters:
+    - features: Dict of scalar metadata and feature arrays
+    - output_path: Path ending in .npz, or any other path for JSON
+    """
+    if output_path.endswith('.npz'):
+        arrays = {}
+        for key, value in features.items():
+            if isinstance(value, np.ndarray) and key.endswith('_values'):
+                arrays[key], arrays[f"{key}_range"] = _quantize(value)
+            elif isinstance(value, np.ndarray):
+                arrays[key] = np.asarray(value, dtype=np.float32)
+            else:
+                arrays[key] = np.asarray(value)
+        np.savez_compressed(output_path, **arrays)
+    else:
+        with open(output_path, 'w') as f:
+            json.dump({
+                key: value.tolist() if isinstance(value, np.ndarray) else value
+                for key, value in features.items()
+            }, f, indent=2)
+
+
 def analyze_audio(audio_path, output_json_path=None):
     """
     Analyze audio file and extract beats, tempo, onsets, loudness, bass.
     Save results to JSON for animation to use.
     
+    The audio is streamed in blocks, so memory use is bounded by the block
+    size rather than the length of the file.
+    
     Parameters:
     - audio_path: Path to audio file (MP3, WAV, etc.)
-    - output_json_path: Optional path for output JSON. If None, uses audio filename.
+    - output_json_path: Optional output path (.npz, or JSON for any other
+      extension). If None, uses {audio_filename}_features.npz.
     
     Returns:
     - Dictionary containing all extracted features
@@ -35,19 +146,57 @@ def analyze_audio(audio_path, output_json_path=None):
     print(f"Analyzing audio: {audio_path}")
     
     # Initialize progress bar
-    total_steps = 7  # Loading, beats, onsets, RMS, bass, tempo tracking, ZCR, saving
+    total_steps = 7  # Streaming, beats, onsets, RMS, bass, tempo tracking, ZCR, saving
     if tqdm:
         pbar = tqdm(total=total_steps, desc="Analyzing audio", unit="step", ncols=None, leave=False)
     else:
         pbar = None
     
-    # Load audio (use lower sample rate for speed)
+    # Stream audio, computing every frame-wise feature block by block
     if pbar:
-        pbar.set_description("Loading audio file")
+        pbar.set_description("Streaming audio features")
     else:
-        print("Loading audio file...")
-    y, sr = librosa.load(audio_path, sr=22050)
-    duration = librosa.get_duration(y=y, sr=sr)
+        print("Streaming audio features...")
+    sr, hop_length, frame_length, duration, blocks = _open_audio_blocks(audio_path)
+    
+    # Mel filterbank for the onset envelope, built once for all blocks
+    mel_basis = librosa.filters.mel(sr=sr, n_fft=frame_length)
+    
+    onset_blocks = []
+    prev_mel_db = None  # Last mel frame of the previous block
+    rms_blocks = []
+    spec_blocks = []
+    zcr_blocks = []
+    for block in blocks:
+        if len(block) < frame_length:
+            # Too short for a full frame (only possible for the last block)
+            continue
+        frame_args = dict(hop_length=hop_length, center=False)
+        # One magnitude STFT per block feeds RMS, spectral centroid and the
+        # onset envelope (log-power mel, as onset_strength computes from y).
+        # The dB scale uses the fixed reference without the top_db floor,
+        # which would otherwise sit 80 dB below each block's own peak.
+        S = np.abs(librosa.stft(block, n_fft=frame_length, **frame_args))
+        mel_db = librosa.power_to_db(mel_basis @ (S ** 2), top_db=None)
+        if prev_mel_db is None:
+            onset_blocks.append(librosa.onset.onset_strength(S=mel_db, sr=sr, **frame_args))
+        else:
+            # Difference the first frame against the previous block's last
+            # frame rather than the zero padding onset_strength adds
+            onset = librosa.onset.onset_strength(S=np.hstack([prev_mel_db, mel_db]), sr=sr, **frame_args)
+            onset_blocks.append(onset[1:])
+        prev_mel_db = mel_db[:, -1:]
+        rms_blocks.append(librosa.feature.rms(S=S, frame_length=frame_length, hop_length=hop_length)[0])
+        spec_blocks.append(librosa.feature.spectral_centroid(S=S, sr=sr, n_fft=frame_length, hop_length=hop_length)[0])
+        zcr_blocks.append(librosa.feature.zero_crossing_rate(block, frame_length=frame_length, **frame_args)[0])
+    
+    onset_env = np.concatenate(onset_blocks) if onset_blocks else np.zeros(0, dtype=np.float32)
+    rms = np.concatenate(rms_blocks) if rms_blocks else np.zeros(1, dtype=np.float32)
+    spec_cent = np.concatenate(spec_blocks) if spec_blocks else np.zeros(1, dtype=np.float32)
+    zcr = np.concatenate(zcr_blocks) if zcr_blocks else np.zeros(1, dtype=np.float32)
+    
+    # Frames are not centered, so each is timed at its midpoint
+    time_args = dict(sr=sr, hop_length=hop_length, n_fft=frame_length)
     
     if pbar:
         pbar.update(1)
@@ -55,18 +204,18 @@ def analyze_audio(audio_path, output_json_path=None):
         print(f"Audio duration: {duration:.2f} seconds")
         print(f"Sample rate: {sr} Hz")
     
-    # 1. Detect beats and tempo
+    # 1. Detect beats and tempo (from the onset envelope, not raw audio)
     if pbar:
         pbar.set_description("Detecting beats and tempo")
     else:
         print("Detecting beats and tempo...")
-    tempo, beat_frames = librosa.beat.beat_track(y=y, sr=sr)
+    tempo, beat_frames = librosa.beat.beat_track(onset_envelope=onset_env, sr=sr, hop_length=hop_length)
     # Convert tempo to float (handle numpy array)
     if hasattr(tempo, '__iter__') and not isinstance(tempo, str):
         tempo = float(tempo[0]) if len(tempo) > 0 else 120.0
     else:
         tempo = float(tempo)
-    beat_times = librosa.frames_to_time(beat_frames, sr=sr)
+    beat_times = librosa.frames_to_time(beat_frames, **time_args)
     
     if not pbar:
         print(f"  Detected tempo: {tempo:.1f} BPM")
@@ -79,21 +228,20 @@ def analyze_audio(audio_path, output_json_path=None):
         pbar.set_description("Detecting onsets")
     else:
         print("Detecting onsets...")
-    onset_frames = librosa.onset.onset_detect(y=y, sr=sr, units='frames')
-    onset_times = librosa.frames_to_time(onset_frames, sr=sr)
+    onset_frames = librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr, hop_length=hop_length, units='frames')
+    onset_times = librosa.frames_to_time(onset_frames, **time_args)
     
     if not pbar:
         print(f"  Found {len(onset_times)} onsets")
     if pbar:
         pbar.update(1)
     
-    # 3. Calculate RMS energy (loudness) over time
+    # 3. Normalize RMS energy (loudness) over time
     if pbar:
         pbar.set_description("Calculating loudness (RMS)")
     else:
         print("Calculating loudness (RMS energy)...")
-    rms = librosa.feature.rms(y=y)[0]
-    rms_times = librosa.frames_to_time(range(len(rms)), sr=sr)
+    rms_times = librosa.frames_to_time(range(len(rms)), **time_args)
     
     # Normalize RMS to 0-1 range
     rms_min = rms.min()
@@ -109,13 +257,12 @@ def analyze_audio(audio_path, output_json_path=None):
     if pbar:
         pbar.update(1)
     
-    # 4. Calculate spectral centroid (brightness) - inverse = bass
+    # 4. Spectral centroid (brightness) - inverse = bass
     if pbar:
         pbar.set_description("Calculating bass strength")
     else:
         print("Calculating bass strength...")
-    spec_cent = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-    spec_times = librosa.frames_to_time(range(len(spec_cent)), sr=sr)
+    spec_times = librosa.frames_to_time(range(len(spec_cent)), **time_args)
     
     # Normalize and invert for bass (low centroid = more bass)
     spec_min = spec_cent.min()
@@ -137,31 +284,24 @@ def analyze_audio(audio_path, output_json_path=None):
         pbar.set_description("Tracking dynamic tempo")
     else:
         print("Tracking dynamic tempo changes...")
-    tempo_times = []
-    tempo_values = []
-    window_size = 3.0  # 3 second windows
-    hop_size = 0.5    # Check every 0.5 seconds
-    
-    for i, t in enumerate(np.arange(0, duration, hop_size)):
-        start_frame = librosa.time_to_frames(t, sr=sr)
-        end_frame = librosa.time_to_frames(min(t + window_size, duration), sr=sr)
-        
-        if end_frame > start_frame and end_frame <= len(y):
-            y_segment = y[start_frame:end_frame]
-            if len(y_segment) > 0:
-                try:
-                    tempo_local, _ = librosa.beat.beat_track(y=y_segment, sr=sr)
-                    # Convert tempo_local to float (handle numpy array)
-                    if hasattr(tempo_local, '__iter__') and not isinstance(tempo_local, str):
-                        tempo_local = float(tempo_local[0]) if len(tempo_local) > 0 else tempo
-                    else:
-                        tempo_local = float(tempo_local)
-                    tempo_times.append(t)
-                    tempo_values.append(tempo_local)
-                except:
-                    # If beat tracking fails for segment, use global tempo
-                    tempo_times.append(t)
-                    tempo_values.append(tempo)
+    window_size = 3.0  # 3 second autocorrelation window
+    hop_size = 0.5    # Report every 0.5 seconds
+    
+    # Local tempo at every frame from one tempogram over the shared onset
+    # envelope, instead of re-running beat tracking on each window
+    if len(onset_env) > 0:
+        local_tempo = librosa.feature.tempo(
+            onset_envelope=onset_env, sr=sr, hop_length=hop_length,
+            ac_size=window_size, aggregate=None
+        )
+        tempo_times = np.arange(0, duration, hop_size)
+        # Same frame timing as the other features; times before the first
+        # frame's midpoint map to negative frames and clip to frame 0
+        tempo_frames = librosa.time_to_frames(tempo_times, **time_args)
+        tempo_values = local_tempo[np.clip(tempo_frames, 0, len(local_tempo) - 1)]
+    else:
+        tempo_times = np.zeros(0)
+        tempo_values = np.zeros(0)
     
     if not pbar:
         print(f"  Tracked tempo at {len(tempo_times)} time points")
@@ -173,8 +313,7 @@ def analyze_audio(audio_path, output_json_path=None):
         pbar.set_description("Calculating zero-crossing rate")
     else:
         print("Calculating zero-crossing rate...")
-    zcr = librosa.feature.zero_crossing_rate(y)[0]
-    zcr_times = librosa.frames_to_time(range(len(zcr)), sr=sr)
+    zcr_times = librosa.frames_to_time(range(len(zcr)), **time_args)
     zcr_normalized = (zcr - zcr.min()) / (zcr.max() - zcr.min() + 1e-6)
     
     if pbar:
@@ -183,32 +322,30 @@ def analyze_audio(audio_path, output_json_path=None):
     else:
         print("Saving features...")
     
-    # Save all features to JSON
+    # Save all features
     features = {
         'audio_file': os.path.basename(audio_path),
         'duration': float(duration),
         'sample_rate': int(sr),
         'tempo_global': float(tempo),
-        'beat_times': [float(t) for t in beat_times],
-        'onset_times': [float(t) for t in onset_times],
-        'rms_times': [float(t) for t in rms_times],
-        'rms_values': [float(v) for v in rms_normalized],
-        'bass_times': [float(t) for t in spec_times],
-        'bass_values': [float(v) for v in bass_strength],
+        'beat_times': beat_times,
+        'onset_times': onset_times,
+        'rms_times': rms_times,
+        'rms_values': rms_normalized,
+        'bass_times': spec_times,
+        'bass_values': bass_strength,
         'tempo_times': tempo_times,
         'tempo_values': tempo_values,
-        'zcr_times': [float(t) for t in zcr_times],
-        'zcr_values': [float(v) for v in zcr_normalized]
+        'zcr_times': zcr_times,
+        'zcr_values': zcr_normalized
     }
     
     # Determine output path
     if output_json_path is None:
         base_name = os.path.splitext(os.path.basename(audio_path))[0]
-        output_json_path = f"{base_name}_features.json"
+        output_json_path = f"{base_name}_features.npz"
     
-    # Save to JSON
-    with open(output_json_path, 'w') as f:
-        json.dump(features, f, indent=2)
+    save_features(features, output_json_path)
     
     if pbar:
         pbar.update(1)  # Final step: saving
@@ -235,6 +372,7 @@ def main():
         epilog="""
 Examples:
   python analyze_audio.py inputs/H8InfiniteStars2.mp3
+  python analyze_audio.py inputs/H8InfiniteStars2.mp3 -o audio_features.npz
   python analyze_audio.py inputs/H8InfiniteStars2.mp3 -o audio_features.json
   python analyze_audio.py Engima.mp3 --output my_features.json
         """
@@ -248,15 +386,15 @@ Examples:
     parser.add_argument(
         '-o', '--output',
         dest='output_json',
-        help='Output JSON file path (default: {audio_filename}_features.json)'
+        help='Output file path, .npz or .json (default: {audio_filename}_features.npz)'
     )
     
     args = parser.parse_args()
     
     try:
         features = analyze_audio(args.audio_file, args.output_json)
-        print("\nSuccess! You can now use this JSON file with heart_animation.py")
-        print(f"  Example: python heart_animation.py --effect H8sync --audio-features {args.output_json or os.path.splitext(os.path.basename(args.audio_file))[0] + '_features.json'}")
+        print("\nSuccess! You can now use this features file with heart_animation.py")
+        print(f"  Example: python heart_animation.py --effect H8sync --audio-features {args.output_json or os.path.splitext(os.path.basename(args.audio_file))[0] + '_features.npz'}")
         return 0
     except Exception as e:
         print(f"\n✗ Error: {e}", file=sys.stderr)
@@ -5,6 +5,8 @@ Core modules for heart animation generation.
 from .heart_generator import generate_heart_points
 from .figure_setup import setup_figure
 from .audio_sync import (
+    AudioFeatureIndex,
+    load_audio_features,
     get_beat_intensity,
     get_onset_intensity,
     get_loudness_at_time,
@@ -15,6 +17,8 @@ from .audio_sync import (
 __all__ = [
     'generate_heart_points',
     'setup_figure',
+    'AudioFeatureIndex',
+    'load_audio_features',
     'get_beat_intensity',
     'get_onset_intensity',
     'get_loudness_at_time',
@@ -0,0 +1,38 @@
+"""
+Numba kernels for the audio_sync lookups.
+
+Importing this module raises ImportError when numba is not installed;
+core.audio_sync then falls back to its NumPy implementations.
+"""
+
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def nearest_index(t, times):
+    """Index of the timestamp nearest to t in non-empty sorted times (ties to the earlier)."""
+    lo = 0
+    hi = times.shape[0]
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if times[mid] < t:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo == times.shape[0]:
+        return lo - 1
+    if lo > 0 and t - times[lo - 1] <= times[lo] - t:
+        return lo - 1
+    return lo
+
+
+@njit(cache=True, fastmath=True)
+def nearest_distance(t, times):
+    """Distance from t to the nearest timestamp in non-empty sorted times."""
+    return abs(times[nearest_index(t, times)] - t)
+
+
+@njit(cache=True, fastmath=True)
+def value_at(t, times, values):
+    """Value at the timestamp nearest to t in non-empty sorted times."""
+    return values[nearest_index(t, times)]
@@ -2,8 +2,152 @@
 Audio synchronization helper functions for effects.
 """
 
+import json
+from dataclasses import dataclass, field
+
 import numpy as np
 
+try:
+    from . import _audio_sync_nb
+except ImportError:
+    _audio_sync_nb = None
+
+
+def load_audio_features(path):
+    """
+    Load features saved by analyze_audio.py.
+    
+    Feature curves stored in NPZ as uint8 codes with a *_range entry are
+    dequantized to float32 here, once, so lookups see plain values.
+    
+    Parameters:
+    - path: .npz file, or JSON for any other extension
+    
+    Returns:
+    - dict: Feature arrays (lists for JSON) and scalar metadata
+    """
+    if path.endswith('.npz'):
+        with np.load(path) as data:
+            features = {
+                key: data[key].item() if data[key].ndim == 0 else data[key]
+                for key in data.files
+            }
+        for key in [key for key in features if f"{key}_range" in features]:
+            lo, hi = features.pop(f"{key}_range")
+            features[key] = _dequantize(features[key], lo, hi)
+        return features
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _dequantize(codes, lo, hi):
+    """Map uint8 codes 0..255 back to float32 values in [lo, hi]."""
+    scale = np.float32((hi - lo) / 255.0)
+    return codes.astype(np.float32) * scale + np.float32(lo)
+
+
+def _as_times(times):
+    """Timestamps as a float64 array (no copy if already one)."""
+    return np.asarray(times, dtype=np.float64)
+
+
+def _as_values(values):
+    """Feature values as a float32 array (no copy if already one)."""
+    return np.asarray(values, dtype=np.float32)
+
+
+@dataclass
+class AudioFeatureIndex:
+    """
+    Audio features from analyze_audio.py as sorted NumPy arrays.
+    
+    Built once per effect so per-frame lookups neither convert lists nor
+    scan every timestamp.
+    """
+    beat_times: np.ndarray = field(default_factory=lambda: _as_times([]))
+    onset_times: np.ndarray = field(default_factory=lambda: _as_times([]))
+    rms_times: np.ndarray = field(default_factory=lambda: _as_times([]))
+    rms_values: np.ndarray = field(default_factory=lambda: _as_values([]))
+    bass_times: np.ndarray = field(default_factory=lambda: _as_times([]))
+    bass_values: np.ndarray = field(default_factory=lambda: _as_values([]))
+    tempo_times: np.ndarray = field(default_factory=lambda: _as_times([]))
+    tempo_values: np.ndarray = field(default_factory=lambda: _as_values([]))
+    
+    @classmethod
+    def from_features(cls, audio_features):
+        """
+        Build the index from an audio features dict.
+        
+        Parameters:
+        - audio_features: Dict loaded from the analyze_audio.py JSON (or None)
+        
+        Returns:
+        - AudioFeatureIndex with missing channels left empty
+        """
+        audio_features = audio_features or {}
+        return cls(**{
+            name: (_as_values if name.endswith('_values') else _as_times)(
+                audio_features.get(name, [])
+            )
+            for name in cls.__dataclass_fields__
+        })
+
+
+def _nearest_index(current_time, times):
+    """
+    Index of the timestamp nearest to current_time by binary search.
+    
+    Ties go to the earlier timestamp, as with argmin over the distances.
+    
+    Parameters:
+    - current_time: Current time in seconds
+    - times: Non-empty sorted array of timestamps
+    
+    Returns:
+    - int: Index into times
+    """
+    i = int(np.searchsorted(times, current_time))
+    if i == len(times):
+        return i - 1
+    if i > 0 and current_time - times[i - 1] <= times[i] - current_time:
+        return i - 1
+    return i
+
+
+def _nearest_distance_numpy(current_time, times):
+    """Distance from current_time to the nearest of the sorted times."""
+    return abs(times[_nearest_index(current_time, times)] - current_time)
+
+
+def _value_at_numpy(current_time, times, values):
+    """Value at the timestamp nearest to current_time."""
+    return values[_nearest_index(current_time, times)]
+
+
+# Compiled loops when numba is available; same results, no per-call
+# NumPy dispatch
+if _audio_sync_nb is not None:
+    _nearest_distance = _audio_sync_nb.nearest_distance
+    _value_at = _audio_sync_nb.value_at
+else:
+    _nearest_distance = _nearest_distance_numpy
+    _value_at = _value_at_numpy
+
+
+def _nearest_value(current_time, times, values):
+    """
+    Value at the timestamp nearest to current_time, as a float.
+    
+    Times before the first or after the last timestamp resolve to the end
+    values without searching.
+    """
+    times = _as_times(times)
+    if current_time >= times[-1]:
+        return float(values[len(times) - 1])
+    if current_time <= times[0]:
+        return float(values[0])
+    return float(_value_at(current_time, times, _as_values(values)))
+
 
 def get_beat_intensity(current_time, beat_times, window=0.1):
     """
@@ -12,19 +156,22 @@ def get_beat_intensity(current_time, beat_times, window=0.1):
     
     Parameters:
     - current_time: Current time in seconds
-    - beat_times: List of beat timestamps
+    - beat_times: Sorted beat timestamps (list or array)
     - window: Time window in seconds to consider a beat active
     
     Returns:
     - float: Intensity (0-1) where 1.0 is exactly on beat
     """
-    if not beat_times or len(beat_times) == 0:
+    if beat_times is None or len(beat_times) == 0:
+        return 0.0
+    
+    beat_times = _as_times(beat_times)
+    # No beat can be within the window before the first or after the last
+    if current_time <= beat_times[0] - window or current_time >= beat_times[-1] + window:
         return 0.0
     
     # Find nearest beat
-    distances = np.abs(np.array(beat_times) - current_time)
-    nearest_idx = np.argmin(distances)
-    nearest_distance = distances[nearest_idx]
+    nearest_distance = _nearest_distance(current_time, beat_times)
     
     # If within window, return intensity (closer = stronger)
     if nearest_distance < window:
@@ -39,17 +186,20 @@ def get_onset_intensity(current_time, onset_times, window=0.15):
     
     Parameters:
     - current_time: Current time in seconds
-    - onset_times: List of onset timestamps
+    - onset_times: Sorted onset timestamps (list or array)
     - window: Time window in seconds to consider an onset active
     
     Returns:
     - float: Intensity (0-1) where 1.0 is exactly on onset
     """
-    if not onset_times or len(onset_times) == 0:
+    if onset_times is None or len(onset_times) == 0:
         return 0.0
     
-    distances = np.abs(np.array(onset_times) - current_time)
-    nearest_distance = np.min(distances)
+    onset_times = _as_times(onset_times)
+    if current_time <= onset_times[0] - window or current_time >= onset_times[-1] + window:
+        return 0.0
+    
+    nearest_distance = _nearest_distance(current_time, onset_times)
     
     if nearest_distance < window:
         intensity = 1.0 - (nearest_distance / window)
@@ -63,19 +213,17 @@ def get_loudness_at_time(current_time, rms_times, rms_values):
     
     Parameters:
     - current_time: Current time in seconds
-    - rms_times: List of RMS measurement timestamps
-    - rms_values: List of normalized RMS values (0-1)
+    - rms_times: Sorted RMS measurement timestamps (list or array)
+    - rms_values: Normalized RMS values (0-1)
     
     Returns:
     - float: Normalized loudness (0-1)
     """
-    if not rms_times or not rms_values or len(rms_times) == 0:
+    if rms_times is None or rms_values is None or len(rms_times) == 0 or len(rms_values) == 0:
         return 0.5
     
     # Find nearest RMS measurement
-    distances = np.abs(np.array(rms_times) - current_time)
-    idx = np.argmin(distances)
-    return float(rms_values[idx])
+    return _nearest_value(current_time, rms_times, rms_values)
 
 
 def get_bass_at_time(current_time, bass_times, bass_values):
@@ -84,18 +232,16 @@ def get_bass_at_time(current_time, bass_times, bass_values):
     
     Parameters:
     - current_time: Current time in seconds
-    - bass_times: List of bass measurement timestamps
-    - bass_values: List of normalized bass strength values (0-1)
+    - bass_times: Sorted bass measurement timestamps (list or array)
+    - bass_values: Normalized bass strength values (0-1)
     
     Returns:
     - float: Normalized bass strength (0-1)
     """
-    if not bass_times or not bass_values or len(bass_times) == 0:
+    if bass_times is None or bass_values is None or len(bass_times) == 0 or len(bass_values) == 0:
         return 0.5
     
-    distances = np.abs(np.array(bass_times) - current_time)
-    idx = np.argmin(distances)
-    return float(bass_values[idx])
+    return _nearest_value(current_time, bass_times, bass_values)
 
 
 def get_tempo_at_time(current_time, tempo_times, tempo_values):
@@ -104,16 +250,13 @@ def get_tempo_at_time(current_time, tempo_times, tempo_values):
     
     Parameters:
     - current_time: Current time in seconds
-    - tempo_times: List of tempo measurement timestamps
-    - tempo_values: List of BPM values
+    - tempo_times: Sorted tempo measurement timestamps (list or array)
+    - tempo_values: BPM values
     
     Returns:
     - float: Tempo in BPM
     """
-    if not tempo_times or not tempo_values or len(tempo_times) == 0:
+    if tempo_times is None or tempo_values is None or len(tempo_times) == 0 or len(tempo_values) == 0:
         return 120.0  # Default
     
-    distances = np.abs(np.array(tempo_times) - current_time)
-    idx = np.argmin(distances)
-    return float(tempo_values[idx])
-
+    return _nearest_value(current_time, tempo_times, tempo_values)
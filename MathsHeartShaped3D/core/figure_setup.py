@@ -5,6 +5,29 @@ Matplotlib figure setup for 3D heart animation.
 import matplotlib.pyplot as plt
 from config.heart_config import get_formula_display
 
+# Output frame size in pixels for each resolution setting
+RESOLUTIONS = {
+    'small': (640, 480),
+    'medium': (1280, 720),
+    'large': (1920, 1080),
+    '4k': (3840, 2160)
+}
+
+
+def frame_size(resolution='medium', dpi=100):
+    """
+    Size of the frames setup_figure's figure renders, without creating it.
+    
+    Parameters:
+    - resolution: 'small', 'medium', 'large', or '4k'
+    - dpi: Dots per inch for the figure
+    
+    Returns:
+    - (width, height) in pixels, as the Agg canvas truncates them
+    """
+    width, height = RESOLUTIONS.get(resolution, RESOLUTIONS['medium'])
+    return int(width / dpi * dpi), int(height / dpi * dpi)
+
 
 def setup_figure(resolution='medium', dpi=100, show_axes=True, show_formulas=True, watermark='VUHUNG'):
     """
@@ -20,15 +43,7 @@ def setup_figure(resolution='medium', dpi=100, show_axes=True, show_formulas=Tru
     Returns:
     - fig, ax: Matplotlib figure and axes objects
     """
-    # Define resolution settings
-    resolutions = {
-        'small': (640, 480),
-        'medium': (1280, 720),
-        'large': (1920, 1080),
-        '4k': (3840, 2160)
-    }
-    
-    width, height = resolutions.get(resolution, resolutions['medium'])
+    width, height = RESOLUTIONS.get(resolution, RESOLUTIONS['medium'])
     figsize = (width / dpi, height / dpi)
     
     # Create figure with black background
@@ -2,11 +2,14 @@
 Heart point generation with configurable formula.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from config.heart_config import get_heart_formula
 
 
-def generate_heart_points(u_points=200, v_points=200, density='high', formula_config=None):
+def generate_heart_points(u_points=200, v_points=200, density='high', formula_config=None,
+                          use_cache=True):
     """
     Generate 3D coordinates for the parametric heart shape.
     
@@ -15,6 +18,8 @@ def generate_heart_points(u_points=200, v_points=200, density='high', formula_co
     - v_points: Number of points in the v parameter
     - density: Point density level ('lower', 'low', 'medium', 'high')
     - formula_config: Optional dict to override default formula. If None, uses default.
+    - use_cache: Reuse the points of an earlier call in this process with
+      the same grid and formula; cached arrays are read-only and shared
     
     Returns:
     - x, y, z: Arrays of 3D coordinates
@@ -35,14 +40,54 @@ def generate_heart_points(u_points=200, v_points=200, density='high', formula_co
     u_points = int(u_points * multiplier)
     v_points = int(v_points * multiplier)
     
-    # Create parameter grids
-    u = np.linspace(0, np.pi, u_points)
-    v = np.linspace(0, 2 * np.pi, v_points)
-    u_grid, v_grid = np.meshgrid(u, v)
+    if use_cache:
+        # Lists in the formula are frozen to tuples to form the cache key
+        x, y, z = _cached_heart_points(u_points, v_points, tuple(sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in formula_config.items()
+        )))
+    else:
+        x, y, z = _compute_heart_points(u_points, v_points, formula_config)
+    
+    # Use z values for color gradient
+    colors = z
+    
+    return x, y, z, colors
+
+
+@lru_cache(maxsize=8)
+def _cached_heart_points(u_points, v_points, formula_items):
+    """
+    Memoized _compute_heart_points for multi-heart effects and repeat calls.
+    
+    Parameters:
+    - u_points, v_points: Grid size
+    - formula_items: Heart formula as a sorted tuple of (key, value) pairs
+    
+    Returns:
+    - x, y, z: Read-only float32 arrays of 3D coordinates
+    """
+    points = _compute_heart_points(u_points, v_points, dict(formula_items))
+    for array in points:
+        array.flags.writeable = False
+    return points
+
+
+def _compute_heart_points(u_points, v_points, formula_config):
+    """
+    Evaluate the parametric heart on a u_points x v_points grid.
+    
+    Parameters:
+    - u_points, v_points: Grid size
+    - formula_config: Heart formula dict (see config.heart_config)
     
-    # Flatten for scatter plot
-    u_flat = u_grid.flatten()
-    v_flat = v_grid.flatten()
+    Returns:
+    - x, y, z: float32 arrays of 3D coordinates
+    """
+    # Parameter values; the grid is never materialized. Points are ordered
+    # as np.meshgrid(u, v) flattened: v is the outer index, u the inner one
+    u = np.linspace(0, np.pi, u_points, dtype=np.float32)
+    v = np.linspace(0, 2 * np.pi, v_points, dtype=np.float32)
     
     # Extract formula coefficients
     x_coeffs = formula_config.get('x_coeffs', [15, -4])
@@ -50,25 +95,28 @@ def generate_heart_points(u_points=200, v_points=200, density='high', formula_co
     z_coeffs = formula_config.get('z_coeffs', [15, -5, -2, -1])
     y_flip = formula_config.get('y_flip', True)
     
+    # The z formula has two cos(v) terms; fold them into one coefficient
+    # so each point evaluates three cosine terms: cos(v), cos(2v), cos(3v)
+    z_cos = (z_coeffs[0] + z_coeffs[3], z_coeffs[1], z_coeffs[2])
+    
+    # 1D trig tables, evaluated once per parameter value
+    sin_u = np.sin(u)
+    cos_u = np.cos(u)
+    cos_v = np.cos(v)
+    
     # Parametric equations for the 3D heart
     # x = sin(u) * (coeff1*sin(v) + coeff2*sin(3v))
-    x = np.sin(u_flat) * (x_coeffs[0] * np.sin(v_flat) + x_coeffs[1] * np.sin(3 * v_flat))
+    x_v = x_coeffs[0] * np.sin(v) + x_coeffs[1] * np.sin(3 * v)
+    x = np.outer(x_v, sin_u).ravel()
     
     # y = coeff * cos(u) [with optional flip]
-    y = y_coeff * np.cos(u_flat)
+    y_u = y_coeff * cos_u
     if y_flip:
-        y = -y  # Negative to flip vertically (point down)
+        y_u = -y_u  # Negative to flip vertically (point down)
+    y = np.tile(y_u, v_points)
     
     # z = sin(u) * (coeff1*cos(v) + coeff2*cos(2v) + coeff3*cos(3v) + coeff4*cos(v))
-    z = np.sin(u_flat) * (
-        z_coeffs[0] * np.cos(v_flat) +
-        z_coeffs[1] * np.cos(2 * v_flat) +
-        z_coeffs[2] * np.cos(3 * v_flat) +
-        z_coeffs[3] * np.cos(v_flat)
-    )
+    z_v = z_cos[0] * cos_v + z_cos[1] * np.cos(2 * v) + z_cos[2] * np.cos(3 * v)
+    z = np.outer(z_v, sin_u).ravel()
     
-    # Use z values for color gradient
-    colors = z
-    
-    return x, y, z, colors
-
+    return x, y, z
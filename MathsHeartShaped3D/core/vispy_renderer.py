@@ -0,0 +1,195 @@
+"""
+GPU rendering of the heart with vispy, for effects that only move the
+points, their opacity and the camera.
+
+The renderer provides stand-ins for the matplotlib scatter and 3D axes that
+those effects drive, so their update() code runs unchanged while the point
+projection and rasterization happen on the GPU.
+"""
+
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.colors import Normalize
+from core.figure_setup import RESOLUTIONS
+
+try:
+    from vispy import scene as vispy_scene
+except ImportError:
+    vispy_scene = None
+
+try:
+    import imageio_ffmpeg
+except ImportError:
+    imageio_ffmpeg = None
+
+
+# Effects drawing a single scatter whose update() only sets
+# scatter._offsets3d and calls scatter.set_alpha, ax.view_init and
+# ax.set_xlim / set_ylim / set_zlim
+VISPY_EFFECTS = (
+    'A', 'B', 'C', 'D', 'E', 'F', 'G', 'G1', 'G2',
+    'H1', 'H2', 'H3', 'H4', 'H5', 'H6', 'H7', 'H8', 'H8sync', 'H8sync3min', 'H9', 'H10',
+)
+
+MARKER_SIZE = 3  # Pixels; close to a size-1 matplotlib marker with its edge
+
+
+class VispyScatter:
+    """Stand-in for the mplot3d scatter: effects assign _offsets3d."""
+    
+    def __init__(self, markers, x, y, z, rgba):
+        """
+        Parameters:
+        - markers: vispy Markers visual
+        - x, y, z: Initial point coordinates
+        - rgba: (N, 4) float32 point colors
+        """
+        self.markers = markers
+        self._rgba = rgba
+        self._face_colors = rgba
+        self._positions = np.empty((len(x), 3), dtype=np.float32)
+        self._offsets3d = (x, y, z)
+    
+    @property
+    def _offsets3d(self):
+        return self._xyz
+    
+    @_offsets3d.setter
+    def _offsets3d(self, xyz):
+        self._xyz = xyz
+        count = len(xyz[0])
+        if count != len(self._positions):
+            # Effects tiling the heart (mirrors, two hearts) change the point
+            # count; colors cycle over the points as in matplotlib
+            self._positions = np.empty((count, 3), dtype=np.float32)
+            self._face_colors = np.resize(self._rgba, (count, 4))
+        for axis, values in enumerate(xyz):
+            self._positions[:, axis] = values
+        self._upload()
+    
+    def set_alpha(self, alpha):
+        """Set the opacity of every point."""
+        self._rgba[:, 3] = alpha
+        self._face_colors[:, 3] = alpha
+        self._upload()
+    
+    def _upload(self):
+        """Send positions and colors to the GPU."""
+        self.markers.set_data(
+            self._positions, face_color=self._face_colors, edge_width=0, size=MARKER_SIZE
+        )
+
+
+class VispyAxes:
+    """Stand-in for the mplot3d axes: view angles and zoom move the camera."""
+    
+    def __init__(self, camera):
+        """
+        Parameters:
+        - camera: vispy TurntableCamera
+        """
+        self.camera = camera
+    
+    def view_init(self, elev=None, azim=None):
+        """Set the camera elevation and azimuth in degrees."""
+        if elev is not None:
+            self.camera.elevation = float(elev)
+        if azim is not None:
+            # matplotlib azimuth 0 looks from +X; vispy azimuth 0 looks from -Y
+            self.camera.azimuth = float(azim) + 90
+    
+    def set_xlim(self, limits):
+        """Zoom so the [min, max] range fills the view."""
+        # G1/G2 pass a negative zoom (mirrored limits) while flying through
+        # the heart; the camera scale must stay positive
+        self.camera.scale_factor = abs(float(limits[1] - limits[0]))
+    
+    # The axes are kept cubic, so any limit sets the zoom
+    set_ylim = set_xlim
+    set_zlim = set_xlim
+
+
+class VispyHeartRenderer:
+    """
+    Offscreen vispy canvas showing one heart, with scatter and axes
+    stand-ins for the effects.
+    """
+    
+    def __init__(self, x, y, z, colors, resolution='medium', watermark='VUHUNG',
+                 cmap='magma', alpha=0.8):
+        """
+        Parameters:
+        - x, y, z: Heart point coordinates
+        - colors: Per-point values mapped through cmap
+        - resolution: 'small', 'medium', 'large', or '4k'
+        - watermark: Watermark text (empty string for none)
+        - cmap: Matplotlib colormap name
+        - alpha: Point opacity
+        """
+        if vispy_scene is None:
+            raise RuntimeError("The vispy renderer requires vispy (pip install vispy)")
+        
+        self.size = RESOLUTIONS.get(resolution, RESOLUTIONS['medium'])
+        self.canvas = vispy_scene.SceneCanvas(size=self.size, bgcolor='black', show=False)
+        view = self.canvas.central_widget.add_view()
+        view.camera = vispy_scene.TurntableCamera(fov=45, elevation=20, azimuth=45 + 90)
+        
+        colors = np.asarray(colors)
+        rgba = colormaps[cmap](Normalize(colors.min(), colors.max())(colors)).astype(np.float32)
+        rgba[:, 3] = alpha
+        markers = vispy_scene.visuals.Markers(parent=view.scene)
+        
+        self.scatter = VispyScatter(markers, x, y, z, rgba)
+        self.ax = VispyAxes(view.camera)
+        self.ax.set_xlim([-20, 20])
+        
+        if watermark:
+            # Same near-invisible dark gray as the matplotlib watermark
+            vispy_scene.visuals.Text(
+                watermark, color=(0.02, 0.02, 0.02, 0.25), font_size=14,
+                pos=(self.size[0] / 2, self.size[1] / 2), parent=self.canvas.scene
+            )
+    
+    def render(self):
+        """
+        Render the current frame.
+        
+        Returns:
+        - (height, width, 3) uint8 RGB array
+        """
+        return np.ascontiguousarray(self.canvas.render()[..., :3])
+    
+    def close(self):
+        """Release the canvas."""
+        self.canvas.close()
+
+
+def write_vispy_video(renderer, update, total_frames, output_path, fps=30,
+                      bitrate=5000, on_frame=None):
+    """
+    Render every frame with vispy and encode them to a video with ffmpeg.
+    
+    Parameters:
+    - renderer: VispyHeartRenderer driven by update
+    - update: Function advancing the effect to a frame number
+    - total_frames: Number of frames to render
+    - output_path: Path to save the video
+    - fps: Frames per second
+    - bitrate: Video bitrate in kbps
+    - on_frame: Optional callback receiving each frame number once written
+    """
+    if imageio_ffmpeg is None:
+        raise RuntimeError("The vispy renderer requires imageio-ffmpeg (pip install imageio-ffmpeg)")
+    
+    writer = imageio_ffmpeg.write_frames(
+        output_path, renderer.size, fps=fps, bitrate=f"{bitrate}k"
+    )
+    writer.send(None)  # Start ffmpeg
+    try:
+        for frame in range(total_frames):
+            update(frame)
+            writer.send(renderer.render())
+            if on_frame:
+                on_frame(frame)
+    finally:
+        writer.close()
@@ -3,10 +3,108 @@ Effect registry and base class for heart animation effects.
 """
 
 from abc import ABC, abstractmethod
+import importlib
+import importlib.util
+import math
+import os
 import numpy as np
+from core.audio_sync import AudioFeatureIndex
 
-# Effect registry - will be populated by importing effect modules
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    from . import _rotation_nb
+except ImportError:
+    _rotation_nb = None
+
+# Effect registry - populated as effect modules are imported on demand
 _EFFECT_REGISTRY = {}
+_IMPORTED_FILES = set()
+_EFFECTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Largest change in any rotation matrix entry still treated as no motion;
+# well under a pixel for hearts a few tens of units across
+ROTATION_EPSILON = 1e-4
+
+# Point count from which rotations use the numba kernel; below it the
+# call overhead outweighs the fused pass and np.matmul is as fast
+NUMBA_MIN_POINTS = 20_000
+
+
+def rotation_matrix(alpha_rad, beta_rad=0.0):
+    """
+    Rotation around the Y-axis by alpha, then around the X-axis by beta.
+    
+    Angles may be scalars or arrays, which broadcast against each other to
+    give a stack of matrices. Scalar angles skip NumPy's array machinery,
+    which costs more than the per-frame product the matrix feeds.
+    
+    Parameters:
+    - alpha_rad: Y-axis rotation angle(s) in radians
+    - beta_rad: X-axis rotation angle(s) in radians
+    
+    Returns:
+    - (..., 3, 3) float32 rotation matrices (Rx @ Ry)
+    """
+    if not (hasattr(alpha_rad, '__len__') or hasattr(beta_rad, '__len__')):
+        return _fill_rotation(np.empty((3, 3), dtype=np.float32), alpha_rad, beta_rad)
+    alpha_rad, beta_rad = np.broadcast_arrays(
+        np.asarray(alpha_rad, dtype=float), np.asarray(beta_rad, dtype=float)
+    )
+    ca, sa = np.cos(alpha_rad), np.sin(alpha_rad)
+    cb, sb = np.cos(beta_rad), np.sin(beta_rad)
+    zero = np.zeros_like(ca)
+    matrix = np.stack([
+        ca, zero, sa,
+        sb * sa, cb, -sb * ca,
+        -cb * sa, sb, cb * ca,
+    ], axis=-1)
+    return matrix.reshape(ca.shape + (3, 3)).astype(np.float32)
+
+
+def _fill_rotation(out, alpha_rad, beta_rad=0.0, scale=1.0):
+    """
+    Write one scaled rotation matrix (as rotation_matrix) into out.
+    
+    Parameters:
+    - out: (3, 3) float32 C-contiguous array
+    - alpha_rad, beta_rad: Scalar rotation angles in radians
+    - scale: Uniform scale folded into the matrix
+    
+    Returns:
+    - out
+    """
+    ca, sa = math.cos(alpha_rad) * scale, math.sin(alpha_rad) * scale
+    cb, sb = math.cos(beta_rad), math.sin(beta_rad)
+    flat = out.reshape(9)
+    flat[0] = ca
+    flat[1] = 0.0
+    flat[2] = sa
+    flat[3] = sb * sa
+    flat[4] = cb * scale
+    flat[5] = -sb * ca
+    flat[6] = -cb * sa
+    flat[7] = sb * scale
+    flat[8] = cb * ca
+    return out
+
+
+def _rotate_into(matrix, points, out):
+    """
+    Write matrix @ points into out.
+    
+    Parameters:
+    - matrix: (3, 3) float32 matrix
+    - points: (3, N) float32 point block
+    - out: (3, N) float32 output block
+    """
+    if _rotation_nb is not None and points.shape[1] >= NUMBA_MIN_POINTS:
+        _rotation_nb.rotate(matrix, points, out)
+    else:
+        np.matmul(matrix, points, out=out)
 
 
 class BaseEffect(ABC):
@@ -33,18 +131,64 @@ class BaseEffect(ABC):
         """
         self.total_frames = total_frames
         self.fps = fps
-        self.x_original = x_original
-        self.y_original = y_original
-        self.z_original = z_original
         self.scatter = scatter
         self.ax = ax
         self.audio_features = audio_features or {}
+        # Timestamped features as sorted arrays for per-frame lookups
+        self.audio_index = AudioFeatureIndex.from_features(audio_features)
+        
+        # Original points as one (3, N) float32 block, rotated into a
+        # preallocated buffer by rotate_points(). The *_original arrays are
+        # its rows, so every per-frame pass over them moves 4-byte floats
+        self._points = np.ascontiguousarray(
+            np.stack([x_original, y_original, z_original]), dtype=np.float32
+        )
+        self.x_original, self.y_original, self.z_original = self._points
+        self._rotated = np.empty_like(self._points)
+        # X and Z rows written by spin_points()
+        self._spun = np.empty((2, self._points.shape[1]), dtype=np.float32)
+        # Per-frame trig and rotation lookup tables, built on first use since
+        # total_frames is only final once the effect is set up
+        self._spin_tables = {}
+        self._rotation_tables = {}
+        self._frame_tables = {}
+        self._angle_steps = {}
+        # Matrix behind the current contents of the rotation buffer, and
+        # scratch matrices filled by rotate_points() / rotate_block()
+        self._last_rotation = None
+        self._matrix = np.empty((3, 3), dtype=np.float32)
+        self._block_matrix = np.empty((3, 3), dtype=np.float32)
+        # Camera and opacity last applied, so unchanged values skip matplotlib
+        self._last_view = None
+        self._last_zoom = None
+        self._last_alpha = None
     
     @abstractmethod
     def get_total_frames(self):
         """Return total frames for this effect."""
         pass
     
+    @classmethod
+    def count_frames(cls, fps, audio_features=None):
+        """
+        Total frames of the effect, without building a figure or scatter.
+        
+        get_total_frames() only reads the frame rate and audio features, so
+        it is called on an instance that skips __init__.
+        
+        Parameters:
+        - fps: Frames per second
+        - audio_features: Optional dict with audio features for sync
+        
+        Returns:
+        - Number of frames
+        """
+        probe = cls.__new__(cls)
+        probe.fps = fps
+        probe.audio_features = audio_features or {}
+        probe.audio_index = AudioFeatureIndex.from_features(audio_features)
+        return probe.get_total_frames()
+    
     @abstractmethod
     def update(self, frame):
         """
@@ -58,6 +202,264 @@ class BaseEffect(ABC):
         """
         pass
     
+    def frame_table(self, build):
+        """
+        Per-frame scalar parameters, evaluated once for the whole effect.
+        
+        Parameters:
+        - build: Function taking the normalized times (0-1) of every frame
+          as an array and returning one array per parameter
+        
+        Returns:
+        - (total_frames, K) array; row `frame` holds that frame's K parameters
+        """
+        key = (build.__name__, self.total_frames)
+        table = self._frame_tables.get(key)
+        if table is None:
+            t = np.arange(self.total_frames) / self.total_frames
+            table = self._frame_tables[key] = np.column_stack(build(t))
+        return table
+    
+    def spin_table(self, degrees=360):
+        """
+        Cosine and sine of the Y-axis angle `frame * degrees / total_frames`.
+        
+        The angle takes one value per frame, so the trig is evaluated once
+        for the whole effect instead of on every update.
+        
+        Parameters:
+        - degrees: Total rotation over the effect
+        
+        Returns:
+        - tuple: (cos, sin) float32 arrays indexed by frame, so products
+          with the point arrays stay float32
+        """
+        key = (degrees, self.total_frames)
+        table = self._spin_tables.get(key)
+        if table is None:
+            alpha_rad = np.deg2rad(np.arange(self.total_frames) * degrees / self.total_frames)
+            table = self._spin_tables[key] = (
+                np.cos(alpha_rad).astype(np.float32), np.sin(alpha_rad).astype(np.float32)
+            )
+        return table
+    
+    def spin(self, frame, degrees=360):
+        """
+        Cosine and sine of the Y-axis angle for a frame, from spin_table().
+        
+        Parameters:
+        - frame: Current frame number
+        - degrees: Total rotation over the effect
+        
+        Returns:
+        - tuple: (cos, sin) float32 scalars
+        """
+        cos_table, sin_table = self.spin_table(degrees)
+        return cos_table[frame], sin_table[frame]
+    
+    def radians_per_frame(self, degrees=360, frames=None):
+        """
+        Angle step, in radians, of a rotation by `degrees` over `frames`.
+        
+        For effects whose rotation speed varies (e.g. with the audio tempo),
+        so the angle is `frame * speed * step` without a degree conversion
+        on every update.
+        
+        Parameters:
+        - degrees: Total rotation
+        - frames: Frames the rotation spans (default: the whole effect)
+        
+        Returns:
+        - float: Radians per frame
+        """
+        if frames is None:
+            frames = self.total_frames
+        key = (degrees, frames)
+        step = self._angle_steps.get(key)
+        if step is None:
+            step = self._angle_steps[key] = math.radians(degrees) / frames
+        return step
+    
+    def spin_points(self, frame, degrees=360):
+        """
+        Rotate the original points around the Y-axis for a frame.
+        
+        Uses the spin_table() angles and writes into a buffer reused every
+        frame, fused into one threaded pass per row with numexpr when it is
+        installed. The returned arrays are overwritten by the next call and
+        must not be modified in place.
+        
+        Parameters:
+        - frame: Current frame number
+        - degrees: Total rotation over the effect
+        
+        Returns:
+        - tuple: (x, y, z) rotated coordinate arrays
+        """
+        ca, sa = self.spin(frame, degrees)
+        xo, yo, zo = self._points
+        x, z = self._spun
+        if numexpr is not None:
+            operands = {'xo': xo, 'zo': zo, 'ca': ca, 'sa': sa}
+            numexpr.evaluate('xo * ca + zo * sa', local_dict=operands, out=x)
+            numexpr.evaluate('zo * ca - xo * sa', local_dict=operands, out=z)
+        else:
+            np.multiply(xo, ca, out=x)
+            x += zo * sa
+            np.multiply(zo, ca, out=z)
+            z -= xo * sa
+        return x, yo, z
+    
+    def rotation_table(self, degrees=360, wobble_deg=0.0):
+        """
+        Rotation matrix for every frame of the effect.
+        
+        Parameters:
+        - degrees: Total Y-axis rotation over the effect
+        - wobble_deg: Amplitude of an X-axis wobble making one full cycle
+          over the effect
+        
+        Returns:
+        - (total_frames, 3, 3) float32 rotation matrices
+        """
+        key = (degrees, wobble_deg, self.total_frames)
+        table = self._rotation_tables.get(key)
+        if table is None:
+            frames = np.arange(self.total_frames)
+            alpha_rad = np.deg2rad(frames * degrees / self.total_frames)
+            beta_rad = np.deg2rad(wobble_deg * np.sin(2 * np.pi * frames / self.total_frames))
+            table = self._rotation_tables[key] = rotation_matrix(alpha_rad, beta_rad)
+        return table
+    
+    def rotate_frame(self, frame, degrees=360, wobble_deg=0.0, scale=1.0):
+        """
+        Rotate the original points by the precomputed matrix for a frame.
+        
+        Parameters:
+        - frame: Current frame number
+        - degrees: Total Y-axis rotation over the effect
+        - wobble_deg: Amplitude of the X-axis wobble
+        - scale: Uniform scale factor applied after rotating
+        
+        Returns:
+        - tuple: (x, y, z) rotated coordinate arrays, see rotate_points()
+        """
+        return self._apply_rotation(self.rotation_table(degrees, wobble_deg)[frame], scale)
+    
+    def rotate_points(self, alpha_rad, beta_rad=0.0, scale=1.0):
+        """
+        Rotate the original points (Y-axis, then X-axis) and scale them.
+        
+        One matrix product into a buffer reused every frame; the returned
+        arrays are overwritten by the next call.
+        
+        Parameters:
+        - alpha_rad: Y-axis rotation angle in radians
+        - beta_rad: X-axis rotation angle in radians
+        - scale: Uniform scale factor applied after rotating
+        
+        Returns:
+        - tuple: (x, y, z) rotated coordinate arrays
+        """
+        return self._apply_rotation(
+            _fill_rotation(self._matrix, alpha_rad, beta_rad, scale), 1.0
+        )
+    
+    @staticmethod
+    def heart_block(x, y, z):
+        """
+        Stack another heart's coordinates for rotate_block().
+        
+        Parameters:
+        - x, y, z: Heart coordinates
+        
+        Returns:
+        - tuple: ((3, N) float32 points, (3, N) buffer for their rotation)
+        """
+        points = np.ascontiguousarray(np.stack([x, y, z]), dtype=np.float32)
+        return points, np.empty_like(points)
+    
+    def rotate_block(self, block, alpha_rad, beta_rad=0.0, scale=1.0):
+        """
+        Rotate a heart_block() like rotate_points() rotates the original points.
+        
+        The product is written into the block's own buffer, so the returned
+        arrays are overwritten by the next call for the same block.
+        
+        Parameters:
+        - block: (points, buffer) from heart_block()
+        - alpha_rad: Y-axis rotation angle in radians
+        - beta_rad: X-axis rotation angle in radians
+        - scale: Uniform scale factor applied after rotating
+        
+        Returns:
+        - tuple: (x, y, z) rotated coordinate arrays
+        """
+        points, rotated = block
+        matrix = _fill_rotation(self._block_matrix, alpha_rad, beta_rad, scale)
+        _rotate_into(matrix, points, rotated)
+        return rotated[0], rotated[1], rotated[2]
+    
+    def _apply_rotation(self, matrix, scale):
+        """
+        Multiply the original points by a (3, 3) matrix into the buffer.
+        
+        When the scaled matrix is within ROTATION_EPSILON of the previous
+        one (a repeated frame, or a pause in motion) the buffer already
+        holds the result and the product is skipped.
+        """
+        if scale != 1.0:
+            matrix = matrix * np.float32(scale)
+        last = self._last_rotation
+        if last is None or np.abs(matrix - last).max() >= ROTATION_EPSILON:
+            _rotate_into(matrix, self._points, self._rotated)
+            if last is None:
+                self._last_rotation = matrix.copy()
+            else:
+                np.copyto(last, matrix)
+        return self._rotated[0], self._rotated[1], self._rotated[2]
+    
+    def set_view(self, elevation, azimuth):
+        """
+        Point the camera, skipping view_init() when the angles are unchanged.
+        
+        Parameters:
+        - elevation: Camera elevation in degrees
+        - azimuth: Camera azimuth in degrees
+        """
+        view = (elevation, azimuth)
+        if view != self._last_view:
+            self.ax.view_init(elev=elevation, azim=azimuth)
+            self._last_view = view
+    
+    def set_zoom(self, zoom_factor):
+        """
+        Set cubic axis limits [-zoom_factor, zoom_factor] on all three axes.
+        
+        Each set_*lim() call invalidates the axes, so they are skipped while
+        the zoom is held (as in the constant-zoom phases of G2 and H1).
+        
+        Parameters:
+        - zoom_factor: Half-width of the visible cube
+        """
+        if zoom_factor != self._last_zoom:
+            limits = [-zoom_factor, zoom_factor]
+            self.ax.set_xlim(limits)
+            self.ax.set_ylim(limits)
+            self.ax.set_zlim(limits)
+            self._last_zoom = zoom_factor
+    
+    def set_point_alpha(self, alpha):
+        """
+        Set the opacity of the main scatter, skipping it when unchanged.
+        
+        Parameters:
+        - alpha: Point opacity (0-1)
+        """
+        if alpha != self._last_alpha:
+            self.scatter.set_alpha(alpha)
+            self._last_alpha = alpha
+    
     def get_normalized_time(self, frame):
         """Get normalized time (0-1) for given frame."""
         return frame / self.total_frames
@@ -78,98 +480,77 @@ def register_effect(effect_name, effect_class):
     _EFFECT_REGISTRY[effect_name] = effect_class
 
 
+def _effect_files():
+    """
+    Effect module files in this package, keyed by lowercase effect name.
+    
+    'effect_h8sync.py' is keyed 'h8sync'; files whose names are not valid
+    module names (e.g. 'i2-TwoHearts-Kalinka.py') are keyed by their stem.
+    """
+    files = {}
+    for filename in os.listdir(_EFFECTS_DIR):
+        stem, ext = os.path.splitext(filename)
+        if ext != '.py' or stem.startswith('_'):
+            continue
+        key = stem.lower()
+        if key.startswith('effect_'):
+            key = key[len('effect_'):]
+        files[key] = filename
+    return files
+
+
+def _import_effect_file(filename):
+    """
+    Import one effect module, which registers its effect(s) on import.
+    
+    Parameters:
+    - filename: File name within the effects package
+    """
+    if filename in _IMPORTED_FILES:
+        return
+    _IMPORTED_FILES.add(filename)
+    stem = os.path.splitext(filename)[0]
+    try:
+        if stem.isidentifier():
+            importlib.import_module(f"{__name__}.{stem}")
+        else:
+            # Effects with dashes in the filename can't use a regular import
+            spec = importlib.util.spec_from_file_location(
+                stem.replace('-', '_'), os.path.join(_EFFECTS_DIR, filename)
+            )
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+    except ImportError:
+        # Effect depends on something that is not installed
+        pass
+
+
 def get_effect_class(effect_name):
     """
     Get effect class by name.
     
+    Only the module defining the requested effect is imported, on first use.
+    
     Parameters:
     - effect_name: String identifier (e.g., 'A', 'B', 'H1')
     
     Returns:
     - Effect class or None if not found
     """
+    if effect_name not in _EFFECT_REGISTRY:
+        filename = _effect_files().get(effect_name.lower())
+        if filename is not None:
+            _import_effect_file(filename)
     return _EFFECT_REGISTRY.get(effect_name)
 
 
 def get_all_effect_names():
-    """Get list of all registered effect names."""
+    """Get list of all effect names, importing every effect module."""
+    for filename in sorted(_effect_files().values()):
+        _import_effect_file(filename)
     return sorted(_EFFECT_REGISTRY.keys())
 
 
-# Import all effects to register them
-# This will populate the registry
-try:
-    from . import effect_a
-    from . import effect_b
-    from . import effect_c
-    from . import effect_d
-    from . import effect_e
-    from . import effect_f
-    from . import effect_g
-    from . import effect_g1
-    from . import effect_g2
-    from . import effect_h1
-    from . import effect_h2
-    from . import effect_h3
-    from . import effect_h4
-    from . import effect_h5
-    from . import effect_h6
-    from . import effect_h7
-    from . import effect_h8
-    from . import effect_h8sync
-    from . import effect_h8sync3min
-    from . import effect_h9
-    from . import effect_h10
-    from . import effect_i1
-    from . import effect_i2
-    from . import effect_i3
-    # Import effects with dashes in filename using importlib.util
-    import importlib.util
-    import os
-    _current_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Import I2-TwoHearts-BeMyLover
-    _effect_file = os.path.join(_current_dir, 'i2-TwoHearts-BeMyLover.py')
-    if os.path.exists(_effect_file):
-        spec = importlib.util.spec_from_file_location("i2_TwoHearts_BeMyLover", _effect_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-    
-    # Import I2-TwoHearts-WomanInLove
-    _effect_file = os.path.join(_current_dir, 'i2-TwoHearts-WomanInLove.py')
-    if os.path.exists(_effect_file):
-        spec = importlib.util.spec_from_file_location("i2_TwoHearts_WomanInLove", _effect_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-    
-    # Import I2-TwoHearts-WakaWaka
-    _effect_file = os.path.join(_current_dir, 'i2-TwoHearts-WakaWaka.py')
-    if os.path.exists(_effect_file):
-        spec = importlib.util.spec_from_file_location("i2_TwoHearts_WakaWaka", _effect_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-    
-    # Import I2-TwoHearts-Katyusha
-    _effect_file = os.path.join(_current_dir, 'i2-TwoHearts-Katyusha.py')
-    if os.path.exists(_effect_file):
-        spec = importlib.util.spec_from_file_location("i2_TwoHearts_Katyusha", _effect_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-    
-    # Import I2-TwoHearts-Kalinka
-    _effect_file = os.path.join(_current_dir, 'i2-TwoHearts-Kalinka.py')
-    if os.path.exists(_effect_file):
-        spec = importlib.util.spec_from_file_location("i2_TwoHearts_Kalinka", _effect_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-except ImportError:
-    # Effects not yet created, will be imported later
-    pass
-
-__all__ = ['BaseEffect', 'register_effect', 'get_effect_class', 'get_all_effect_names']
+__all__ = ['BaseEffect', 'rotation_matrix', 'register_effect', 'get_effect_class', 'get_all_effect_names']
 
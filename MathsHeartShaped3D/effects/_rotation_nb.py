@@ -0,0 +1,30 @@
+"""
+Numba kernel for rotating effect point blocks.
+
+Importing this module raises ImportError when numba is not installed;
+effects then rotate with np.matmul.
+"""
+
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def rotate(matrix, points, out):
+    """
+    Write matrix @ points into out in one fused pass, points split across cores.
+
+    Parameters:
+    - matrix: (3, 3) float32 rotation matrix (optionally scaled)
+    - points: (3, N) float32 point block
+    - out: (3, N) float32 output block
+    """
+    m00, m01, m02 = matrix[0, 0], matrix[0, 1], matrix[0, 2]
+    m10, m11, m12 = matrix[1, 0], matrix[1, 1], matrix[1, 2]
+    m20, m21, m22 = matrix[2, 0], matrix[2, 1], matrix[2, 2]
+    for i in prange(points.shape[1]):
+        x = points[0, i]
+        y = points[1, i]
+        z = points[2, i]
+        out[0, i] = m00 * x + m01 * y + m02 * z
+        out[1, i] = m10 * x + m11 * y + m12 * z
+        out[2, i] = m20 * x + m21 * y + m22 * z
@@ -12,17 +12,18 @@ class EffectB(BaseEffect):
     def get_total_frames(self):
         return 900  # 30 seconds at 30 fps
     
+    def _camera_path(self, t):
+        # Camera orbits around the heart
+        azimuth = 45 + 360 * t
+        elevation = 20 + 20 * np.sin(2 * np.pi * t)  # Elevation oscillates
+        return elevation, azimuth
+    
     def update(self, frame):
-        # Calculate normalized time (0 to 1)
-        t = self.get_normalized_time(frame)
-        
         # Heart doesn't rotate
         self.scatter._offsets3d = (self.x_original, self.y_original, self.z_original)
         
-        # Camera orbits around the heart
-        azimuth = 45 + 360 * t
-        elevation = 20 + 20 * np.sin(2 * np.pi * t)  # Elevation oscillates
-        self.ax.view_init(elev=elevation, azim=azimuth)
+        elevation, azimuth = self.frame_table(self._camera_path)[frame]
+        self.set_view(elevation, azimuth)
         
         return self.scatter,
 
@@ -12,20 +12,7 @@ class EffectG(BaseEffect):
     def get_total_frames(self):
         return 900  # 30 seconds at 30 fps
     
-    def update(self, frame):
-        # Calculate normalized time (0 to 1)
-        t = self.get_normalized_time(frame)
-        
-        # Rotate heart around Y-axis
-        alpha_deg = frame * 360 / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
-        
-        x_rotated = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-        y_rotated = self.y_original
-        z_rotated = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
-        
-        self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        
+    def _camera_path(self, t):
         # Camera follows a figure-8 (lemniscate) path
         # Parametric equations for figure-8: x = sin(t), y = sin(t)*cos(t)
         azimuth_offset = 60 * np.sin(2 * np.pi * t)  # Horizontal figure-8 component
@@ -34,13 +21,17 @@ class EffectG(BaseEffect):
         azimuth = 45 + azimuth_offset + 180 * t  # Also slowly rotate around
         elevation = 20 + elevation_offset
         
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        
         # Subtle zoom synchronized with figure-8 motion
         zoom_factor = 20 + 4 * np.sin(2 * np.pi * t)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        return elevation, azimuth, zoom_factor
+    
+    def update(self, frame):
+        # Rotate heart around Y-axis
+        self.scatter._offsets3d = self.rotate_frame(frame, 360)
+        
+        elevation, azimuth, zoom_factor = self.frame_table(self._camera_path)[frame]
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
@@ -6,159 +6,151 @@ import numpy as np
 from effects import BaseEffect, register_effect
 
 
+# Camera phases as functions of the seconds s falling inside them, each
+# returning (point_alpha, elevation, azimuth, zoom_factor)
+
+def _fade_in(s):
+    # Phase 1 (0-1s): Fade in from black
+    return s, 20, 45, 12  # Zoom changed from 25 to 12 (heart 2x bigger)
+
+
+def _reveal(s):
+    # Phase 2 (1-3s): Gradually show heart with G1 starting position
+    t = (s - 1.0) / 2.0
+    return 0.8, 10 + 10 * t, 45, 80 - 68 * t  # Zoom 80 to 12 (closer for larger heart)
+
+
+# Phase 3 (3-60s) runs a condensed G1: 0-20s zoom through, 20-30s exit and
+# turn, 30-60s orbit
+def _g1_zoom_through(s):
+    t = (s - 3.0) / 57.0 / 0.35
+    return 0.8, 20 + 5 * np.sin(np.pi * t), 45, 12 - 22 * (t ** 2)  # 12 to -10 (through heart, larger)
+
+
+def _g1_turn(s):
+    t = ((s - 3.0) / 57.0 - 0.35) / 0.18
+    return 0.8, 20, 45 + 180 * t, -10 + 22 * t  # -10 to 12 (adjusted)
+
+
+def _g1_orbit(s):
+    t = ((s - 3.0) / 57.0 - 0.53) / 0.47
+    return 0.8, 20 + 20 * np.sin(2 * np.pi * t), 225 + 360 * t, 12 - 2 * t  # 12 to 10 (closer orbit)
+
+
+def _fade_out(s):
+    # Phase 4 (60-62s): Fade out heart
+    t = (s - 60.0) / 2.0
+    return 0.8 * (1.0 - t), 20, 225 + 360 * 0.53, 10  # Zoom changed from 20 to 10
+
+
+def _formulas(s):
+    # Phase 5 (62-64s): Black screen with formulas (heart invisible)
+    # Phase 6 (64-66s): Fade formulas out (heart hidden, formulas handled by matplotlib text alpha)
+    return 0.0, 20, 45, 10
+
+
+def _fade_back_in(s):
+    # Phase 7 (66-68s): Fade heart back in at G1 starting position
+    t = (s - 66.0) / 2.0
+    return 0.8 * t, 15, 45, 30  # Zoom changed from 50 to 30 (closer start)
+
+
+def _fast_zoom_through(s):
+    # Phase 8 (68-90s): Zoom through heart (accelerated)
+    t = (s - 68.0) / 22.0
+    return 0.8, 15 + 15 * np.sin(np.pi * t), 45 + 90 * t, 30 - 50 * (t ** 1.5)  # 30 to -20 (adjusted range)
+
+
+def _exit_behind(s):
+    # Phase 9 (90-92s): Exit and show heart from behind
+    t = (s - 90.0) / 2.0
+    return 0.8, 30, 135 + 90 * t, -20 + 35 * t  # Complete the turn; zoom -20 to 15 (closer)
+
+
+def _slow_zoom_out(s):
+    # Phase 10 (92-102s): Slow zoom out, heart gets smaller
+    t = (s - 92.0) / 10.0
+    return 0.8, 30 - 10 * t, 225 + 180 * t, 15 + 50 * t  # Slowly descend; zoom 15 to 65 (not as far)
+
+
+def _dramatic_zoom_in(s):
+    # Phase 11 (102-122s): Zoom back in dramatically
+    t = (s - 102.0) / 20.0
+    return (
+        0.8,
+        20 + 25 * np.sin(np.pi * t),  # Dramatic arc
+        405 + 270 * t,  # Continue orbit
+        65 - 55 * (t ** 2),  # Dramatic zoom: 65 down to 10, accelerating
+    )
+
+
+def _moon_orbit(s):
+    # Phase 12 (122-132s): Moon orbit around heart
+    t = (s - 122.0) / 10.0
+    return (
+        0.8,
+        25 + 15 * np.sin(2 * np.pi * 2 * t),  # 2 oscillations
+        675 + 720 * t,  # 2 complete orbits
+        10 + 4 * np.sin(2 * np.pi * t),  # Closer orbit (10±4)
+    )
+
+
+def _finale(s):
+    # Phase 13 (132-137s): Quick zoom out and fade to black
+    t = (s - 132.0) / 5.0
+    return 0.8 * (1.0 - t), 25 - 25 * t, 1395 + 180 * t, 10 + 60 * (t ** 2)  # Return to neutral; zoom 10 to 70
+
+
+def _after_end(s):
+    # Fallback (shouldn't reach here)
+    return 0.0, 20, 45, 10
+
+
+# Phase end times in seconds, sorted, and the camera for each phase; frames
+# at or past the last end fall through to _after_end
+PHASE_ENDS = np.array([1.0, 3.0, 3.0 + 57.0 * 0.35, 3.0 + 57.0 * 0.53, 60.0, 62.0, 66.0,
+                       68.0, 90.0, 92.0, 102.0, 122.0, 132.0, 137.0])
+PHASE_CAMERAS = (
+    _fade_in, _reveal, _g1_zoom_through, _g1_turn, _g1_orbit, _fade_out, _formulas,
+    _fade_back_in, _fast_zoom_through, _exit_behind, _slow_zoom_out, _dramatic_zoom_in,
+    _moon_orbit, _finale, _after_end,
+)
+
+
 class EffectG2(BaseEffect):
     """Epic Heart Story: multi-phase journey with fade in/out and formulas."""
     
     def get_total_frames(self):
         return 4110  # 137 seconds at 30 fps
     
-    def update(self, frame):
-        # Convert frame to seconds for easier calculation
-        current_second = self.get_current_second(frame)
-        
-        # Heart rotates throughout entire animation (slower - 270 degrees total)
-        alpha_deg = frame * 270 / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
-        
-        x_rotated = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-        y_rotated = self.y_original
-        z_rotated = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+    def _camera_path(self, t):
+        # Seconds over the whole effect, matching get_current_second()
+        s = np.arange(len(t)) / self.fps
         
-        # Default alpha for heart points
-        point_alpha = 0.8
+        # Each frame's phase by binary search over the phase ends, then each
+        # phase's camera is evaluated on its own frames only
+        phase = np.searchsorted(PHASE_ENDS, s, side='right')
+        path = np.empty((4, len(s)))
+        for index, camera in enumerate(PHASE_CAMERAS):
+            frames = phase == index
+            if frames.any():
+                for row, values in zip(path, camera(s[frames])):
+                    row[frames] = values
         
-        # Phase 1 (0-1s): Fade in from black
-        if current_second < 1.0:
-            point_alpha = current_second  # 0 to 1
-            zoom_factor = 12  # Changed from 25 to 12 (heart 2x bigger)
-            elevation = 20
-            azimuth = 45
-            
-        # Phase 2 (1-3s): Gradually show heart with G1 starting position
-        elif current_second < 3.0:
-            phase_t = (current_second - 1.0) / 2.0
-            point_alpha = 0.8
-            zoom_factor = 80 - 68 * phase_t  # 80 to 12 (closer for larger heart)
-            elevation = 10 + 10 * phase_t  # 10 to 20
-            azimuth = 45
-            
-        # Phase 3 (3-60s): Run G1 effect (first 57 seconds of it - condensed)
-        elif current_second < 60.0:
-            phase_t = (current_second - 3.0) / 57.0  # Normalize to 0-1
-            point_alpha = 0.8
-            
-            # Condensed G1: zoom through, turn, and start orbit
-            if phase_t < 0.35:  # 0-20s: Zoom through
-                sub_t = phase_t / 0.35
-                zoom_factor = 12 - 22 * (sub_t ** 2)  # 12 to -10 (through heart, larger)
-                elevation = 20 + 5 * np.sin(np.pi * sub_t)
-                azimuth = 45
-            elif phase_t < 0.53:  # 20-30s: Exit and turn
-                sub_t = (phase_t - 0.35) / 0.18
-                zoom_factor = -10 + 22 * sub_t  # -10 to 12 (adjusted)
-                elevation = 20
-                azimuth = 45 + 180 * sub_t
-            else:  # 30-60s: Start orbital motion
-                sub_t = (phase_t - 0.53) / 0.47
-                zoom_factor = 12 - 2 * sub_t  # 12 to 10 (closer orbit)
-                elevation = 20 + 20 * np.sin(2 * np.pi * sub_t)
-                azimuth = 225 + 360 * sub_t
-                
-        # Phase 4 (60-62s): Fade out heart
-        elif current_second < 62.0:
-            phase_t = (current_second - 60.0) / 2.0
-            point_alpha = 0.8 * (1.0 - phase_t)  # 0.8 to 0
-            zoom_factor = 10  # Changed from 20 to 10
-            elevation = 20
-            azimuth = 225 + 360 * 0.53
-            
-        # Phase 5 (62-64s): Black screen with formulas (heart invisible)
-        elif current_second < 64.0:
-            point_alpha = 0.0  # Heart invisible
-            zoom_factor = 10  # Changed from 20 to 10
-            elevation = 20
-            azimuth = 45
-            # Formula display handled by setup_figure, just keep heart hidden
-            
-        # Phase 6 (64-66s): Fade formulas out (keep heart hidden, formulas handled by matplotlib text alpha)
-        elif current_second < 66.0:
-            point_alpha = 0.0  # Heart still invisible
-            zoom_factor = 10  # Changed from 20 to 10
-            elevation = 20
-            azimuth = 45
-            
-        # Phase 7 (66-68s): Fade heart back in at G1 starting position
-        elif current_second < 68.0:
-            phase_t = (current_second - 66.0) / 2.0
-            point_alpha = 0.8 * phase_t  # 0 to 0.8
-            zoom_factor = 30  # Changed from 50 to 30 (closer start)
-            elevation = 15
-            azimuth = 45
-            
-        # Phase 8 (68-90s): Zoom through heart (accelerated)
-        elif current_second < 90.0:
-            phase_t = (current_second - 68.0) / 22.0
-            point_alpha = 0.8
-            zoom_factor = 30 - 50 * (phase_t ** 1.5)  # 30 to -20 (adjusted range)
-            elevation = 15 + 15 * np.sin(np.pi * phase_t)
-            azimuth = 45 + 90 * phase_t
-            
-        # Phase 9 (90-92s): Exit and show heart from behind
-        elif current_second < 92.0:
-            phase_t = (current_second - 90.0) / 2.0
-            point_alpha = 0.8
-            zoom_factor = -20 + 35 * phase_t  # -20 to 15 (closer)
-            elevation = 30
-            azimuth = 135 + 90 * phase_t  # Complete the turn
-            
-        # Phase 10 (92-102s): Slow zoom out, heart gets smaller
-        elif current_second < 102.0:
-            phase_t = (current_second - 92.0) / 10.0
-            point_alpha = 0.8
-            zoom_factor = 15 + 50 * phase_t  # 15 to 65 (not as far)
-            elevation = 30 - 10 * phase_t  # Slowly descend
-            azimuth = 225 + 180 * phase_t
-            
-        # Phase 11 (102-122s): Zoom back in dramatically
-        elif current_second < 122.0:
-            phase_t = (current_second - 102.0) / 20.0
-            point_alpha = 0.8
-            # Dramatic zoom: 65 down to 10 (very close)
-            zoom_factor = 65 - 55 * (phase_t ** 2)  # Accelerating zoom in
-            elevation = 20 + 25 * np.sin(np.pi * phase_t)  # Dramatic arc
-            azimuth = 405 + 270 * phase_t  # Continue orbit
-            
-        # Phase 12 (122-132s): Moon orbit around heart
-        elif current_second < 132.0:
-            phase_t = (current_second - 122.0) / 10.0
-            point_alpha = 0.8
-            zoom_factor = 10 + 4 * np.sin(2 * np.pi * phase_t)  # Closer orbit (10±4)
-            elevation = 25 + 15 * np.sin(2 * np.pi * 2 * phase_t)  # 2 oscillations
-            azimuth = 675 + 720 * phase_t  # 2 complete orbits
-            
-        # Phase 13 (132-137s): Quick zoom out and fade to black
-        elif current_second < 137.0:
-            phase_t = (current_second - 132.0) / 5.0
-            point_alpha = 0.8 * (1.0 - phase_t)  # Fade out: 0.8 to 0
-            zoom_factor = 10 + 60 * (phase_t ** 2)  # 10 to 70 (less dramatic)
-            elevation = 25 - 25 * phase_t  # Return to neutral
-            azimuth = 1395 + 180 * phase_t
+        return path
+    
+    def update(self, frame):
+        # Heart rotates throughout entire animation (slower - 270 degrees total)
+        x_rotated, y_rotated, z_rotated = self.spin_points(frame, 270)
         
-        else:
-            # Fallback (shouldn't reach here)
-            point_alpha = 0.0
-            zoom_factor = 10  # Changed from 20 to 10
-            elevation = 20
-            azimuth = 45
+        point_alpha, elevation, azimuth, zoom_factor = self.frame_table(self._camera_path)[frame]
         
         # Apply alpha and position
-        self.scatter.set_alpha(point_alpha)
+        self.set_point_alpha(point_alpha)
         self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
         
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
@@ -4,7 +4,7 @@ Real-time audio-synchronized animation with strategic through-heart passages
 Improved zoom factors to keep heart visible throughout
 """
 
-import numpy as np
+import math
 from effects import BaseEffect, register_effect
 from core.audio_sync import (
     get_beat_intensity,
@@ -22,7 +22,7 @@ class EffectH10(BaseEffect):
         # Calculate duration from audio features if available, otherwise use default
         # Default: estimate 4 minutes (240 seconds) for classical piece
         if self.audio_features and 'rms_times' in self.audio_features:
-            rms_times = self.audio_features.get('rms_times', [])
+            rms_times = self.audio_index.rms_times
             if len(rms_times) > 0:
                 duration = rms_times[-1]  # Last RMS timestamp approximates duration
                 return int(duration * 30)  # 30 fps
@@ -38,14 +38,14 @@ class EffectH10(BaseEffect):
         
         # Load audio features if available
         if self.audio_features:
-            beat_times = self.audio_features.get('beat_times', [])
-            onset_times = self.audio_features.get('onset_times', [])
-            rms_times = self.audio_features.get('rms_times', [])
-            rms_values = self.audio_features.get('rms_values', [])
-            bass_times = self.audio_features.get('bass_times', [])
-            bass_values = self.audio_features.get('bass_values', [])
-            tempo_times = self.audio_features.get('tempo_times', [])
-            tempo_values = self.audio_features.get('tempo_values', [])
+            beat_times = self.audio_index.beat_times
+            onset_times = self.audio_index.onset_times
+            rms_times = self.audio_index.rms_times
+            rms_values = self.audio_index.rms_values
+            bass_times = self.audio_index.bass_times
+            bass_values = self.audio_index.bass_values
+            tempo_times = self.audio_index.tempo_times
+            tempo_values = self.audio_index.tempo_values
             
             # Get current audio features
             beat_intensity = get_beat_intensity(current_second, beat_times, window=0.1)
@@ -63,12 +63,7 @@ class EffectH10(BaseEffect):
         
         # Heart rotates 360+ degrees over full duration, tempo-adaptive (slower for classical)
         tempo_factor = current_tempo / 60.0  # Normalize to 60 BPM baseline (slower than H9)
-        alpha_deg = frame * 360 * tempo_factor / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
-        
-        x_base = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-        y_base = self.y_original
-        z_base = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+        alpha_rad = frame * tempo_factor * self.radians_per_frame(360)
         
         # Heartbeat pulse synchronized with beats (gentler for classical)
         heartbeat_scale = 1.0
@@ -78,12 +73,8 @@ class EffectH10(BaseEffect):
         if onset_intensity > 0.5:
             heartbeat_scale = max(heartbeat_scale, 1.0 + 0.1 * onset_intensity)
         
-        # Apply heartbeat
-        x_rotated = x_base * heartbeat_scale
-        y_rotated = y_base * heartbeat_scale
-        z_rotated = z_base * heartbeat_scale
-        
         point_alpha = 0.8
+        point_scale = 1.0
         
         # Calculate phase boundaries as percentages of total duration
         phase1_end = total_duration * 0.08  # 8% - Opening
@@ -105,14 +96,11 @@ class EffectH10(BaseEffect):
         if current_second < phase1_end:
             phase_t = current_second / phase1_end
             point_alpha = 0.8 * phase_t
-            scale = 0.1 + 0.9 * phase_t
-            x_rotated = x_rotated * scale
-            y_rotated = y_rotated * scale
-            z_rotated = z_rotated * scale
+            point_scale = 0.1 + 0.9 * phase_t
             # Start far, zoom to comfortable viewing distance
             base_zoom = 100 - 75 * phase_t  # 100 → 25
             zoom_factor = base_zoom - 3 * loudness  # Reduced loudness impact
-            elevation = 20 + 5 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 5 * math.sin(2 * math.pi * phase_t)
             azimuth = 45 + 45 * phase_t
         
         # Phase 2 (8-20%): Oboe melody introduction - gentle, contemplative
@@ -121,9 +109,9 @@ class EffectH10(BaseEffect):
             point_alpha = 0.7 + 0.1 * bass + 0.1 * phase_t
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Comfortable viewing distance with gentle variation
-            base_zoom = 20 + 3 * np.sin(3 * np.pi * phase_t)  # 18-23 range
+            base_zoom = 20 + 3 * math.sin(3 * math.pi * phase_t)  # 18-23 range
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 20 + 8 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 8 * math.sin(2 * math.pi * phase_t)
             azimuth = 90 + 90 * phase_t
         
         # Phase 3 (20-25%): FIRST THROUGH-HEART PASSAGE - Oboe solo climax
@@ -133,7 +121,7 @@ class EffectH10(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Start from closer distance: 30 → -15
             zoom_factor = 30 - 45 * (phase_t ** 1.5)
-            elevation = 20 + 15 * np.sin(np.pi * phase_t)
+            elevation = 20 + 15 * math.sin(math.pi * phase_t)
             azimuth = 180 + 90 * phase_t
         
         # Phase 4 (25-28%): Exit and recovery from first passage
@@ -152,9 +140,9 @@ class EffectH10(BaseEffect):
             point_alpha = 0.7 + 0.3 * bass
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Comfortable viewing with gentle movement
-            base_zoom = 20 + 5 * np.sin(4 * np.pi * phase_t)  # 15-25 range
+            base_zoom = 20 + 5 * math.sin(4 * math.pi * phase_t)  # 15-25 range
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 20 + 12 * np.sin(3 * np.pi * phase_t)
+            elevation = 20 + 12 * math.sin(3 * math.pi * phase_t)
             azimuth = 330 + 180 * phase_t
         
         # Phase 6 (45-50%): SECOND THROUGH-HEART PASSAGE - Orchestral swell
@@ -164,7 +152,7 @@ class EffectH10(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Start from medium distance: 28 → -18
             zoom_factor = 28 - 46 * (phase_t ** 2)
-            elevation = 18 + 20 * np.sin(np.pi * phase_t)
+            elevation = 18 + 20 * math.sin(math.pi * phase_t)
             azimuth = 510 + 120 * phase_t
         
         # Phase 7 (50-53%): Exit and recovery
@@ -183,9 +171,9 @@ class EffectH10(BaseEffect):
             point_alpha = 0.6 + 0.4 * bass
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Intimate to medium distance with variation
-            base_zoom = 18 + 7 * np.sin(5 * np.pi * phase_t)  # 11-25 range
+            base_zoom = 18 + 7 * math.sin(5 * math.pi * phase_t)  # 11-25 range
             zoom_factor = base_zoom - 4 * loudness
-            elevation = 20 + 15 * np.sin(4 * np.pi * phase_t)
+            elevation = 20 + 15 * math.sin(4 * math.pi * phase_t)
             azimuth = 690 + 270 * phase_t
         
         # Phase 9 (70-75%): THIRD THROUGH-HEART PASSAGE - Peak emotional moment
@@ -194,7 +182,7 @@ class EffectH10(BaseEffect):
             point_alpha = 1.0  # Maximum brightness
             # Most dramatic passage: 25 → -20
             zoom_factor = 25 - 45 * (phase_t ** 1.8)
-            elevation = 15 + 25 * np.sin(np.pi * phase_t)
+            elevation = 15 + 25 * math.sin(math.pi * phase_t)
             azimuth = 960 + 180 * phase_t
         
         # Phase 10 (75-78%): Exit from peak
@@ -215,7 +203,7 @@ class EffectH10(BaseEffect):
             # Comfortable viewing, gradually pulling back slightly
             base_zoom = 22 + 8 * phase_t  # 22 → 30
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 20 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 1200 + 120 * phase_t
         
         # Phase 12 (90-93%): FOURTH THROUGH-HEART PASSAGE - Final transformation
@@ -225,7 +213,7 @@ class EffectH10(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Final passage: 35 → -12
             zoom_factor = 35 - 47 * (phase_t ** 1.5)
-            elevation = 20 + 18 * np.sin(np.pi * phase_t)
+            elevation = 20 + 18 * math.sin(math.pi * phase_t)
             azimuth = 1320 + 90 * phase_t
         
         # Phase 13 (93-96%): Final exit and preparation for ending
@@ -249,12 +237,11 @@ class EffectH10(BaseEffect):
             elevation = 20
             azimuth = 1470 + 90 * phase_t
         
-        self.scatter.set_alpha(point_alpha)
-        self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_point_alpha(point_alpha)
+        # Rotate, pulse and scale straight into the reused point buffer
+        self.scatter._offsets3d = self.rotate_points(alpha_rad, scale=heartbeat_scale * point_scale)
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
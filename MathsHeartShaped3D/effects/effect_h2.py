@@ -2,7 +2,7 @@
 Effect H2: Time Reversal (forward then backward - 90 seconds)
 """
 
-import numpy as np
+import math
 from effects import BaseEffect, register_effect
 
 
@@ -19,25 +19,19 @@ class EffectH2(BaseEffect):
         if current_second < 45.0:
             phase_t = current_second / 45.0
             # Rotate heart
-            alpha_deg = frame * 270 / (self.total_frames // 2)
-            alpha_rad = np.deg2rad(alpha_deg)
-            x_rotated = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-            y_rotated = self.y_original
-            z_rotated = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+            alpha_rad = frame * self.radians_per_frame(270, self.total_frames // 2)
+            x_rotated, y_rotated, z_rotated = self.rotate_points(alpha_rad)
             
             # Camera motion
-            zoom_factor = 20 - 10 * phase_t + 5 * np.sin(4 * np.pi * phase_t)
-            elevation = 20 + 15 * np.sin(2 * np.pi * phase_t)
+            zoom_factor = 20 - 10 * phase_t + 5 * math.sin(4 * math.pi * phase_t)
+            elevation = 20 + 15 * math.sin(2 * math.pi * phase_t)
             azimuth = 45 + 360 * phase_t
             point_alpha = 0.8
             
         # Phase 2 (45-48s): Freeze frame at peak moment
         elif current_second < 48.0:
-            alpha_deg = (self.total_frames // 2) * 270 / (self.total_frames // 2)
-            alpha_rad = np.deg2rad(alpha_deg)
-            x_rotated = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-            y_rotated = self.y_original
-            z_rotated = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+            alpha_rad = math.radians(270)
+            x_rotated, y_rotated, z_rotated = self.rotate_points(alpha_rad)
             
             zoom_factor = 15
             elevation = 35
@@ -50,25 +44,20 @@ class EffectH2(BaseEffect):
             reverse_frame = int((1.0 - reverse_t) * (self.total_frames // 2))
             
             # Rotate heart backward
-            alpha_deg = reverse_frame * 270 / (self.total_frames // 2)
-            alpha_rad = np.deg2rad(alpha_deg)
-            x_rotated = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-            y_rotated = self.y_original
-            z_rotated = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+            alpha_rad = reverse_frame * self.radians_per_frame(270, self.total_frames // 2)
+            x_rotated, y_rotated, z_rotated = self.rotate_points(alpha_rad)
             
             # Camera motion backward
             phase_t = 1.0 - reverse_t
-            zoom_factor = 20 - 10 * phase_t + 5 * np.sin(4 * np.pi * phase_t)
-            elevation = 20 + 15 * np.sin(2 * np.pi * phase_t)
+            zoom_factor = 20 - 10 * phase_t + 5 * math.sin(4 * math.pi * phase_t)
+            elevation = 20 + 15 * math.sin(2 * math.pi * phase_t)
             azimuth = 45 + 360 * phase_t
             point_alpha = 0.8
         
-        self.scatter.set_alpha(point_alpha)
+        self.set_point_alpha(point_alpha)
         self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
@@ -2,6 +2,7 @@
 Effect H4: Dual Hearts (two hearts dancing - 120 seconds)
 """
 
+import math
 import numpy as np
 from effects import BaseEffect, register_effect
 
@@ -25,18 +26,18 @@ class EffectH4(BaseEffect):
         current_second = self.get_current_second(frame)
         
         # Rotate both hearts
-        alpha_deg = frame * 360 / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
+        ca, sa = self.spin(frame, 360)
         
         # Heart 1 (original)
-        x1 = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
+        x1 = self.x_original * ca + self.z_original * sa
         y1 = self.y_original
-        z1 = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+        z1 = -self.x_original * sa + self.z_original * ca
         
-        # Heart 2 (offset and rotated)
-        x2 = self.x_heart2 * np.cos(alpha_rad + np.pi/4) + self.z_heart2 * np.sin(alpha_rad + np.pi/4)
+        # Heart 2 (offset and rotated a further 45 degrees)
+        ca2, sa2 = (ca - sa) * math.sqrt(0.5), (sa + ca) * math.sqrt(0.5)
+        x2 = self.x_heart2 * ca2 + self.z_heart2 * sa2
         y2 = self.y_heart2
-        z2 = -self.x_heart2 * np.sin(alpha_rad + np.pi/4) + self.z_heart2 * np.cos(alpha_rad + np.pi/4)
+        z2 = -self.x_heart2 * sa2 + self.z_heart2 * ca2
         
         # Phase 1 (0-15s): First heart appears
         if current_second < 15.0:
@@ -71,14 +72,14 @@ class EffectH4(BaseEffect):
             phase_t = (current_second - 30.0) / 30.0
             point_alpha = 0.8
             orbit_radius = 8
-            angle = 2 * np.pi * phase_t
-            offset1 = orbit_radius * np.cos(angle)
-            offset2 = orbit_radius * np.cos(angle + np.pi)
+            angle = 2 * math.pi * phase_t
+            offset1 = orbit_radius * math.cos(angle)
+            offset2 = orbit_radius * math.cos(angle + math.pi)
             x_rotated = np.concatenate([x1 + offset1, x2 + offset2])
             y_rotated = np.concatenate([y1, y2])
-            z_rotated = np.concatenate([z1 + orbit_radius * np.sin(angle), z2 + orbit_radius * np.sin(angle + np.pi)])
+            z_rotated = np.concatenate([z1 + orbit_radius * math.sin(angle), z2 + orbit_radius * math.sin(angle + math.pi)])
             zoom_factor = 25
-            elevation = 20 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 135 + 360 * phase_t
         
         # Phase 4 (60-75s): Hearts spiral closer
@@ -86,12 +87,12 @@ class EffectH4(BaseEffect):
             phase_t = (current_second - 60.0) / 15.0
             point_alpha = 0.8
             orbit_radius = 8 * (1.0 - phase_t)  # Spiral in
-            angle = 2 * np.pi * phase_t * 2
-            offset1 = orbit_radius * np.cos(angle)
-            offset2 = orbit_radius * np.cos(angle + np.pi)
+            angle = 2 * math.pi * phase_t * 2
+            offset1 = orbit_radius * math.cos(angle)
+            offset2 = orbit_radius * math.cos(angle + math.pi)
             x_rotated = np.concatenate([x1 + offset1, x2 + offset2])
             y_rotated = np.concatenate([y1, y2])
-            z_rotated = np.concatenate([z1 + orbit_radius * np.sin(angle), z2 + orbit_radius * np.sin(angle + np.pi)])
+            z_rotated = np.concatenate([z1 + orbit_radius * math.sin(angle), z2 + orbit_radius * math.sin(angle + math.pi)])
             zoom_factor = 20 - 5 * phase_t
             elevation = 30 - 10 * phase_t
             azimuth = 495 + 180 * phase_t
@@ -99,7 +100,7 @@ class EffectH4(BaseEffect):
         # Phase 5 (75-85s): Hearts briefly merge/overlap
         elif current_second < 85.0:
             phase_t = (current_second - 75.0) / 10.0
-            point_alpha = 0.8 + 0.2 * np.sin(4 * np.pi * phase_t)  # Pulse
+            point_alpha = 0.8 + 0.2 * math.sin(4 * math.pi * phase_t)  # Pulse
             # Hearts at same position
             x_rotated = np.concatenate([x1, x2])
             y_rotated = np.concatenate([y1, y2])
@@ -125,14 +126,14 @@ class EffectH4(BaseEffect):
             phase_t = (current_second - 95.0) / 10.0
             point_alpha = 0.8
             orbit_radius = 4 + 4 * phase_t
-            angle = 2 * np.pi * phase_t
-            offset1 = orbit_radius * np.cos(angle)
-            offset2 = orbit_radius * np.cos(angle + np.pi)
+            angle = 2 * math.pi * phase_t
+            offset1 = orbit_radius * math.cos(angle)
+            offset2 = orbit_radius * math.cos(angle + math.pi)
             x_rotated = np.concatenate([x1 + offset1, x2 + offset2])
             y_rotated = np.concatenate([y1, y2])
-            z_rotated = np.concatenate([z1 + orbit_radius * np.sin(angle), z2 + orbit_radius * np.sin(angle + np.pi)])
+            z_rotated = np.concatenate([z1 + orbit_radius * math.sin(angle), z2 + orbit_radius * math.sin(angle + math.pi)])
             zoom_factor = 20
-            elevation = 20 + 5 * np.sin(4 * np.pi * phase_t)
+            elevation = 20 + 5 * math.sin(4 * math.pi * phase_t)
             azimuth = 855 + 360 * phase_t
         
         # Phase 8 (105-120s): Fade to black, showing connection line last
@@ -140,22 +141,20 @@ class EffectH4(BaseEffect):
             phase_t = (current_second - 105.0) / 15.0
             point_alpha = 0.8 * (1.0 - phase_t)
             orbit_radius = 8
-            angle = 2 * np.pi * (1.0 + phase_t)
-            offset1 = orbit_radius * np.cos(angle)
-            offset2 = orbit_radius * np.cos(angle + np.pi)
+            angle = 2 * math.pi * (1.0 + phase_t)
+            offset1 = orbit_radius * math.cos(angle)
+            offset2 = orbit_radius * math.cos(angle + math.pi)
             x_rotated = np.concatenate([x1 + offset1, x2 + offset2])
             y_rotated = np.concatenate([y1, y2])
-            z_rotated = np.concatenate([z1 + orbit_radius * np.sin(angle), z2 + orbit_radius * np.sin(angle + np.pi)])
+            z_rotated = np.concatenate([z1 + orbit_radius * math.sin(angle), z2 + orbit_radius * math.sin(angle + math.pi)])
             zoom_factor = 20 + 10 * phase_t
             elevation = 25
             azimuth = 1215
         
-        self.scatter.set_alpha(point_alpha)
+        self.set_point_alpha(point_alpha)
         self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
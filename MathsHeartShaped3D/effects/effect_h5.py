@@ -2,6 +2,7 @@
 Effect H5: Kaleidoscope Heart (mirrored reflections - 60 seconds)
 """
 
+import math
 import numpy as np
 from effects import BaseEffect, register_effect
 
@@ -16,11 +17,7 @@ class EffectH5(BaseEffect):
         current_second = self.get_current_second(frame)
         
         # Rotate heart
-        alpha_deg = frame * 360 / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
-        x_rotated = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-        y_rotated = self.y_original
-        z_rotated = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+        x_rotated, y_rotated, z_rotated = self.spin_points(frame, 360)
         
         point_alpha = 0.8
         
@@ -60,13 +57,13 @@ class EffectH5(BaseEffect):
         elif current_second < 40.0:
             phase_t = (current_second - 25.0) / 15.0
             # 8 hearts in octagon pattern
-            angles = np.linspace(0, 2*np.pi, 8, endpoint=False)
+            angles = np.linspace(0, 2*math.pi, 8, endpoint=False)
             x_all = []
             y_all = []
             z_all = []
             for angle in angles:
-                cos_a = np.cos(angle)
-                sin_a = np.sin(angle)
+                cos_a = math.cos(angle)
+                sin_a = math.sin(angle)
                 x_mirror = x_rotated * cos_a - z_rotated * sin_a
                 z_mirror = x_rotated * sin_a + z_rotated * cos_a
                 x_all.append(x_mirror)
@@ -77,20 +74,20 @@ class EffectH5(BaseEffect):
             y_rotated = np.concatenate(y_all)
             z_rotated = np.concatenate(z_all)
             zoom_factor = 30
-            elevation = 20 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 405 + 360 * phase_t
         
         # Phase 4 (40-50s): 16 mirrors (mandala pattern)
         elif current_second < 50.0:
             phase_t = (current_second - 40.0) / 10.0
             # 16 hearts
-            angles = np.linspace(0, 2*np.pi, 16, endpoint=False)
+            angles = np.linspace(0, 2*math.pi, 16, endpoint=False)
             x_all = []
             y_all = []
             z_all = []
             for angle in angles:
-                cos_a = np.cos(angle)
-                sin_a = np.sin(angle)
+                cos_a = math.cos(angle)
+                sin_a = math.sin(angle)
                 x_mirror = x_rotated * cos_a - z_rotated * sin_a
                 z_mirror = x_rotated * sin_a + z_rotated * cos_a
                 x_all.append(x_mirror)
@@ -101,7 +98,7 @@ class EffectH5(BaseEffect):
             y_rotated = np.concatenate(y_all)
             z_rotated = np.concatenate(z_all)
             zoom_factor = 35
-            elevation = 20 + 15 * np.sin(4 * np.pi * phase_t)
+            elevation = 20 + 15 * math.sin(4 * math.pi * phase_t)
             azimuth = 765 + 720 * phase_t
         
         # Phase 5 (50-55s): Pattern collapses back to single heart
@@ -120,16 +117,12 @@ class EffectH5(BaseEffect):
             elevation = 20
             azimuth = 45
             # Reset to single heart
-            x_rotated = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-            y_rotated = self.y_original
-            z_rotated = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+            x_rotated, y_rotated, z_rotated = self.spin_points(frame, 360)
         
-        self.scatter.set_alpha(point_alpha)
+        self.set_point_alpha(point_alpha)
         self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
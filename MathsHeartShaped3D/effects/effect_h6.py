@@ -2,7 +2,7 @@
 Effect H6: Heart Nebula (cosmic space journey - 120 seconds)
 """
 
-import numpy as np
+import math
 from effects import BaseEffect, register_effect
 
 
@@ -16,11 +16,7 @@ class EffectH6(BaseEffect):
         current_second = self.get_current_second(frame)
         
         # Rotate heart slowly
-        alpha_deg = frame * 180 / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
-        x_rotated = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-        y_rotated = self.y_original
-        z_rotated = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+        x_rotated, y_rotated, z_rotated = self.spin_points(frame, 180)
         
         point_alpha = 0.8
         
@@ -35,15 +31,15 @@ class EffectH6(BaseEffect):
         # Phase 2 (15-45s): Travel through stars toward heart-nebula
         elif current_second < 45.0:
             phase_t = (current_second - 15.0) / 30.0
-            point_alpha = 0.8 + 0.2 * np.sin(4 * np.pi * phase_t)  # Pulsing glow
+            point_alpha = 0.8 + 0.2 * math.sin(4 * math.pi * phase_t)  # Pulsing glow
             zoom_factor = 50 - 30 * phase_t  # Continue approaching
-            elevation = 20 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 45 + 180 * phase_t
         
         # Phase 3 (45-60s): Pass through "cosmic dust" (particle effects)
         elif current_second < 60.0:
             phase_t = (current_second - 45.0) / 15.0
-            point_alpha = 0.8 + 0.2 * np.sin(8 * np.pi * phase_t)  # Rapid pulsing
+            point_alpha = 0.8 + 0.2 * math.sin(8 * math.pi * phase_t)  # Rapid pulsing
             zoom_factor = 20 - 5 * phase_t  # Get very close
             elevation = 30 - 10 * phase_t
             azimuth = 225 + 90 * phase_t
@@ -52,8 +48,8 @@ class EffectH6(BaseEffect):
         elif current_second < 75.0:
             phase_t = (current_second - 60.0) / 15.0
             point_alpha = 1.0  # Fully bright
-            zoom_factor = 15 + 2 * np.sin(2 * np.pi * phase_t)
-            elevation = 20 + 15 * np.sin(2 * np.pi * phase_t)
+            zoom_factor = 15 + 2 * math.sin(2 * math.pi * phase_t)
+            elevation = 20 + 15 * math.sin(2 * math.pi * phase_t)
             azimuth = 315 + 180 * phase_t
         
         # Phase 5 (75-90s): Orbit around heart-planet
@@ -61,7 +57,7 @@ class EffectH6(BaseEffect):
             phase_t = (current_second - 75.0) / 15.0
             point_alpha = 1.0
             zoom_factor = 17
-            elevation = 20 + 25 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 25 * math.sin(2 * math.pi * phase_t)
             azimuth = 495 + 360 * phase_t
         
         # Phase 6 (90-105s): See other "heart planets" in distance
@@ -80,12 +76,10 @@ class EffectH6(BaseEffect):
             elevation = 20
             azimuth = 1035 + 90 * phase_t
         
-        self.scatter.set_alpha(point_alpha)
+        self.set_point_alpha(point_alpha)
         self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
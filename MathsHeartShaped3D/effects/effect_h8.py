@@ -2,7 +2,7 @@
 Effect H8: Heart Genesis with Music Sync (BPM-synchronized beats - 100 seconds)
 """
 
-import numpy as np
+import math
 from effects import BaseEffect, register_effect
 
 
@@ -15,14 +15,6 @@ class EffectH8(BaseEffect):
     def update(self, frame):
         current_second = self.get_current_second(frame)
         
-        # Heart rotates slowly (180 degrees total)
-        alpha_deg = frame * 180 / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
-        
-        x_base = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-        y_base = self.y_original
-        z_base = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
-        
         # Base scale (no heartbeat yet)
         heartbeat_scale = 1.0
         
@@ -53,12 +45,8 @@ class EffectH8(BaseEffect):
             beat_t = abs(current_second - 95.0) / heartbeat_duration
             heartbeat_scale = 1.0 + 0.15 * (1.0 - beat_t)
         
-        # Apply heartbeat scale
-        x_rotated = x_base * heartbeat_scale
-        y_rotated = y_base * heartbeat_scale
-        z_rotated = z_base * heartbeat_scale
-        
         point_alpha = 0.8
+        point_scale = 1.0
         
         # Phase 1 (0-10s): Empty black space, then gradually heart appears
         if current_second < 10.0:
@@ -66,10 +54,7 @@ class EffectH8(BaseEffect):
             # Gradually fade in from blank
             point_alpha = 0.8 * phase_t
             # Scale from very small to normal
-            scale = 0.1 + 0.9 * phase_t
-            x_rotated = x_rotated * scale
-            y_rotated = y_rotated * scale
-            z_rotated = z_rotated * scale
+            point_scale = 0.1 + 0.9 * phase_t
             zoom_factor = 200 - 175 * phase_t  # Start very far, approach
             elevation = 20
             azimuth = 45
@@ -87,7 +72,7 @@ class EffectH8(BaseEffect):
             phase_t = (current_second - 25.0) / 15.0
             point_alpha = 0.8
             zoom_factor = 20 - 3 * phase_t  # Continue zooming
-            elevation = 20 + 10 * np.sin(np.pi * phase_t)
+            elevation = 20 + 10 * math.sin(math.pi * phase_t)
             azimuth = 135 + 90 * phase_t
         
         # Phase 4 (40-60s): Heartbeat rhythm, 85 BPM
@@ -102,8 +87,8 @@ class EffectH8(BaseEffect):
         elif current_second < 75.0:
             phase_t = (current_second - 60.0) / 15.0
             point_alpha = 0.8
-            zoom_factor = 17 + 3 * np.sin(2 * np.pi * phase_t)
-            elevation = 20 + 20 * np.sin(2 * np.pi * phase_t)
+            zoom_factor = 17 + 3 * math.sin(2 * math.pi * phase_t)
+            elevation = 20 + 20 * math.sin(2 * math.pi * phase_t)
             azimuth = 405 + 360 * phase_t
         
         # Phase 6 (75-90s): Cosmic expansion, 75 BPM
@@ -130,12 +115,12 @@ class EffectH8(BaseEffect):
             elevation = 20
             azimuth = 675
         
-        self.scatter.set_alpha(point_alpha)
-        self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_point_alpha(point_alpha)
+        # Heart rotates slowly (180 degrees total); rotate, pulse and scale
+        # straight into the reused point buffer
+        self.scatter._offsets3d = self.rotate_frame(frame, 180, scale=heartbeat_scale * point_scale)
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
@@ -2,7 +2,7 @@
 Effect H8sync: Heart Genesis with Real Audio Sync (using librosa-detected features - 100 seconds)
 """
 
-import numpy as np
+import math
 from effects import BaseEffect, register_effect
 from core.audio_sync import (
     get_beat_intensity,
@@ -24,14 +24,14 @@ class EffectH8sync(BaseEffect):
         
         # Load audio features if available
         if self.audio_features:
-            beat_times = self.audio_features.get('beat_times', [])
-            onset_times = self.audio_features.get('onset_times', [])
-            rms_times = self.audio_features.get('rms_times', [])
-            rms_values = self.audio_features.get('rms_values', [])
-            bass_times = self.audio_features.get('bass_times', [])
-            bass_values = self.audio_features.get('bass_values', [])
-            tempo_times = self.audio_features.get('tempo_times', [])
-            tempo_values = self.audio_features.get('tempo_values', [])
+            beat_times = self.audio_index.beat_times
+            onset_times = self.audio_index.onset_times
+            rms_times = self.audio_index.rms_times
+            rms_values = self.audio_index.rms_values
+            bass_times = self.audio_index.bass_times
+            bass_values = self.audio_index.bass_values
+            tempo_times = self.audio_index.tempo_times
+            tempo_values = self.audio_index.tempo_values
             
             # Get current audio features
             beat_intensity = get_beat_intensity(current_second, beat_times, window=0.1)
@@ -50,12 +50,7 @@ class EffectH8sync(BaseEffect):
         # Heart rotates slowly (180 degrees total, tempo-adjusted)
         # Adjust rotation speed based on tempo (faster tempo = faster rotation)
         tempo_factor = current_tempo / 75.0  # Normalize to 75 BPM baseline
-        alpha_deg = frame * 180 * tempo_factor / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
-        
-        x_base = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-        y_base = self.y_original
-        z_base = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+        alpha_rad = frame * tempo_factor * self.radians_per_frame(180)
         
         # Heartbeat pulse synchronized with beats
         heartbeat_scale = 1.0
@@ -67,12 +62,8 @@ class EffectH8sync(BaseEffect):
         if onset_intensity > 0.5:
             heartbeat_scale = max(heartbeat_scale, 1.0 + 0.15 * onset_intensity)
         
-        # Apply heartbeat
-        x_rotated = x_base * heartbeat_scale
-        y_rotated = y_base * heartbeat_scale
-        z_rotated = z_base * heartbeat_scale
-        
         point_alpha = 0.8
+        point_scale = 1.0
         
         # Phase 1 (0-10s): Empty black space, then gradually heart appears
         if current_second < 10.0:
@@ -80,10 +71,7 @@ class EffectH8sync(BaseEffect):
             # Gradually fade in from blank
             point_alpha = 0.8 * phase_t
             # Scale from very small to normal
-            scale = 0.1 + 0.9 * phase_t
-            x_rotated = x_rotated * scale
-            y_rotated = y_rotated * scale
-            z_rotated = z_rotated * scale
+            point_scale = 0.1 + 0.9 * phase_t
             # Adjust zoom based on loudness (louder = closer)
             base_zoom = 200 - 175 * phase_t
             zoom_factor = base_zoom - 5 * loudness  # Louder = zoom in more
@@ -106,7 +94,7 @@ class EffectH8sync(BaseEffect):
             point_alpha = 0.8
             base_zoom = 20 - 3 * phase_t
             zoom_factor = base_zoom - 5 * loudness
-            elevation = 20 + 10 * np.sin(np.pi * phase_t)
+            elevation = 20 + 10 * math.sin(math.pi * phase_t)
             azimuth = 135 + 90 * phase_t
         
         # Phase 4 (40-60s): Heartbeat rhythm
@@ -122,9 +110,9 @@ class EffectH8sync(BaseEffect):
         elif current_second < 75.0:
             phase_t = (current_second - 60.0) / 15.0
             point_alpha = 0.8
-            base_zoom = 17 + 3 * np.sin(2 * np.pi * phase_t)
+            base_zoom = 17 + 3 * math.sin(2 * math.pi * phase_t)
             zoom_factor = base_zoom - 5 * loudness
-            elevation = 20 + 20 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 20 * math.sin(2 * math.pi * phase_t)
             azimuth = 405 + 360 * phase_t
         
         # Phase 6 (75-90s): Cosmic expansion
@@ -157,12 +145,11 @@ class EffectH8sync(BaseEffect):
             elevation = 20
             azimuth = 675
         
-        self.scatter.set_alpha(point_alpha)
-        self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_point_alpha(point_alpha)
+        # Rotate, pulse and scale straight into the reused point buffer
+        self.scatter._offsets3d = self.rotate_points(alpha_rad, scale=heartbeat_scale * point_scale)
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
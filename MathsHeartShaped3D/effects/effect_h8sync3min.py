@@ -3,6 +3,7 @@ Effect H8sync3min: Heart Genesis with Real Audio Sync - Extended 3.5 minute vers
 Based on H8sync but extended to 210 seconds (3:30) with additional artistic phases
 """
 
+import math
 import numpy as np
 from effects import BaseEffect, register_effect
 from core.audio_sync import (
@@ -25,14 +26,14 @@ class EffectH8sync3min(BaseEffect):
         
         # Load audio features if available
         if self.audio_features:
-            beat_times = self.audio_features.get('beat_times', [])
-            onset_times = self.audio_features.get('onset_times', [])
-            rms_times = self.audio_features.get('rms_times', [])
-            rms_values = self.audio_features.get('rms_values', [])
-            bass_times = self.audio_features.get('bass_times', [])
-            bass_values = self.audio_features.get('bass_values', [])
-            tempo_times = self.audio_features.get('tempo_times', [])
-            tempo_values = self.audio_features.get('tempo_values', [])
+            beat_times = self.audio_index.beat_times
+            onset_times = self.audio_index.onset_times
+            rms_times = self.audio_index.rms_times
+            rms_values = self.audio_index.rms_values
+            bass_times = self.audio_index.bass_times
+            bass_values = self.audio_index.bass_values
+            tempo_times = self.audio_index.tempo_times
+            tempo_values = self.audio_index.tempo_values
             
             # Get current audio features
             beat_intensity = get_beat_intensity(current_second, beat_times, window=0.1)
@@ -50,12 +51,7 @@ class EffectH8sync3min(BaseEffect):
         
         # Heart rotates slowly (360 degrees total for longer animation, tempo-adjusted)
         tempo_factor = current_tempo / 75.0  # Normalize to 75 BPM baseline
-        alpha_deg = frame * 360 * tempo_factor / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
-        
-        x_base = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-        y_base = self.y_original
-        z_base = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+        alpha_rad = frame * tempo_factor * self.radians_per_frame(360)
         
         # Heartbeat pulse synchronized with beats
         heartbeat_scale = 1.0
@@ -65,10 +61,8 @@ class EffectH8sync3min(BaseEffect):
         if onset_intensity > 0.5:
             heartbeat_scale = max(heartbeat_scale, 1.0 + 0.15 * onset_intensity)
         
-        # Apply heartbeat
-        x_rotated = x_base * heartbeat_scale
-        y_rotated = y_base * heartbeat_scale
-        z_rotated = z_base * heartbeat_scale
+        # Rotate and apply heartbeat in one matrix product
+        x_rotated, y_rotated, z_rotated = self.rotate_points(alpha_rad, scale=heartbeat_scale)
         
         point_alpha = 0.8
         
@@ -101,7 +95,7 @@ class EffectH8sync3min(BaseEffect):
             point_alpha = 0.8
             base_zoom = 20 - 3 * phase_t
             zoom_factor = base_zoom - 5 * loudness
-            elevation = 20 + 10 * np.sin(np.pi * phase_t)
+            elevation = 20 + 10 * math.sin(math.pi * phase_t)
             azimuth = 135 + 90 * phase_t
         
         elif current_second < 60.0:
@@ -116,9 +110,9 @@ class EffectH8sync3min(BaseEffect):
             # Phase 5: Majestic orchestral
             phase_t = (current_second - 60.0) / 15.0
             point_alpha = 0.8
-            base_zoom = 17 + 3 * np.sin(2 * np.pi * phase_t)
+            base_zoom = 17 + 3 * math.sin(2 * math.pi * phase_t)
             zoom_factor = base_zoom - 5 * loudness
-            elevation = 20 + 20 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 20 * math.sin(2 * math.pi * phase_t)
             azimuth = 405 + 360 * phase_t
         
         elif current_second < 90.0:
@@ -154,7 +148,7 @@ class EffectH8sync3min(BaseEffect):
         elif current_second < 130.0:
             phase_t = (current_second - 100.0) / 30.0
             # Brightness syncs with bass
-            point_alpha = 0.5 + 0.5 * bass + 0.1 * np.sin(4 * np.pi * phase_t)
+            point_alpha = 0.5 + 0.5 * bass + 0.1 * math.sin(4 * math.pi * phase_t)
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Spiral descent: elevation decreases while azimuth rotates
             elevation = 60 - 40 * phase_t  # From 60 to 20 degrees
@@ -178,19 +172,19 @@ class EffectH8sync3min(BaseEffect):
             # Create kaleidoscope effect by rotating and mirroring
             # Multiple rotation angles for kaleidoscope
             num_mirrors = int(4 + 4 * phase_t)  # 4 to 8 mirrors
-            angles = np.linspace(0, 2 * np.pi, num_mirrors, endpoint=False)
+            angles = np.linspace(0, 2 * math.pi, num_mirrors, endpoint=False)
             
             # Use first mirror for main heart (simplified - full implementation would need multiple hearts)
-            mirror_angle = angles[0] + phase_t * 2 * np.pi
-            cos_a = np.cos(mirror_angle)
-            sin_a = np.sin(mirror_angle)
+            mirror_angle = angles[0] + phase_t * 2 * math.pi
+            cos_a = math.cos(mirror_angle)
+            sin_a = math.sin(mirror_angle)
             x_mirror = x_rotated * cos_a - z_rotated * sin_a
             z_mirror = x_rotated * sin_a + z_rotated * cos_a
             x_rotated = x_mirror
             z_rotated = z_mirror
             
             # Camera orbits rapidly
-            elevation = 20 + 30 * np.sin(3 * np.pi * phase_t)
+            elevation = 20 + 30 * math.sin(3 * math.pi * phase_t)
             azimuth = 1395 + 1080 * phase_t  # 3 full rotations
             zoom_factor = 100 - 30 * phase_t - 10 * bass  # Continue zooming in
             # Pulse on onsets
@@ -208,13 +202,13 @@ class EffectH8sync3min(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             
             # Complex orbital motion: figure-8 combined with spiral
-            orbit_radius = 5 * np.sin(2 * np.pi * phase_t)
-            orbit_angle = 4 * np.pi * phase_t
-            x_rotated = x_rotated + orbit_radius * np.cos(orbit_angle)
-            z_rotated = z_rotated + orbit_radius * np.sin(orbit_angle)
+            orbit_radius = 5 * math.sin(2 * math.pi * phase_t)
+            orbit_angle = 4 * math.pi * phase_t
+            x_rotated = x_rotated + orbit_radius * math.cos(orbit_angle)
+            z_rotated = z_rotated + orbit_radius * math.sin(orbit_angle)
             
             # Camera follows complex path
-            elevation = 30 + 25 * np.sin(4 * np.pi * phase_t) + 10 * np.cos(6 * np.pi * phase_t)
+            elevation = 30 + 25 * math.sin(4 * math.pi * phase_t) + 10 * math.cos(6 * math.pi * phase_t)
             azimuth = 2475 + 540 * phase_t  # 1.5 rotations
             zoom_factor = 70 - 20 * phase_t - 8 * loudness  # Continue zooming
             # Strong pulse on beats
@@ -228,7 +222,7 @@ class EffectH8sync3min(BaseEffect):
         elif current_second < 200.0:
             phase_t = (current_second - 180.0) / 20.0
             # Brightness peaks with bass
-            point_alpha = 0.5 + 0.5 * bass + 0.2 * np.sin(8 * np.pi * phase_t)
+            point_alpha = 0.5 + 0.5 * bass + 0.2 * math.sin(8 * math.pi * phase_t)
             point_alpha = min(1.0, max(0.0, point_alpha))
             
             # Dramatic zoom in (accelerating)
@@ -236,7 +230,7 @@ class EffectH8sync3min(BaseEffect):
             zoom_factor = base_zoom - 15 * bass - 10 * loudness
             
             # Camera elevation sweeps dramatically
-            elevation = 50 - 40 * phase_t + 20 * np.sin(4 * np.pi * phase_t)
+            elevation = 50 - 40 * phase_t + 20 * math.sin(4 * math.pi * phase_t)
             azimuth = 3015 + 360 * phase_t  # 1 rotation
             
             # Heart pulses intensely on beats and bass
@@ -267,7 +261,7 @@ class EffectH8sync3min(BaseEffect):
             else:
                 zoom_factor = 100 + 200 * ((phase_t - 0.5) * 2) ** 2  # Continue to 300
             
-            elevation = 10 + 10 * np.sin(8 * np.pi * phase_t)
+            elevation = 10 + 10 * math.sin(8 * math.pi * phase_t)
             azimuth = 3375 + 180 * phase_t  # Half rotation
             
             # Final pulse on strong beats
@@ -277,12 +271,10 @@ class EffectH8sync3min(BaseEffect):
                 y_rotated = y_rotated * pulse
                 z_rotated = z_rotated * pulse
         
-        self.scatter.set_alpha(point_alpha)
+        self.set_point_alpha(point_alpha)
         self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
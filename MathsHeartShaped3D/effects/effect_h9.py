@@ -3,7 +3,7 @@ Effect H9: "Cuba to New Orleans" - A Musical Journey Through the Heart
 Real-time audio-synchronized animation with strategic through-heart passages
 """
 
-import numpy as np
+import math
 from effects import BaseEffect, register_effect
 from core.audio_sync import (
     get_beat_intensity,
@@ -27,14 +27,14 @@ class EffectH9(BaseEffect):
         
         # Load audio features if available
         if self.audio_features:
-            beat_times = self.audio_features.get('beat_times', [])
-            onset_times = self.audio_features.get('onset_times', [])
-            rms_times = self.audio_features.get('rms_times', [])
-            rms_values = self.audio_features.get('rms_values', [])
-            bass_times = self.audio_features.get('bass_times', [])
-            bass_values = self.audio_features.get('bass_values', [])
-            tempo_times = self.audio_features.get('tempo_times', [])
-            tempo_values = self.audio_features.get('tempo_values', [])
+            beat_times = self.audio_index.beat_times
+            onset_times = self.audio_index.onset_times
+            rms_times = self.audio_index.rms_times
+            rms_values = self.audio_index.rms_values
+            bass_times = self.audio_index.bass_times
+            bass_values = self.audio_index.bass_values
+            tempo_times = self.audio_index.tempo_times
+            tempo_values = self.audio_index.tempo_values
             
             # Get current audio features
             beat_intensity = get_beat_intensity(current_second, beat_times, window=0.1)
@@ -52,12 +52,7 @@ class EffectH9(BaseEffect):
         
         # Heart rotates 360+ degrees over full duration, tempo-adaptive
         tempo_factor = current_tempo / 75.0  # Normalize to 75 BPM baseline
-        alpha_deg = frame * 360 * tempo_factor / self.total_frames
-        alpha_rad = np.deg2rad(alpha_deg)
-        
-        x_base = self.x_original * np.cos(alpha_rad) + self.z_original * np.sin(alpha_rad)
-        y_base = self.y_original
-        z_base = -self.x_original * np.sin(alpha_rad) + self.z_original * np.cos(alpha_rad)
+        alpha_rad = frame * tempo_factor * self.radians_per_frame(360)
         
         # Heartbeat pulse synchronized with beats
         heartbeat_scale = 1.0
@@ -67,24 +62,17 @@ class EffectH9(BaseEffect):
         if onset_intensity > 0.5:
             heartbeat_scale = max(heartbeat_scale, 1.0 + 0.15 * onset_intensity)
         
-        # Apply heartbeat
-        x_rotated = x_base * heartbeat_scale
-        y_rotated = y_base * heartbeat_scale
-        z_rotated = z_base * heartbeat_scale
-        
         point_alpha = 0.8
+        point_scale = 1.0
         
         # Phase 1 (0-30s): Opening - Heart emerges from silence (Cuba introduction)
         if current_second < 30.0:
             phase_t = current_second / 30.0
             point_alpha = 0.8 * phase_t
-            scale = 0.1 + 0.9 * phase_t
-            x_rotated = x_rotated * scale
-            y_rotated = y_rotated * scale
-            z_rotated = z_rotated * scale
+            point_scale = 0.1 + 0.9 * phase_t
             base_zoom = 200 - 150 * phase_t
             zoom_factor = base_zoom - 10 * loudness
-            elevation = 20 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 45 + 90 * phase_t
         
         # Phase 2 (30-100s): Cuban rhythms build
@@ -94,7 +82,7 @@ class EffectH9(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             base_zoom = 50 - 20 * phase_t
             zoom_factor = base_zoom - 8 * loudness
-            elevation = 20 + 15 * np.sin(4 * np.pi * phase_t)
+            elevation = 20 + 15 * math.sin(4 * math.pi * phase_t)
             azimuth = 135 + 180 * phase_t
         
         # Phase 3 (100-120s): FIRST THROUGH-HEART PASSAGE - Transition to New Orleans
@@ -104,7 +92,7 @@ class EffectH9(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Dramatic zoom through heart: 30 → -15
             zoom_factor = 30 - 45 * (phase_t ** 1.5)
-            elevation = 20 + 20 * np.sin(np.pi * phase_t)
+            elevation = 20 + 20 * math.sin(math.pi * phase_t)
             azimuth = 315 + 90 * phase_t
         
         # Phase 4 (120-140s): Exit and recovery from first passage
@@ -124,7 +112,7 @@ class EffectH9(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             base_zoom = 40 - 10 * phase_t
             zoom_factor = base_zoom - 8 * loudness
-            elevation = 20 + 20 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 20 * math.sin(2 * math.pi * phase_t)
             azimuth = 495 + 270 * phase_t
         
         # Phase 6 (250-270s): SECOND THROUGH-HEART PASSAGE - Musical climax
@@ -134,7 +122,7 @@ class EffectH9(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Dramatic zoom through heart: 30 → -20
             zoom_factor = 30 - 50 * (phase_t ** 2)
-            elevation = 15 + 25 * np.sin(np.pi * phase_t)
+            elevation = 15 + 25 * math.sin(math.pi * phase_t)
             azimuth = 765 + 180 * phase_t
         
         # Phase 7 (270-290s): Exit and turnaround
@@ -152,9 +140,9 @@ class EffectH9(BaseEffect):
             phase_t = (current_second - 290.0) / 160.0
             point_alpha = 0.6 + 0.4 * bass
             point_alpha = min(1.0, max(0.0, point_alpha))
-            base_zoom = 50 + 30 * np.sin(4 * np.pi * phase_t)
+            base_zoom = 50 + 30 * math.sin(4 * math.pi * phase_t)
             zoom_factor = base_zoom - 10 * loudness
-            elevation = 20 + 25 * np.sin(3 * np.pi * phase_t)
+            elevation = 20 + 25 * math.sin(3 * math.pi * phase_t)
             azimuth = 1035 + 360 * phase_t
         
         # Phase 9 (450-470s): THIRD THROUGH-HEART PASSAGE - Peak intensity
@@ -163,7 +151,7 @@ class EffectH9(BaseEffect):
             point_alpha = 1.0  # Maximum brightness
             # Most dramatic passage: 40 → -25
             zoom_factor = 40 - 65 * (phase_t ** 1.8)
-            elevation = 10 + 30 * np.sin(np.pi * phase_t)
+            elevation = 10 + 30 * math.sin(math.pi * phase_t)
             azimuth = 1395 + 270 * phase_t
         
         # Phase 10 (470-490s): Exit from peak
@@ -183,7 +171,7 @@ class EffectH9(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             base_zoom = 60 + 40 * phase_t
             zoom_factor = base_zoom - 5 * loudness
-            elevation = 20 + 15 * np.sin(2 * np.pi * phase_t)
+            elevation = 20 + 15 * math.sin(2 * math.pi * phase_t)
             azimuth = 1755 + 180 * phase_t
         
         # Phase 12 (600-620s): FOURTH THROUGH-HEART PASSAGE - Final transformation
@@ -193,7 +181,7 @@ class EffectH9(BaseEffect):
             point_alpha = min(1.0, max(0.0, point_alpha))
             # Final passage: 100 → -10
             zoom_factor = 100 - 110 * (phase_t ** 1.5)
-            elevation = 20 + 20 * np.sin(np.pi * phase_t)
+            elevation = 20 + 20 * math.sin(math.pi * phase_t)
             azimuth = 1935 + 180 * phase_t
         
         # Phase 13 (620-650s): Final exit and preparation for ending
@@ -216,12 +204,11 @@ class EffectH9(BaseEffect):
             elevation = 20
             azimuth = 2205 + 90 * phase_t
         
-        self.scatter.set_alpha(point_alpha)
-        self.scatter._offsets3d = (x_rotated, y_rotated, z_rotated)
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_point_alpha(point_alpha)
+        # Rotate, pulse and scale straight into the reused point buffer
+        self.scatter._offsets3d = self.rotate_points(alpha_rad, scale=heartbeat_scale * point_scale)
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return self.scatter,
 
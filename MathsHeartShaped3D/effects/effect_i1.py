@@ -3,7 +3,7 @@ Effect I1: Two Hearts - Dual heart visualization with audio synchronization
 1st heart syncs with beats, 2nd heart syncs with tempo
 """
 
-import numpy as np
+import math
 from effects import BaseEffect, register_effect
 from core.audio_sync import (
     get_beat_intensity,
@@ -25,12 +25,13 @@ class EffectI1(BaseEffect):
         self.x_heart2 = x_heart2 if x_heart2 is not None else x_original
         self.y_heart2 = y_heart2 if y_heart2 is not None else y_original
         self.z_heart2 = z_heart2 if z_heart2 is not None else z_original
+        self._heart2 = self.heart_block(self.x_heart2, self.y_heart2, self.z_heart2)
         self.scatter2 = scatter2  # Second scatter plot for 2nd heart
     
     def get_total_frames(self):
         # Calculate duration from audio features if available, otherwise use default
         if self.audio_features and 'rms_times' in self.audio_features:
-            rms_times = self.audio_features.get('rms_times', [])
+            rms_times = self.audio_index.rms_times
             if len(rms_times) > 0:
                 duration = rms_times[-1]  # Last RMS timestamp approximates duration
                 return int(duration * self.fps)
@@ -46,14 +47,14 @@ class EffectI1(BaseEffect):
         
         # Load audio features if available
         if self.audio_features:
-            beat_times = self.audio_features.get('beat_times', [])
-            onset_times = self.audio_features.get('onset_times', [])
-            rms_times = self.audio_features.get('rms_times', [])
-            rms_values = self.audio_features.get('rms_values', [])
-            bass_times = self.audio_features.get('bass_times', [])
-            bass_values = self.audio_features.get('bass_values', [])
-            tempo_times = self.audio_features.get('tempo_times', [])
-            tempo_values = self.audio_features.get('tempo_values', [])
+            beat_times = self.audio_index.beat_times
+            onset_times = self.audio_index.onset_times
+            rms_times = self.audio_index.rms_times
+            rms_values = self.audio_index.rms_values
+            bass_times = self.audio_index.bass_times
+            bass_values = self.audio_index.bass_values
+            tempo_times = self.audio_index.tempo_times
+            tempo_values = self.audio_index.tempo_values
             
             # Get current audio features
             beat_intensity = get_beat_intensity(current_second, beat_times, window=0.1)
@@ -83,12 +84,7 @@ class EffectI1(BaseEffect):
         
         # 1st Heart: Rotates based on tempo, pulses on beats
         tempo_factor = current_tempo / 60.0  # Normalize to 60 BPM baseline
-        alpha1_deg = frame * 360 * tempo_factor / self.total_frames
-        alpha1_rad = np.deg2rad(alpha1_deg)
-        
-        x1_base = self.x_original * np.cos(alpha1_rad) + self.z_original * np.sin(alpha1_rad)
-        y1_base = self.y_original
-        z1_base = -self.x_original * np.sin(alpha1_rad) + self.z_original * np.cos(alpha1_rad)
+        alpha1_rad = frame * tempo_factor * self.radians_per_frame(360)
         
         # 1st heart heartbeat pulse synchronized with beats
         heartbeat1_scale = 1.0
@@ -97,9 +93,7 @@ class EffectI1(BaseEffect):
         if onset_intensity > 0.5:
             heartbeat1_scale = max(heartbeat1_scale, 1.0 + 0.15 * onset_intensity)
         
-        x1_rotated = x1_base * heartbeat1_scale
-        y1_rotated = y1_base * heartbeat1_scale
-        z1_rotated = z1_base * heartbeat1_scale
+        x1_rotated, y1_rotated, z1_rotated = self.rotate_points(alpha1_rad, scale=heartbeat1_scale)
         
         # 1st heart position: (0, 0, 0) - center origin
         x1_final = x1_rotated
@@ -109,21 +103,14 @@ class EffectI1(BaseEffect):
         # 2nd Heart: Independent rotation, syncs with tempo
         # Can be counter-rotating or synchronized at key moments
         # For now, use counter-rotating for visual interest
-        alpha2_deg = frame * 360 * tempo_factor / self.total_frames * (-0.7)  # Counter-rotate at 70% speed
-        alpha2_rad = np.deg2rad(alpha2_deg)
-        
-        x2_base = self.x_heart2 * np.cos(alpha2_rad) + self.z_heart2 * np.sin(alpha2_rad)
-        y2_base = self.y_heart2
-        z2_base = -self.x_heart2 * np.sin(alpha2_rad) + self.z_heart2 * np.cos(alpha2_rad)
+        alpha2_rad = alpha1_rad * (-0.7)  # Counter-rotate at 70% speed
         
         # 2nd heart pulse: gentler, responds to tempo changes
         # Use tempo variation for pulse
         tempo_variation = abs(current_tempo - 75.0) / 75.0  # Normalized tempo change
         heartbeat2_scale = 1.0 + 0.15 * tempo_variation * (1.0 if current_tempo > 75 else 0.5)
         
-        x2_rotated = x2_base * heartbeat2_scale
-        y2_rotated = y2_base * heartbeat2_scale
-        z2_rotated = z2_base * heartbeat2_scale
+        x2_rotated, y2_rotated, z2_rotated = self.rotate_block(self._heart2, alpha2_rad, scale=heartbeat2_scale)
         
         # 2nd heart position: (25, 0, 0) - offset 25 units along X-axis
         x2_final = x2_rotated + 25
@@ -159,7 +146,7 @@ class EffectI1(BaseEffect):
             # Camera: Wide frame showing both hearts
             base_zoom = 50 - 15 * phase_t  # 50 → 35 (wider for dual view)
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 25 + 5 * np.sin(2 * np.pi * phase_t)
+            elevation = 25 + 5 * math.sin(2 * math.pi * phase_t)
             azimuth = 45 + 45 * phase_t
         
         # Phase 2 (8-20%): Establishment - Hearts establish their rhythms
@@ -168,15 +155,15 @@ class EffectI1(BaseEffect):
             # Camera: Alternates between dual-frame and individual focus
             if phase_t < 0.5:
                 # Dual-frame mode
-                base_zoom = 35 + 5 * np.sin(4 * np.pi * phase_t)
+                base_zoom = 35 + 5 * math.sin(4 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
-                elevation = 25 + 5 * np.sin(2 * np.pi * phase_t)
+                elevation = 25 + 5 * math.sin(2 * math.pi * phase_t)
                 azimuth = 90 + 90 * phase_t
             else:
                 # Focus on 1st heart
-                base_zoom = 20 + 5 * np.sin(4 * np.pi * phase_t)
+                base_zoom = 20 + 5 * math.sin(4 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
-                elevation = 20 + 5 * np.sin(2 * np.pi * phase_t)
+                elevation = 20 + 5 * math.sin(2 * math.pi * phase_t)
                 azimuth = 90 + 90 * phase_t
         
         # Phase 3 (20-25%): First Through-Heart Passage - Pass through 1st heart
@@ -191,16 +178,16 @@ class EffectI1(BaseEffect):
             else:
                 # Exiting
                 zoom_factor = -15 + 40 * ((phase_t - 0.6) / 0.4)
-            elevation = 20 + 15 * np.sin(np.pi * phase_t)
+            elevation = 20 + 15 * math.sin(math.pi * phase_t)
             azimuth = 180 + 90 * phase_t
         
         # Phase 4 (25-45%): Development - Musical development
         elif current_second < phase4_end:
             phase_t = (current_second - phase3_end) / (phase4_end - phase3_end)
             # Camera: Orbital motion around both hearts
-            base_zoom = 30 + 10 * np.sin(3 * np.pi * phase_t)  # 20-40 range
+            base_zoom = 30 + 10 * math.sin(3 * math.pi * phase_t)  # 20-40 range
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 20 + 15 * np.sin(4 * np.pi * phase_t)
+            elevation = 20 + 15 * math.sin(4 * math.pi * phase_t)
             azimuth = 270 + 360 * phase_t  # Full orbit
         
         # Phase 5 (45-50%): Second Through-Heart Passage - Pass through 2nd heart
@@ -213,7 +200,7 @@ class EffectI1(BaseEffect):
                 zoom_factor = 35 - 55 * ((phase_t / 0.6) ** 2)
             else:
                 zoom_factor = -20 + 50 * ((phase_t - 0.6) / 0.4)
-            elevation = 18 + 20 * np.sin(np.pi * phase_t)
+            elevation = 18 + 20 * math.sin(math.pi * phase_t)
             azimuth = 630 + 120 * phase_t
         
         # Phase 6 (50-70%): Harmony - Hearts work in harmony
@@ -236,17 +223,17 @@ class EffectI1(BaseEffect):
             mode = int(phase_t * 4) % 3  # Cycle through 3 modes
             if mode == 0:
                 # Dual-frame
-                base_zoom = 40 + 5 * np.sin(2 * np.pi * phase_t)
+                base_zoom = 40 + 5 * math.sin(2 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
                 elevation = 25
             elif mode == 1:
                 # Focus on 1st heart
-                base_zoom = 20 + 3 * np.sin(2 * np.pi * phase_t)
+                base_zoom = 20 + 3 * math.sin(2 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
                 elevation = 20
             else:
                 # Focus on 2nd heart
-                base_zoom = 20 + 3 * np.sin(2 * np.pi * phase_t)
+                base_zoom = 20 + 3 * math.sin(2 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
                 elevation = 20
             azimuth = 750 + 270 * phase_t
@@ -261,7 +248,7 @@ class EffectI1(BaseEffect):
                 zoom_factor = 30 - 45 * ((phase_t / 0.6) ** 1.8)
             else:
                 zoom_factor = -15 + 40 * ((phase_t - 0.6) / 0.4)
-            elevation = 15 + 25 * np.sin(np.pi * phase_t)
+            elevation = 15 + 25 * math.sin(math.pi * phase_t)
             azimuth = 1020 + 180 * phase_t
         
         # Phase 8 (75-90%): Climax - Maximum synchronization
@@ -274,9 +261,9 @@ class EffectI1(BaseEffect):
             alpha2 = min(1.0, max(0.0, alpha2))
             
             # Camera: Rapid switching, dynamic movements
-            base_zoom = 18 + 7 * np.sin(5 * np.pi * phase_t)  # 11-25 range
+            base_zoom = 18 + 7 * math.sin(5 * math.pi * phase_t)  # 11-25 range
             zoom_factor = base_zoom - 4 * loudness
-            elevation = 20 + 15 * np.sin(4 * np.pi * phase_t)
+            elevation = 20 + 15 * math.sin(4 * math.pi * phase_t)
             azimuth = 1200 + 360 * phase_t
         
         # Phase 9 (90-93%): Fourth Through-Heart Passage - Final dramatic passage
@@ -287,7 +274,7 @@ class EffectI1(BaseEffect):
                 zoom_factor = 35 - 50 * ((phase_t / 0.5) ** 1.5)
             else:
                 zoom_factor = -15 + 45 * ((phase_t - 0.5) / 0.5)
-            elevation = 20 + 18 * np.sin(np.pi * phase_t)
+            elevation = 20 + 18 * math.sin(math.pi * phase_t)
             azimuth = 1560 + 90 * phase_t
         
         # Phase 10 (93-100%): Resolution - Gentle conclusion
@@ -306,7 +293,7 @@ class EffectI1(BaseEffect):
             azimuth = 1650 + 90 * phase_t
         
         # Update scatter plots
-        self.scatter.set_alpha(alpha1)
+        self.set_point_alpha(alpha1)
         self.scatter._offsets3d = (x1_final, y1_final, z1_final)
         
         if self.scatter2 is not None:
@@ -314,10 +301,8 @@ class EffectI1(BaseEffect):
             self.scatter2._offsets3d = (x2_final, y2_final, z2_final)
         
         # Update camera
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         # Return both scatter plots
         if self.scatter2 is not None:
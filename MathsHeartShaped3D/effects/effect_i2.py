@@ -3,7 +3,7 @@ Effect I2: Five Hearts - Multi-heart visualization with comprehensive audio sync
 1st heart: beats, 2nd heart: tempo, 3rd heart: loudness, 4th heart: bass, 5th heart: onsets
 """
 
-import numpy as np
+import math
 from effects import BaseEffect, register_effect
 from core.audio_sync import (
     get_beat_intensity,
@@ -30,27 +30,31 @@ class EffectI2(BaseEffect):
         self.x_heart2 = x_heart2 if x_heart2 is not None else x_original
         self.y_heart2 = y_heart2 if y_heart2 is not None else y_original
         self.z_heart2 = z_heart2 if z_heart2 is not None else z_original
+        self._heart2 = self.heart_block(self.x_heart2, self.y_heart2, self.z_heart2)
         self.scatter2 = scatter2
         # Heart 3 (loudness)
         self.x_heart3 = x_heart3 if x_heart3 is not None else x_original
         self.y_heart3 = y_heart3 if y_heart3 is not None else y_original
         self.z_heart3 = z_heart3 if z_heart3 is not None else z_original
+        self._heart3 = self.heart_block(self.x_heart3, self.y_heart3, self.z_heart3)
         self.scatter3 = scatter3
         # Heart 4 (bass)
         self.x_heart4 = x_heart4 if x_heart4 is not None else x_original
         self.y_heart4 = y_heart4 if y_heart4 is not None else y_original
         self.z_heart4 = z_heart4 if z_heart4 is not None else z_original
+        self._heart4 = self.heart_block(self.x_heart4, self.y_heart4, self.z_heart4)
         self.scatter4 = scatter4
         # Heart 5 (onsets)
         self.x_heart5 = x_heart5 if x_heart5 is not None else x_original
         self.y_heart5 = y_heart5 if y_heart5 is not None else y_original
         self.z_heart5 = z_heart5 if z_heart5 is not None else z_original
+        self._heart5 = self.heart_block(self.x_heart5, self.y_heart5, self.z_heart5)
         self.scatter5 = scatter5
     
     def get_total_frames(self):
         # Calculate duration from audio features if available, otherwise use default
         if self.audio_features and 'rms_times' in self.audio_features:
-            rms_times = self.audio_features.get('rms_times', [])
+            rms_times = self.audio_index.rms_times
             if len(rms_times) > 0:
                 duration = rms_times[-1]  # Last RMS timestamp approximates duration
                 return int(duration * self.fps)
@@ -66,14 +70,14 @@ class EffectI2(BaseEffect):
         
         # Load audio features if available
         if self.audio_features:
-            beat_times = self.audio_features.get('beat_times', [])
-            onset_times = self.audio_features.get('onset_times', [])
-            rms_times = self.audio_features.get('rms_times', [])
-            rms_values = self.audio_features.get('rms_values', [])
-            bass_times = self.audio_features.get('bass_times', [])
-            bass_values = self.audio_features.get('bass_values', [])
-            tempo_times = self.audio_features.get('tempo_times', [])
-            tempo_values = self.audio_features.get('tempo_values', [])
+            beat_times = self.audio_index.beat_times
+            onset_times = self.audio_index.onset_times
+            rms_times = self.audio_index.rms_times
+            rms_values = self.audio_index.rms_values
+            bass_times = self.audio_index.bass_times
+            bass_values = self.audio_index.bass_values
+            tempo_times = self.audio_index.tempo_times
+            tempo_values = self.audio_index.tempo_values
             
             # Get current audio features
             beat_intensity = get_beat_intensity(current_second, beat_times, window=0.1)
@@ -100,12 +104,7 @@ class EffectI2(BaseEffect):
         
         # 1st Heart (Beats): Rotates based on tempo, pulses on beats
         tempo_factor = current_tempo / 60.0
-        alpha1_deg = frame * 360 * tempo_factor / self.total_frames
-        alpha1_rad = np.deg2rad(alpha1_deg)
-        
-        x1_base = self.x_original * np.cos(alpha1_rad) + self.z_original * np.sin(alpha1_rad)
-        y1_base = self.y_original
-        z1_base = -self.x_original * np.sin(alpha1_rad) + self.z_original * np.cos(alpha1_rad)
+        alpha1_rad = frame * tempo_factor * self.radians_per_frame(360)
         
         heartbeat1_scale = 1.0
         if beat_intensity > 0:
@@ -113,78 +112,48 @@ class EffectI2(BaseEffect):
         if onset_intensity > 0.5:
             heartbeat1_scale = max(heartbeat1_scale, 1.0 + 0.15 * onset_intensity)
         
-        x1_final = x1_base * heartbeat1_scale
-        y1_final = y1_base * heartbeat1_scale
-        z1_final = z1_base * heartbeat1_scale
+        x1_final, y1_final, z1_final = self.rotate_points(alpha1_rad, scale=heartbeat1_scale)
         
         # 2nd Heart (Tempo): Independent rotation, syncs with tempo
-        alpha2_deg = frame * 360 * tempo_factor / self.total_frames * (-0.7)  # Counter-rotate
-        alpha2_rad = np.deg2rad(alpha2_deg)
-        
-        x2_base = self.x_heart2 * np.cos(alpha2_rad) + self.z_heart2 * np.sin(alpha2_rad)
-        y2_base = self.y_heart2
-        z2_base = -self.x_heart2 * np.sin(alpha2_rad) + self.z_heart2 * np.cos(alpha2_rad)
+        alpha2_rad = alpha1_rad * (-0.7)  # Counter-rotate
         
         tempo_variation = abs(current_tempo - 75.0) / 75.0
         heartbeat2_scale = 1.0 + 0.15 * tempo_variation * (1.0 if current_tempo > 75 else 0.5)
         
-        x2_rotated = x2_base * heartbeat2_scale
-        y2_rotated = y2_base * heartbeat2_scale
-        z2_rotated = z2_base * heartbeat2_scale
+        x2_rotated, y2_rotated, z2_rotated = self.rotate_block(self._heart2, alpha2_rad, scale=heartbeat2_scale)
         x2_final = x2_rotated + 25  # Position: (25, 0, 0)
         y2_final = y2_rotated
         z2_final = z2_rotated
         
         # 3rd Heart (Loudness): Responds to RMS energy
-        alpha3_deg = frame * 360 * tempo_factor / self.total_frames * 0.5  # Slower rotation
-        alpha3_rad = np.deg2rad(alpha3_deg)
-        
-        x3_base = self.x_heart3 * np.cos(alpha3_rad) + self.z_heart3 * np.sin(alpha3_rad)
-        y3_base = self.y_heart3
-        z3_base = -self.x_heart3 * np.sin(alpha3_rad) + self.z_heart3 * np.cos(alpha3_rad)
+        alpha3_rad = alpha1_rad * 0.5  # Slower rotation
         
         # Scale based on loudness
         heartbeat3_scale = 1.0 + 0.25 * loudness  # Louder = bigger
         
-        x3_rotated = x3_base * heartbeat3_scale
-        y3_rotated = y3_base * heartbeat3_scale
-        z3_rotated = z3_base * heartbeat3_scale
+        x3_rotated, y3_rotated, z3_rotated = self.rotate_block(self._heart3, alpha3_rad, scale=heartbeat3_scale)
         x3_final = x3_rotated  # Position: (0, 20, 0)
         y3_final = y3_rotated + 20
         z3_final = z3_rotated
         
         # 4th Heart (Bass): Responds to bass frequencies
-        alpha4_deg = frame * 360 * tempo_factor / self.total_frames * 0.8  # Medium rotation
-        alpha4_rad = np.deg2rad(alpha4_deg)
-        
-        x4_base = self.x_heart4 * np.cos(alpha4_rad) + self.z_heart4 * np.sin(alpha4_rad)
-        y4_base = self.y_heart4
-        z4_base = -self.x_heart4 * np.sin(alpha4_rad) + self.z_heart4 * np.cos(alpha4_rad)
+        alpha4_rad = alpha1_rad * 0.8  # Medium rotation
         
         # Scale based on bass
         heartbeat4_scale = 1.0 + 0.2 * bass  # More bass = bigger
         
-        x4_rotated = x4_base * heartbeat4_scale
-        y4_rotated = y4_base * heartbeat4_scale
-        z4_rotated = z4_base * heartbeat4_scale
+        x4_rotated, y4_rotated, z4_rotated = self.rotate_block(self._heart4, alpha4_rad, scale=heartbeat4_scale)
         x4_final = x4_rotated  # Position: (0, 0, 25)
         y4_final = y4_rotated
         z4_final = z4_rotated + 25
         
         # 5th Heart (Onsets): Responds to onset detection
-        alpha5_deg = frame * 360 * tempo_factor / self.total_frames * (-0.5)  # Counter-rotate slower
-        alpha5_rad = np.deg2rad(alpha5_deg)
-        
-        x5_base = self.x_heart5 * np.cos(alpha5_rad) + self.z_heart5 * np.sin(alpha5_rad)
-        y5_base = self.y_heart5
-        z5_base = -self.x_heart5 * np.sin(alpha5_rad) + self.z_heart5 * np.cos(alpha5_rad)
+        alpha5_rad = alpha1_rad * (-0.5)  # Counter-rotate slower
         
         # Scale based on onsets
         heartbeat5_scale = 1.0 + 0.3 * onset_intensity  # Strong onsets = bigger pulse
         
-        x5_rotated = x5_base * heartbeat5_scale
-        y5_rotated = y5_base * heartbeat5_scale
-        z5_rotated = z5_base * heartbeat5_scale
+        x5_rotated, y5_rotated, z5_rotated = self.rotate_block(self._heart5, alpha5_rad, scale=heartbeat5_scale)
         x5_final = x5_rotated - 25  # Position: (-25, 0, 0)
         y5_final = y5_rotated
         z5_final = z5_rotated
@@ -237,25 +206,25 @@ class EffectI2(BaseEffect):
             # Camera: Wide frame to show all hearts
             base_zoom = 60 - 20 * phase_t  # 60 → 40
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 30 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 30 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 45 + 45 * phase_t
         
         # Phase 2 (10-25%): Establishment - All hearts establish their rhythms
         elif current_second < phase2_end:
             phase_t = (current_second - phase1_end) / (phase2_end - phase1_end)
             # Camera: Rotates to show all hearts
-            base_zoom = 40 + 10 * np.sin(3 * np.pi * phase_t)  # 30-50 range
+            base_zoom = 40 + 10 * math.sin(3 * math.pi * phase_t)  # 30-50 range
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 25 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 25 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 90 + 180 * phase_t
         
         # Phase 3 (25-40%): Development - Musical development
         elif current_second < phase3_end:
             phase_t = (current_second - phase2_end) / (phase3_end - phase2_end)
             # Camera: Orbital motion around center
-            base_zoom = 35 + 10 * np.sin(4 * np.pi * phase_t)
+            base_zoom = 35 + 10 * math.sin(4 * math.pi * phase_t)
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 20 + 15 * np.sin(3 * np.pi * phase_t)
+            elevation = 20 + 15 * math.sin(3 * math.pi * phase_t)
             azimuth = 270 + 360 * phase_t
         
         # Phase 4 (40-60%): Harmony - All hearts work in harmony
@@ -265,27 +234,27 @@ class EffectI2(BaseEffect):
             mode = int(phase_t * 5) % 5  # Cycle through 5 modes (one per heart)
             if mode == 0:
                 # Focus on heart 1 (beats)
-                base_zoom = 20 + 3 * np.sin(2 * np.pi * phase_t)
+                base_zoom = 20 + 3 * math.sin(2 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
                 elevation = 20
             elif mode == 1:
                 # Focus on heart 2 (tempo)
-                base_zoom = 20 + 3 * np.sin(2 * np.pi * phase_t)
+                base_zoom = 20 + 3 * math.sin(2 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
                 elevation = 20
             elif mode == 2:
                 # Focus on heart 3 (loudness)
-                base_zoom = 20 + 3 * np.sin(2 * np.pi * phase_t)
+                base_zoom = 20 + 3 * math.sin(2 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
                 elevation = 30
             elif mode == 3:
                 # Focus on heart 4 (bass)
-                base_zoom = 20 + 3 * np.sin(2 * np.pi * phase_t)
+                base_zoom = 20 + 3 * math.sin(2 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
                 elevation = 20
             else:
                 # Focus on heart 5 (onsets)
-                base_zoom = 20 + 3 * np.sin(2 * np.pi * phase_t)
+                base_zoom = 20 + 3 * math.sin(2 * math.pi * phase_t)
                 zoom_factor = base_zoom - 3 * loudness
                 elevation = 20
             azimuth = 630 + 270 * phase_t
@@ -294,18 +263,18 @@ class EffectI2(BaseEffect):
         elif current_second < phase5_end:
             phase_t = (current_second - phase4_end) / (phase5_end - phase4_end)
             # All hearts at peak responsiveness
-            base_zoom = 35 + 10 * np.sin(5 * np.pi * phase_t)  # 25-45 range
+            base_zoom = 35 + 10 * math.sin(5 * math.pi * phase_t)  # 25-45 range
             zoom_factor = base_zoom - 4 * loudness
-            elevation = 25 + 15 * np.sin(4 * np.pi * phase_t)
+            elevation = 25 + 15 * math.sin(4 * math.pi * phase_t)
             azimuth = 900 + 360 * phase_t
         
         # Phase 6 (75-90%): Peak synchronization
         elif current_second < phase6_end:
             phase_t = (current_second - phase5_end) / (phase6_end - phase5_end)
             # Rapid camera movements
-            base_zoom = 30 + 15 * np.sin(6 * np.pi * phase_t)  # 15-45 range
+            base_zoom = 30 + 15 * math.sin(6 * math.pi * phase_t)  # 15-45 range
             zoom_factor = base_zoom - 4 * loudness
-            elevation = 20 + 20 * np.sin(5 * np.pi * phase_t)
+            elevation = 20 + 20 * math.sin(5 * math.pi * phase_t)
             azimuth = 1260 + 540 * phase_t
         
         # Phase 7 (90-100%): Resolution - Gentle conclusion
@@ -331,7 +300,7 @@ class EffectI2(BaseEffect):
             azimuth = 1800 + 90 * phase_t
         
         # Update all scatter plots
-        self.scatter.set_alpha(alpha1)
+        self.set_point_alpha(alpha1)
         self.scatter._offsets3d = (x1_final, y1_final, z1_final)
         
         if self.scatter2 is not None:
@@ -351,10 +320,8 @@ class EffectI2(BaseEffect):
             self.scatter5._offsets3d = (x5_final, y5_final, z5_final)
         
         # Update camera
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         # Return all scatter plots
         result = [self.scatter]
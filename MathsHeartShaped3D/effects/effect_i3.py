@@ -3,7 +3,7 @@ Effect I3: Birthday Celebration - 11, 16, 2025
 Variable number of hearts (11 hearts, then 16 hearts) with number display
 """
 
-import numpy as np
+import math
 from effects import BaseEffect, register_effect
 from core.audio_sync import (
     get_beat_intensity,
@@ -28,6 +28,7 @@ class EffectI3(BaseEffect):
         super().__init__(total_frames, fps, x_original, y_original, z_original, 
                         scatter, ax, audio_features)
         self.heart_data_list = heart_data_list if heart_data_list is not None else []
+        self._heart_blocks = [self.heart_block(x, y, z) for x, y, z, *_ in self.heart_data_list]
         self.text_display = text_display
         self.number_texts = {}  # Store text objects for numbers
         self._init_number_texts()
@@ -43,7 +44,7 @@ class EffectI3(BaseEffect):
     def get_total_frames(self):
         # Calculate duration from audio features if available, otherwise use default
         if self.audio_features and 'rms_times' in self.audio_features:
-            rms_times = self.audio_features.get('rms_times', [])
+            rms_times = self.audio_index.rms_times
             if len(rms_times) > 0:
                 duration = rms_times[-1]  # Last RMS timestamp approximates duration
                 return int(duration * self.fps)
@@ -62,17 +63,17 @@ class EffectI3(BaseEffect):
         # Inner circle: 5 hearts
         inner_radius = 20
         for i in range(5):
-            angle = 2 * np.pi * i / 5
-            x = inner_radius * np.cos(angle)
-            z = inner_radius * np.sin(angle)
+            angle = 2 * math.pi * i / 5
+            x = inner_radius * math.cos(angle)
+            z = inner_radius * math.sin(angle)
             positions.append((x, 0, z))
         
         # Outer positions: 5 hearts
         outer_radius = 35
         for i in range(5):
-            angle = 2 * np.pi * i / 5 + np.pi / 5  # Offset by half step
-            x = outer_radius * np.cos(angle)
-            z = outer_radius * np.sin(angle)
+            angle = 2 * math.pi * i / 5 + math.pi / 5  # Offset by half step
+            x = outer_radius * math.cos(angle)
+            z = outer_radius * math.sin(angle)
             positions.append((x, 0, z))
         
         return positions
@@ -89,7 +90,7 @@ class EffectI3(BaseEffect):
             for j in range(grid_size):
                 x = start_offset + j * spacing
                 z = start_offset + i * spacing
-                y = 2 * np.sin(i * np.pi / 3) * np.cos(j * np.pi / 3)  # Slight 3D variation
+                y = 2 * math.sin(i * math.pi / 3) * math.cos(j * math.pi / 3)  # Slight 3D variation
                 positions.append((x, y, z))
         
         return positions
@@ -102,14 +103,14 @@ class EffectI3(BaseEffect):
         
         # Load audio features if available
         if self.audio_features:
-            beat_times = self.audio_features.get('beat_times', [])
-            onset_times = self.audio_features.get('onset_times', [])
-            rms_times = self.audio_features.get('rms_times', [])
-            rms_values = self.audio_features.get('rms_values', [])
-            bass_times = self.audio_features.get('bass_times', [])
-            bass_values = self.audio_features.get('bass_values', [])
-            tempo_times = self.audio_features.get('tempo_times', [])
-            tempo_values = self.audio_features.get('tempo_values', [])
+            beat_times = self.audio_index.beat_times
+            onset_times = self.audio_index.onset_times
+            rms_times = self.audio_index.rms_times
+            rms_values = self.audio_index.rms_values
+            bass_times = self.audio_index.bass_times
+            bass_values = self.audio_index.bass_values
+            tempo_times = self.audio_index.tempo_times
+            tempo_values = self.audio_index.tempo_values
             
             # Get current audio features
             beat_intensity = get_beat_intensity(current_second, beat_times, window=0.1)
@@ -155,26 +156,21 @@ class EffectI3(BaseEffect):
         
         # Process each heart
         tempo_factor = current_tempo / 60.0
+        tempo_rad = frame * tempo_factor * self.radians_per_frame(360)
         result_scatters = []
         
         for i in range(num_hearts):
             if i >= len(self.heart_data_list):
                 break
             
-            x_orig, y_orig, z_orig, scatter_obj, colormap_name = self.heart_data_list[i]
+            scatter_obj, colormap_name = self.heart_data_list[i][3:]
             
             # Rotation speed varies by heart (50%-100% of tempo)
             rotation_speed = 0.5 + 0.5 * (i % 5) / 4.0  # Varies from 0.5 to 1.0
             if i % 2 == 1:
                 rotation_speed = -rotation_speed  # Counter-rotate some hearts
             
-            alpha_deg = frame * 360 * tempo_factor * rotation_speed / self.total_frames
-            alpha_rad = np.deg2rad(alpha_deg)
-            
-            # Rotate heart
-            x_base = x_orig * np.cos(alpha_rad) + z_orig * np.sin(alpha_rad)
-            y_base = y_orig
-            z_base = -x_orig * np.sin(alpha_rad) + z_orig * np.cos(alpha_rad)
+            alpha_rad = tempo_rad * rotation_speed
             
             # Assign audio feature to heart (distribute features across hearts)
             feature_type = i % 5  # Cycle through 5 features
@@ -193,9 +189,10 @@ class EffectI3(BaseEffect):
             else:  # Onsets
                 heartbeat_scale = 1.0 + 0.3 * onset_intensity
             
-            x_rotated = x_base * heartbeat_scale
-            y_rotated = y_base * heartbeat_scale
-            z_rotated = z_base * heartbeat_scale
+            # Rotate heart
+            x_rotated, y_rotated, z_rotated = self.rotate_block(
+                self._heart_blocks[i], alpha_rad, scale=heartbeat_scale
+            )
             
             # Apply position offset
             pos_x, pos_y, pos_z = heart_positions[i] if i < len(heart_positions) else (0, 0, 0)
@@ -259,23 +256,23 @@ class EffectI3(BaseEffect):
             phase_t = current_second / phase1_end
             base_zoom = 60 - 10 * phase_t  # 60 → 50
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 30 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 30 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 45 + 45 * phase_t
         elif current_second < phase2_end:
             phase_t = (current_second - phase1_end) / (phase2_end - phase1_end)
-            base_zoom = 50 + 20 * np.sin(3 * np.pi * phase_t)  # 50-70 range
+            base_zoom = 50 + 20 * math.sin(3 * math.pi * phase_t)  # 50-70 range
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 30 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 30 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 90 + 90 * phase_t
         elif current_second < phase3_end:
             phase_t = (current_second - phase2_end) / (phase3_end - phase2_end)
-            base_zoom = 60 + 10 * np.sin(4 * np.pi * phase_t)  # 50-70 range
+            base_zoom = 60 + 10 * math.sin(4 * math.pi * phase_t)  # 50-70 range
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 30 + 10 * np.sin(3 * np.pi * phase_t)
+            elevation = 30 + 10 * math.sin(3 * math.pi * phase_t)
             azimuth = 180 + 180 * phase_t
         elif current_second < phase4_end:
             phase_t = (current_second - phase3_end) / (phase4_end - phase3_end)
-            base_zoom = 60 + 10 * np.sin(2 * np.pi * phase_t)
+            base_zoom = 60 + 10 * math.sin(2 * math.pi * phase_t)
             zoom_factor = base_zoom - 3 * loudness
             elevation = 30
             azimuth = 360 + 90 * phase_t
@@ -283,19 +280,19 @@ class EffectI3(BaseEffect):
             phase_t = (current_second - phase4_end) / (phase5_end - phase4_end)
             base_zoom = 70 + 10 * phase_t  # 70 → 80 (wider for 16 hearts)
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 30 + 5 * np.sin(2 * np.pi * phase_t)
+            elevation = 30 + 5 * math.sin(2 * math.pi * phase_t)
             azimuth = 450 + 90 * phase_t
         elif current_second < phase6_end:
             phase_t = (current_second - phase5_end) / (phase6_end - phase5_end)
-            base_zoom = 70 + 10 * np.sin(3 * np.pi * phase_t)  # 60-80 range
+            base_zoom = 70 + 10 * math.sin(3 * math.pi * phase_t)  # 60-80 range
             zoom_factor = base_zoom - 3 * loudness
-            elevation = 30 + 10 * np.sin(2 * np.pi * phase_t)
+            elevation = 30 + 10 * math.sin(2 * math.pi * phase_t)
             azimuth = 540 + 360 * phase_t
         elif current_second < phase7_end:
             phase_t = (current_second - phase6_end) / (phase7_end - phase6_end)
-            base_zoom = 65 + 15 * np.sin(5 * np.pi * phase_t)  # 50-80 range
+            base_zoom = 65 + 15 * math.sin(5 * math.pi * phase_t)  # 50-80 range
             zoom_factor = base_zoom - 4 * loudness
-            elevation = 30 + 15 * np.sin(4 * np.pi * phase_t)
+            elevation = 30 + 15 * math.sin(4 * math.pi * phase_t)
             azimuth = 900 + 540 * phase_t
         else:
             phase_t = (current_second - phase7_end) / (total_duration - phase7_end)
@@ -305,23 +302,18 @@ class EffectI3(BaseEffect):
             azimuth = 1440 + 90 * phase_t
         
         # Update camera
-        self.ax.view_init(elev=elevation, azim=azimuth)
-        self.ax.set_xlim([-zoom_factor, zoom_factor])
-        self.ax.set_ylim([-zoom_factor, zoom_factor])
-        self.ax.set_zlim([-zoom_factor, zoom_factor])
+        self.set_view(elevation, azimuth)
+        self.set_zoom(zoom_factor)
         
         return tuple(result_scatters)
     
     def _update_number_display(self, current_second, total_duration, phase2_end, phase5_end, phase7_end):
-        """Update number display (11, 16, 2025) using text overlay."""
-        # Clear previous texts
-        for text_obj in self.number_texts.values():
-            if text_obj is not None:
-                try:
-                    text_obj.remove()
-                except:
-                    pass
+        """
+        Update number display (11, 16, 2025) using text overlay.
         
+        Each number is created once and then only shown or hidden, so what is
+        on screen depends on the current time alone, not on earlier frames.
+        """
         # Determine which number to show
         show_11 = False
         show_16 = False
@@ -349,38 +341,26 @@ class EffectI3(BaseEffect):
         # Create text objects (using figure text, not 3D text for simplicity)
         fig = self.ax.figure
         
-        if show_11:
-            if self.number_texts['11'] is None or not hasattr(self.number_texts['11'], 'get_figure'):
-                self.number_texts['11'] = fig.text(0.5, 0.85, '11', 
-                                                   fontsize=72, ha='center', va='center',
-                                                   color='white', alpha=0.7, weight='bold')
-            else:
-                self.number_texts['11'].set_alpha(0.7)
-        else:
-            if self.number_texts['11'] is not None:
-                self.number_texts['11'].set_alpha(0.0)
+        if show_11 and self.number_texts['11'] is None:
+            self.number_texts['11'] = fig.text(0.5, 0.85, '11', 
+                                               fontsize=72, ha='center', va='center',
+                                               color='white', alpha=0.7, weight='bold')
+        if self.number_texts['11'] is not None:
+            self.number_texts['11'].set_visible(show_11)
         
-        if show_16:
-            if self.number_texts['16'] is None or not hasattr(self.number_texts['16'], 'get_figure'):
-                self.number_texts['16'] = fig.text(0.5, 0.85, '16', 
-                                                   fontsize=72, ha='center', va='center',
-                                                   color='white', alpha=0.7, weight='bold')
-            else:
-                self.number_texts['16'].set_alpha(0.7)
-        else:
-            if self.number_texts['16'] is not None:
-                self.number_texts['16'].set_alpha(0.0)
+        if show_16 and self.number_texts['16'] is None:
+            self.number_texts['16'] = fig.text(0.5, 0.85, '16', 
+                                               fontsize=72, ha='center', va='center',
+                                               color='white', alpha=0.7, weight='bold')
+        if self.number_texts['16'] is not None:
+            self.number_texts['16'].set_visible(show_16)
         
-        if show_2025:
-            if self.number_texts['2025'] is None or not hasattr(self.number_texts['2025'], 'get_figure'):
-                self.number_texts['2025'] = fig.text(0.5, 0.5, '2025', 
-                                                      fontsize=96, ha='center', va='center',
-                                                      color='white', alpha=0.8, weight='bold')
-            else:
-                self.number_texts['2025'].set_alpha(0.8)
-        else:
-            if self.number_texts['2025'] is not None:
-                self.number_texts['2025'].set_alpha(0.0)
+        if show_2025 and self.number_texts['2025'] is None:
+            self.number_texts['2025'] = fig.text(0.5, 0.5, '2025', 
+                                                  fontsize=96, ha='center', va='center',
+                                                  color='white', alpha=0.8, weight='bold')
+        if self.number_texts['2025'] is not None:
+            self.number_texts['2025'].set_visible(show_2025)
 
 
 # Register the effect
@@ -8,8 +8,12 @@ import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation, FFMpegWriter
 from mpl_toolkits.mplot3d import Axes3D
 import argparse
+import io
+import multiprocessing
 import os
-import json
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     from tqdm import tqdm
@@ -18,14 +22,21 @@ except ImportError:
 
 # Import from new modular structure
 from core.heart_generator import generate_heart_points
-from core.figure_setup import setup_figure
+from core.figure_setup import setup_figure, frame_size
+from core.audio_sync import load_audio_features
+from core.vispy_renderer import VISPY_EFFECTS, VispyHeartRenderer, write_vispy_video
 from effects import get_effect_class, get_all_effect_names
 
 
+# Figure and update function of a render worker process, built once by
+# _init_render_worker
+_worker_scene = None
+
+
 def create_animation(resolution='medium', dpi=100, density='high', effect='A',
                     show_axes=False, show_formulas=False, fps=30, bitrate=5000, 
                     output_path='outputs/heart_animation.mp4', watermark='VUHUNG', 
-                    audio_features_path=None):
+                    audio_features_path=None, renderer='matplotlib', workers=1):
     """
     Create and save the 3D heart rotation animation.
     
@@ -40,7 +51,9 @@ def create_animation(resolution='medium', dpi=100, density='high', effect='A',
     - bitrate: Video bitrate in kbps (default: 5000)
     - output_path: Path to save the output video
     - watermark: Watermark text to display (default: 'VUHUNG', empty string for no watermark)
-    - audio_features_path: Path to JSON file with audio features (for H8sync)
+    - audio_features_path: Path to .npz or JSON file with audio features (for H8sync)
+    - renderer: 'matplotlib', or 'vispy' to render the single-heart effects (A-G, G1, G2, H1-H10) on the GPU
+    - workers: Number of processes rendering matplotlib frames in parallel (1 renders in this process)
     """
     # Calculate actual point count
     point_counts = {'lower': '~5,000', 'low': '10,000', 'medium': '22,500', 'high': '40,000'}
@@ -74,8 +87,7 @@ def create_animation(resolution='medium', dpi=100, density='high', effect='A',
     audio_features = None
     if audio_features_path and os.path.exists(audio_features_path):
         try:
-            with open(audio_features_path, 'r') as f:
-                audio_features = json.load(f)
+            audio_features = load_audio_features(audio_features_path)
             print(f"Loaded audio features: {len(audio_features.get('beat_times', []))} beats, {len(audio_features.get('onset_times', []))} onsets")
             if 'tempo_global' in audio_features:
                 print(f"  Global tempo: {audio_features['tempo_global']:.1f} BPM")
@@ -90,7 +102,101 @@ def create_animation(resolution='medium', dpi=100, density='high', effect='A',
     # Generate heart points
     x_original, y_original, z_original, colors = generate_heart_points(density=density)
     
+    if renderer == 'vispy':
+        if effect in VISPY_EFFECTS and not show_axes and not show_formulas:
+            render_with_vispy(x_original, y_original, z_original, colors, effect,
+                              resolution, fps, bitrate, output_path, watermark,
+                              audio_features)
+            return
+        print(f"Warning: the vispy renderer supports effects {', '.join(VISPY_EFFECTS)} "
+              f"without axes or formulas. Rendering with matplotlib instead.")
+    
     print(f"Setting up figure with resolution: {resolution}, DPI: {dpi}")
+    scene_args = (x_original, y_original, z_original, colors, effect, resolution, dpi,
+                  density, show_axes, show_formulas, fps, watermark, audio_features)
+    if workers > 1:
+        # Workers build their own figures; only the frame count is needed here
+        total_frames = get_effect_class(effect).count_frames(fps, audio_features)
+    else:
+        fig, update, total_frames = setup_scene(*scene_args)
+    
+    # Calculate duration text
+    duration_seconds = total_frames / fps
+    if duration_seconds < 60:
+        duration_text = f"{duration_seconds:.0f} seconds"
+    else:
+        minutes = int(duration_seconds // 60)
+        seconds = int(duration_seconds % 60)
+        duration_text = f"{minutes}m {seconds}s"
+    
+    print(f"Creating animation with {total_frames} frames ({duration_text} at {fps} fps)...")
+    print("This may take several minutes depending on your system...")
+    
+    if workers > 1:
+        render_in_parallel(scene_args, total_frames, workers, fps, bitrate, output_path)
+        print(f"Animation successfully saved to {output_path}")
+        return
+    
+    # Create progress bar (single line, auto-detect width)
+    if tqdm:
+        pbar = tqdm(total=total_frames, desc="Rendering video", unit="frame", ncols=None, leave=False)
+        
+        # Wrap update function to update progress bar
+        original_update = update
+        last_frame = [-1]  # Use list to allow modification in closure
+        def update_with_progress(frame):
+            result = original_update(frame)
+            # Update progress bar to current frame (only if frame advanced)
+            if frame > last_frame[0]:
+                pbar.n = frame + 1  # tqdm uses 1-based indexing
+                pbar.refresh()
+                last_frame[0] = frame
+            return result
+        
+        update_func = update_with_progress
+    else:
+        pbar = None
+        update_func = update
+    
+    # Create animation
+    anim = FuncAnimation(fig, update_func, frames=total_frames, 
+                        interval=1000/fps, blit=False)
+    
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    
+    # Save animation
+    if pbar:
+        pbar.set_description("Saving video file")
+    else:
+        print(f"Saving animation to {output_path}...")
+    writer = FFMpegWriter(fps=fps, bitrate=bitrate)
+    anim.save(output_path, writer=writer)
+    
+    # Close progress bar
+    if pbar:
+        pbar.close()
+    
+    print(f"Animation successfully saved to {output_path}")
+    plt.close(fig)
+
+
+def setup_scene(x_original, y_original, z_original, colors, effect, resolution, dpi,
+                density, show_axes, show_formulas, fps, watermark, audio_features):
+    """
+    Build the matplotlib figure, scatter plots and effect for one render.
+    
+    Parameters:
+    - x_original, y_original, z_original, colors: Heart points and color values
+    - effect, resolution, dpi, density, show_axes, show_formulas, fps, watermark:
+      As for create_animation
+    - audio_features: Loaded audio features dict or None
+    
+    Returns:
+    - fig: Matplotlib figure
+    - update: Function drawing a frame number onto the figure
+    - total_frames: Number of frames in the effect
+    """
     fig, ax = setup_figure(resolution, dpi, show_axes, show_formulas, watermark)
     
     # Generate additional hearts for multi-heart effects
@@ -159,7 +265,6 @@ def create_animation(resolution='medium', dpi=100, density='high', effect='A',
         print(f"Warning: Effect '{effect}' not found in registry. Using default simple rotation.")
         # Fallback: simple rotation
         total_frames = 900
-        duration_text = "30 seconds"
         
         def update(frame):
             t = frame / 900.0
@@ -265,65 +370,150 @@ def create_animation(resolution='medium', dpi=100, density='high', effect='A',
         total_frames = effect_instance.get_total_frames()
         effect_instance.total_frames = total_frames  # Update instance
         
-        # Calculate duration text
-        duration_seconds = total_frames / fps
-        if duration_seconds < 60:
-            duration_text = f"{duration_seconds:.0f} seconds"
-        else:
-            minutes = int(duration_seconds // 60)
-            seconds = int(duration_seconds % 60)
-            duration_text = f"{minutes}m {seconds}s"
-        
         # Create update function that delegates to effect
         def update(frame):
             result = effect_instance.update(frame)
             return result
     
-    print(f"Creating animation with {total_frames} frames ({duration_text} at {fps} fps)...")
-    print("This may take several minutes depending on your system...")
+    return fig, update, total_frames
+
+
+def _init_render_worker(scene_args):
+    """
+    Build this worker process's figure and effect.
     
-    # Create progress bar (single line, auto-detect width)
-    if tqdm:
-        pbar = tqdm(total=total_frames, desc="Rendering video", unit="frame", ncols=None, leave=False)
-        
-        # Wrap update function to update progress bar
-        original_update = update
-        last_frame = [-1]  # Use list to allow modification in closure
-        def update_with_progress(frame):
-            result = original_update(frame)
-            # Update progress bar to current frame (only if frame advanced)
-            if frame > last_frame[0]:
-                pbar.n = frame + 1  # tqdm uses 1-based indexing
-                pbar.refresh()
-                last_frame[0] = frame
-            return result
-        
-        update_func = update_with_progress
-    else:
-        pbar = None
-        update_func = update
+    Matplotlib figures cannot be shared between processes, so each worker
+    sets up its own scene once and then draws the frames it is given.
     
-    # Create animation
-    anim = FuncAnimation(fig, update_func, frames=total_frames, 
-                        interval=1000/fps, blit=False)
+    Parameters:
+    - scene_args: Arguments for setup_scene
+    """
+    global _worker_scene
+    fig, update, _ = setup_scene(*scene_args)
+    _worker_scene = (fig, update)
+
+
+def _render_worker_frame(frame):
+    """
+    Draw one frame in a worker process.
+    
+    Parameters:
+    - frame: Frame number
+    
+    Returns:
+    - Raw RGBA pixels, grabbed the way FFMpegWriter grabs them
+    """
+    fig, update = _worker_scene
+    update(frame)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='rgba', dpi=fig.dpi)
+    return buffer.getvalue()
+
+
+def render_in_parallel(scene_args, total_frames, workers, fps, bitrate, output_path):
+    """
+    Render an effect across worker processes and pipe the frames to ffmpeg.
+    
+    Every frame is a function of its frame number alone, so frames are
+    handed to whichever worker is free. They are written to ffmpeg's stdin
+    in order as raw pixels, with a bounded number in flight, so nothing is
+    staged on disk.
+    
+    Parameters:
+    - scene_args: Arguments for setup_scene
+    - total_frames: Number of frames to render
+    - workers: Number of worker processes
+    - fps, bitrate, output_path: As for create_animation
+    """
+    resolution, dpi = scene_args[5], scene_args[6]
+    width, height = frame_size(resolution, dpi)
+    pbar = tqdm(total=total_frames, desc="Rendering video", unit="frame", ncols=None, leave=False) if tqdm else None
     
-    # Ensure output directory exists
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    video = subprocess.Popen([
+        plt.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+        '-f', 'rawvideo', '-vcodec', 'rawvideo',
+        '-s', f"{width}x{height}", '-pix_fmt', 'rgba', '-framerate', str(fps),
+        '-i', '-',
+        '-c:v', plt.rcParams['animation.codec'], '-b:v', f"{bitrate}k",
+        '-pix_fmt', 'yuv420p', output_path
+    ], stdin=subprocess.PIPE)
+    try:
+        # Spawned workers start without the parent's matplotlib state
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_render_worker,
+            initargs=(scene_args,)
+        ) as pool:
+            # Bound the frames in flight; a 4K frame is ~33 MB
+            pending = deque()
+            
+            def write_next():
+                video.stdin.write(pending.popleft().result())
+                if pbar:
+                    pbar.update(1)
+            
+            for frame in range(total_frames):
+                pending.append(pool.submit(_render_worker_frame, frame))
+                if len(pending) >= 2 * workers:
+                    write_next()
+            while pending:
+                write_next()
+    finally:
+        video.stdin.close()
+        video.wait()
+        if pbar:
+            pbar.close()
+    if video.returncode:
+        raise subprocess.CalledProcessError(video.returncode, video.args)
+
+
+def render_with_vispy(x_original, y_original, z_original, colors, effect,
+                      resolution, fps, bitrate, output_path, watermark, audio_features):
+    """
+    Render an effect offscreen with vispy and encode it to a video.
     
-    # Save animation
-    if pbar:
-        pbar.set_description("Saving video file")
-    else:
-        print(f"Saving animation to {output_path}...")
-    writer = FFMpegWriter(fps=fps, bitrate=bitrate)
-    anim.save(output_path, writer=writer)
+    The effect drives vispy stand-ins for the scatter and axes, so the
+    point projection and rasterization run on the GPU.
     
-    # Close progress bar
-    if pbar:
-        pbar.close()
+    Parameters:
+    - x_original, y_original, z_original, colors: Heart points and color values
+    - effect: Effect name, one of VISPY_EFFECTS
+    - resolution, fps, bitrate, output_path, watermark: As for create_animation
+    - audio_features: Loaded audio features dict or None
+    """
+    print(f"Setting up vispy canvas with resolution: {resolution}")
+    heart = VispyHeartRenderer(x_original, y_original, z_original, colors,
+                               resolution=resolution, watermark=watermark)
+    
+    effect_instance = get_effect_class(effect)(
+        total_frames=0,  # Will be set by get_total_frames
+        fps=fps,
+        x_original=x_original,
+        y_original=y_original,
+        z_original=z_original,
+        scatter=heart.scatter,
+        ax=heart.ax,
+        audio_features=audio_features
+    )
+    total_frames = effect_instance.get_total_frames()
+    effect_instance.total_frames = total_frames
+    
+    print(f"Rendering {total_frames} frames with vispy...")
+    pbar = tqdm(total=total_frames, desc="Rendering video", unit="frame", ncols=None, leave=False) if tqdm else None
+    
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    try:
+        write_vispy_video(heart, effect_instance.update, total_frames, output_path,
+                          fps=fps, bitrate=bitrate,
+                          on_frame=(lambda frame: pbar.update(1)) if pbar else None)
+    finally:
+        if pbar:
+            pbar.close()
+        heart.close()
     
     print(f"Animation successfully saved to {output_path}")
-    plt.close(fig)
 
 
 def main():
@@ -376,6 +566,7 @@ Examples:
   python heart_animation.py --density low --effect G1 --output outputs/heart_journey.mp4
   python heart_animation.py --density lower --effect G2 --output outputs/epic_heart_story.mp4
   python heart_animation.py --resolution 4k --bitrate 20000 --effect G2 --output outputs/epic_4k.mp4
+  python heart_animation.py --effect H1 --workers 0 --output outputs/heart_genesis.mp4
         """
     )
     
@@ -412,7 +603,7 @@ Examples:
     parser.add_argument(
         '--audio-features',
         dest='audio_features',
-        help='Path to JSON file containing audio features (from analyze_audio.py). Required for H8sync effect.'
+        help='Path to .npz or JSON file containing audio features (from analyze_audio.py). Required for H8sync effect.'
     )
     
     parser.add_argument(
@@ -453,7 +644,23 @@ Examples:
         help='Watermark text to display at center of video (default: "VUHUNG"). Use --watermark "" to disable watermark.'
     )
     
+    parser.add_argument(
+        '--renderer',
+        choices=['matplotlib', 'vispy'],
+        default='matplotlib',
+        help='Renderer: matplotlib (default, all effects) or vispy (GPU, single-heart effects A-G, G1, G2, H1-H10; needs vispy and imageio-ffmpeg)'
+    )
+    
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=1,
+        help='Processes rendering matplotlib frames in parallel, each on its own range of frames (default: 1, 0 for one per CPU core)'
+    )
+    
     args = parser.parse_args()
+    if args.workers == 0:
+        args.workers = os.cpu_count() or 1
     
     print("=" * 60)
     print("3D Heart Animation Generator")
@@ -466,6 +673,8 @@ Examples:
     print(f"Show Axes: {args.axes}")
     print(f"Show Formulas: {args.formulas}")
     print(f"Watermark: {args.watermark if args.watermark else '(disabled)'}")
+    print(f"Renderer: {args.renderer}")
+    print(f"Workers: {args.workers}")
     print(f"Output: {args.output}")
     print("=" * 60)
     
@@ -481,7 +690,9 @@ Examples:
             bitrate=args.bitrate,
             output_path=args.output,
             watermark=args.watermark,
-            audio_features_path=args.audio_features
+            audio_features_path=args.audio_features,
+            renderer=args.renderer,
+            workers=args.workers
         )
     except Exception as e:
         print(f"Error: {e}")
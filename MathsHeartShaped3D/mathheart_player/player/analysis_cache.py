@@ -10,6 +10,8 @@ import logging
 import platform
 from pathlib import Path
 
+import numpy as np
+
 from mathheart_player.utils.logger import sanitize_path
 
 logger = logging.getLogger(__name__)
@@ -147,14 +149,22 @@ def save_to_cache(filepath, features):
         # Ensure cache directory exists
         cache_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Serialize before opening the file so a failure cannot leave a
+        # truncated cache behind; feature arrays are converted to lists in C
+        # by ndarray.tolist() rather than element by element
+        data = json.dumps({
+            key: value.tolist() if isinstance(value, np.ndarray) else value
+            for key, value in features.items()
+        }, indent=2)
+        
         # Save features to cache
         with open(cache_path, 'w') as f:
-            json.dump(features, f, indent=2)
+            f.write(data)
         
         cache_size_kb = cache_path.stat().st_size / 1024
         logger.debug(f"Cache saved: {cache_size_kb:.2f}KB to cache for {file_name}")
         return True
-    except (IOError, OSError) as e:
+    except (IOError, OSError, TypeError, ValueError) as e:
         logger.error(f"Cache save failed: {file_name} - {e}", exc_info=True)
         return False
 
@@ -17,6 +17,7 @@ if parent_dir not in sys.path:
 
 from analyze_audio import analyze_audio
 from core.audio_sync import (
+    AudioFeatureIndex,
     get_beat_intensity,
     get_onset_intensity,
     get_loudness_at_time,
@@ -41,6 +42,7 @@ class AudioAnalyzer:
         """
         self.current_file: Optional[str] = None
         self.features: Optional[Dict] = None
+        self.feature_index: Optional[AudioFeatureIndex] = None  # Arrays of self.features
         self.audio_data: Optional[np.ndarray] = None
         self.sample_rate: int = 22050
         self.progress_callback = progress_callback
@@ -70,7 +72,7 @@ class AudioAnalyzer:
             logger.debug(f"Checking cache for: {file_name}")
             cached_features = load_from_cache(filepath)
             if cached_features:
-                self.features = cached_features
+                self._set_features(cached_features)
                 logger.info(f"Cache hit: Loaded analysis from cache for {file_name}")
                 if self.progress_callback:
                     self.progress_callback("Loaded from cache", 1.0)
@@ -96,7 +98,7 @@ class AudioAnalyzer:
             # Run analysis (this will show progress with tqdm)
             # Note: tqdm progress bars work fine in background threads
             # as long as we're using the callback for UI updates
-            self.features = analyze_audio(filepath, temp_output)
+            self._set_features(analyze_audio(filepath, temp_output))
             
             # Log analysis results
             if self.features:
@@ -128,9 +130,22 @@ class AudioAnalyzer:
             logger.error(f"Error during audio analysis: {file_name} - {e}", exc_info=True)
             if self.progress_callback:
                 self.progress_callback(f"Analysis failed: {e}", 0.0)
-            self.features = None
+            self._set_features(None)
             return False
     
+    def _set_features(self, features: Optional[Dict]):
+        """
+        Store analyzed features and index their arrays for playback lookups.
+        
+        The cache stores features as lists; converting them once here keeps
+        get_features_at_time from rebuilding arrays on every tick.
+        
+        Parameters:
+            features: Features dict from analyze_audio or the cache, or None
+        """
+        self.features = features
+        self.feature_index = AudioFeatureIndex.from_features(features) if features is not None else None
+    
     def get_features_at_time(self, current_time: float) -> Dict[str, float]:
         """
         Get audio features at current playback time.
@@ -157,22 +172,13 @@ class AudioAnalyzer:
                 'tempo': 120.0
             }
         
-        # Extract feature arrays
-        beat_times = self.features.get('beat_times', [])
-        onset_times = self.features.get('onset_times', [])
-        rms_times = self.features.get('rms_times', [])
-        rms_values = self.features.get('rms_values', [])
-        bass_times = self.features.get('bass_times', [])
-        bass_values = self.features.get('bass_values', [])
-        tempo_times = self.features.get('tempo_times', [])
-        tempo_values = self.features.get('tempo_values', [])
-        
-        # Query features using existing functions
-        beat_intensity = get_beat_intensity(current_time, beat_times, window=0.1)
-        onset_intensity = get_onset_intensity(current_time, onset_times, window=0.15)
-        loudness = get_loudness_at_time(current_time, rms_times, rms_values)
-        bass = get_bass_at_time(current_time, bass_times, bass_values)
-        tempo = get_tempo_at_time(current_time, tempo_times, tempo_values)
+        # Query the feature arrays indexed when the features were loaded
+        index = self.feature_index
+        beat_intensity = get_beat_intensity(current_time, index.beat_times, window=0.1)
+        onset_intensity = get_onset_intensity(current_time, index.onset_times, window=0.15)
+        loudness = get_loudness_at_time(current_time, index.rms_times, index.rms_values)
+        bass = get_bass_at_time(current_time, index.bass_times, index.bass_values)
+        tempo = get_tempo_at_time(current_time, index.tempo_times, index.tempo_values)
         
         return {
             'beat_intensity': beat_intensity,
@@ -205,6 +211,6 @@ class AudioAnalyzer:
     def clear(self):
         """Clear current analysis data."""
         self.current_file = None
-        self.features = None
+        self._set_features(None)
         self.audio_data = None
 
@@ -8,11 +8,16 @@ import sys
 import subprocess
 import tempfile
 import shutil
+import io
+
+import matplotlib.pyplot as plt
+import numpy as np
 
 # Add parent directory to path to import heart_animation
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from heart_animation import create_animation
+from heart_animation import create_animation, render_in_parallel, setup_scene
+from core.heart_generator import generate_heart_points
 
 
 class TestHeartAnimation:
@@ -109,6 +114,78 @@ class TestHeartAnimation:
         #   3. Verify total frames match expected duration
         #   4. For H8sync, test with and without audio features
         pass
+    
+    def test_case_4_parallel_workers(self, temp_output_dir):
+        """
+        Test Case 4: Effect A rendered by two worker processes.
+        
+        Each worker renders half of a short clip to PNG files, which ffmpeg
+        then encodes into a single video. Every decoded frame must match
+        the same frame rendered serially in this process, and no other.
+        """
+        output_path = os.path.join(temp_output_dir, "test_effect_a_workers.mp4")
+        num_frames = 6
+        
+        x, y, z, colors = generate_heart_points(density='lower')
+        scene_args = (x, y, z, colors, 'A', 'small', 100, 'lower',
+                      False, False, 30, '', None)
+        render_in_parallel(scene_args, num_frames, 2, 30, 20000, output_path)
+        
+        # Frames rendered serially, grabbed the way FFMpegWriter grabs them
+        fig, update, _ = setup_scene(*scene_args)
+        width, height = fig.canvas.get_width_height()
+        expected = []
+        for frame in range(num_frames):
+            update(frame)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='rgba', dpi=fig.dpi)
+            rgba = np.frombuffer(buffer.getvalue(), dtype=np.uint8).reshape(height, width, 4)
+            expected.append(rgba[:, :, :3].astype(np.float32))
+        plt.close(fig)
+        
+        decoded = subprocess.run([
+            plt.rcParams['animation.ffmpeg_path'], '-loglevel', 'error', '-i', output_path,
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-'
+        ], check=True, capture_output=True).stdout
+        frames = np.frombuffer(decoded, dtype=np.uint8).reshape(-1, height, width, 3)
+        assert len(frames) == num_frames, f"Expected {num_frames} frames, decoded {len(frames)}"
+        
+        for frame, pixels in enumerate(frames):
+            errors = [np.abs(pixels - reference).mean() for reference in expected]
+            assert int(np.argmin(errors)) == frame, \
+                f"Decoded frame {frame} best matches serial frame {np.argmin(errors)}: {errors}"
+            assert errors[frame] < 1.0, f"Decoded frame {frame} differs from serial render: {errors[frame]}"
+
+    
+    def test_case_5_i3_numbers_depend_on_frame_only(self):
+        """
+        Test Case 5: Effect I3 shows the same numbers however a frame is reached.
+        
+        Parallel workers start mid-animation, so a frame updated directly
+        must show the same overlay as one reached by updating in order.
+        """
+        x, y, z, colors = generate_heart_points(density='lower')
+        scene_args = (x, y, z, colors, 'I3', 'small', 100, 'lower',
+                      False, False, 30, '', None)
+        
+        def shown_numbers(fig):
+            return sorted(text.get_text() for text in fig.texts if text.get_visible())
+        
+        fig, update, total_frames = setup_scene(*scene_args)
+        frames = [int(total_frames * q) for q in (0.2, 0.25, 0.6, 0.8, 0.85, 0.95)]
+        in_order = []
+        for frame in frames:
+            update(frame)
+            in_order.append(shown_numbers(fig))
+        plt.close(fig)
+        
+        for frame, expected in zip(frames, in_order):
+            fig, update, _ = setup_scene(*scene_args)
+            update(frame)
+            assert shown_numbers(fig) == expected, \
+                f"Frame {frame} shows {shown_numbers(fig)} directly but {expected} in order"
+            plt.close(fig)
+        assert ['11'] in in_order and ['16'] in in_order and ['2025'] in in_order
 
 
 if __name__ == "__main__":